@@ -0,0 +1,319 @@
+"""Micro-benchmarks for the ARC4 codecs in `_algopy_testing.arc4`.
+
+Measures encode, decode, index and mutate throughput for each ARC4 type family and
+compares the results against a committed baseline, e.g.
+
+    python scripts/benchmark_arc4.py                     # run and compare to the baseline
+    python scripts/benchmark_arc4.py --filter array      # only cases containing "array"
+    python scripts/benchmark_arc4.py --output out.json   # also write the results
+    python scripts/benchmark_arc4.py --update-baseline   # record a new baseline
+
+Timings are normalised against a pure python calibration loop before being compared, so a
+baseline recorded on one machine remains usable on another. The exit code is non-zero if
+any case is slower than the baseline by more than the given tolerance, 50% by default; a
+larger `--tolerance` may be needed on a heavily loaded machine. The baseline should be
+re-recorded by any change that makes a case faster, so that later regressions are caught.
+
+Encoded values are read from `_value` rather than `.bytes`, as the larger arrays exceed the
+AVM's maximum bytes length.
+"""
+
+import argparse
+import json
+import platform
+import re
+import sys
+import timeit
+import typing
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from _algopy_testing import arc4
+
+BASELINE_PATH = Path(__file__).parent / "benchmark_arc4_baseline.json"
+ARRAY_SIZES = (16, 256, 4096)
+DEFAULT_TOLERANCE = 0.5
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.05
+
+UInt64Array: typing.TypeAlias = arc4.DynamicArray[arc4.UInt64]
+BoolArray: typing.TypeAlias = arc4.DynamicArray[arc4.Bool]
+StringArray: typing.TypeAlias = arc4.DynamicArray[arc4.String]
+UFixed64x2: typing.TypeAlias = arc4.UFixedNxM[typing.Literal[64], typing.Literal[2]]
+Inner: typing.TypeAlias = arc4.Tuple[arc4.UInt64, arc4.Bool, arc4.Bool, arc4.String]
+Outer: typing.TypeAlias = arc4.Tuple[
+    arc4.UInt64, Inner, arc4.DynamicArray[arc4.UInt64], arc4.String
+]
+
+
+class Point(arc4.Struct):
+    x: arc4.UInt64
+    y: arc4.UInt64
+    flag: arc4.Bool
+    label: arc4.String
+    tags: arc4.DynamicArray[arc4.String]
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    stmt: Callable[[], object]
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_ns: float
+    result_ns: float
+    ratio: float
+
+    @property
+    def regressed(self) -> bool:
+        return self.ratio > 1
+
+
+def _cases() -> Iterator[Case]:
+    yield from _uint_cases()
+    yield from _ufixed_cases()
+    yield from _string_cases()
+    yield from _dynamic_bytes_cases()
+    yield from _tuple_cases()
+    yield from _struct_cases()
+    for size in ARRAY_SIZES:
+        yield from _static_array_cases(size)
+        yield from _dynamic_array_cases(size)
+        yield from _bool_array_cases(size)
+        yield from _string_array_cases(size)
+
+
+def _uint_cases() -> Iterator[Case]:
+    uint8 = bytes(arc4.UInt8(42)._value)
+    uint64 = bytes(arc4.UInt64(42)._value)
+    uint512 = bytes(arc4.UInt512(42)._value)
+    yield Case("uint8/encode", lambda: arc4.UInt8(42)._value)
+    yield Case("uint8/decode", lambda: arc4.UInt8.from_bytes(uint8).as_uint64())
+    yield Case("uint64/encode", lambda: arc4.UInt64(42)._value)
+    yield Case("uint64/decode", lambda: arc4.UInt64.from_bytes(uint64).as_uint64())
+    yield Case("uint512/encode", lambda: arc4.UInt512(42)._value)
+    yield Case("uint512/decode", lambda: arc4.UInt512.from_bytes(uint512).as_biguint())
+
+
+def _ufixed_cases() -> Iterator[Case]:
+    encoded = bytes(UFixed64x2("1.23")._value)
+    yield Case("ufixed64x2/encode", lambda: UFixed64x2("1.23")._value)
+    yield Case("ufixed64x2/decode", lambda: UFixed64x2.from_bytes(encoded)._value)
+
+
+def _string_cases() -> Iterator[Case]:
+    value = "hello world " * 8
+    encoded = bytes(arc4.String(value)._value)
+    yield Case("string/encode", lambda: arc4.String(value)._value)
+    yield Case("string/decode", lambda: arc4.String.from_bytes(encoded).native)
+
+
+def _dynamic_bytes_cases() -> Iterator[Case]:
+    value = bytes(range(256))
+    encoded = bytes(arc4.DynamicBytes(value)._value)
+    yield Case("byte[]/encode", lambda: arc4.DynamicBytes(value)._value)
+    yield Case("byte[]/decode", lambda: arc4.DynamicBytes.from_bytes(encoded).native)
+
+
+def _tuple_cases() -> Iterator[Case]:
+    def build() -> Outer:
+        inner = Inner((arc4.UInt64(1), arc4.Bool(True), arc4.Bool(False), arc4.String("inner")))
+        return Outer(
+            (arc4.UInt64(2), inner, UInt64Array(*map(arc4.UInt64, range(8))), arc4.String("x"))
+        )
+
+    encoded = bytes(build()._value)
+    value: Outer = Outer.from_bytes(encoded)
+    yield Case("tuple/encode", lambda: build()._value)
+    yield Case("tuple/decode", lambda: Outer.from_bytes(encoded).native)
+    yield Case("tuple/index", lambda: value[1][3])
+
+
+def _struct_cases() -> Iterator[Case]:
+    def build() -> Point:
+        tags = StringArray(arc4.String("a"), arc4.String("b"))
+        return Point(arc4.UInt64(1), arc4.UInt64(2), arc4.Bool(True), arc4.String("p"), tags)
+
+    encoded = bytes(build()._value)
+    value = Point.from_bytes(encoded)
+    new_label = arc4.String("a longer label")
+    yield Case("struct/encode", lambda: build()._value)
+    yield Case("struct/decode", lambda: Point.from_bytes(encoded)._as_tuple)
+    yield Case("struct/index", lambda: value.label)
+    yield Case("struct/mutate", lambda: setattr(value, "label", new_label))
+
+
+def _static_array_cases(size: int) -> Iterator[Case]:
+    typ = arc4.StaticArray[arc4.UInt64, typing.Literal[size]]  # type: ignore[valid-type]
+    ints = list(range(size))
+    items = [arc4.UInt64(i) for i in ints]
+    encoded = bytes(typ(*items)._value)
+    value = typ.from_bytes(encoded)
+    middle = size // 2
+    item = arc4.UInt64(7)
+    prefix = f"uint64[{size}]"
+    yield Case(f"{prefix}/encode", lambda: typ(*items)._value)
+    yield Case(f"{prefix}/encode_ints", lambda: typ.from_ints(ints)._value)
+    yield Case(f"{prefix}/decode", lambda: list(typ.from_bytes(encoded)))
+    yield Case(f"{prefix}/decode_ints", lambda: typ.from_bytes(encoded).to_ints())
+    yield Case(f"{prefix}/index", lambda: value[middle])
+    yield Case(f"{prefix}/mutate", lambda: value.__setitem__(middle, item))
+
+
+def _dynamic_array_cases(size: int) -> Iterator[Case]:
+    ints = list(range(size))
+    items = [arc4.UInt64(i) for i in ints]
+    encoded = bytes(UInt64Array(*items)._value)
+    value = UInt64Array.from_bytes(encoded)
+    middle = size // 2
+    item = arc4.UInt64(7)
+    prefix = f"uint64[]:{size}"
+
+    def append_pop() -> None:
+        value.append(item)
+        value.pop()
+
+    yield Case(f"{prefix}/encode", lambda: UInt64Array(*items)._value)
+    yield Case(f"{prefix}/encode_ints", lambda: UInt64Array.from_ints(ints)._value)
+    yield Case(f"{prefix}/decode", lambda: list(UInt64Array.from_bytes(encoded)))
+    yield Case(f"{prefix}/decode_ints", lambda: UInt64Array.from_bytes(encoded).to_ints())
+    yield Case(f"{prefix}/index", lambda: value[middle])
+    yield Case(f"{prefix}/mutate", lambda: value.__setitem__(middle, item))
+    yield Case(f"{prefix}/append_pop", append_pop)
+
+
+def _bool_array_cases(size: int) -> Iterator[Case]:
+    bits = [i % 3 == 0 for i in range(size)]
+    items = [arc4.Bool(b) for b in bits]
+    encoded = bytes(BoolArray(*items)._value)
+    value = BoolArray.from_bytes(encoded)
+    middle = size // 2
+    item = arc4.Bool(True)
+    prefix = f"bool[]:{size}"
+    yield Case(f"{prefix}/encode", lambda: BoolArray(*items)._value)
+    yield Case(f"{prefix}/encode_bits", lambda: BoolArray.from_bits(bits)._value)
+    yield Case(f"{prefix}/decode", lambda: list(BoolArray.from_bytes(encoded)))
+    yield Case(f"{prefix}/decode_bits", lambda: BoolArray.from_bytes(encoded).to_bits())
+    yield Case(f"{prefix}/index", lambda: value[middle])
+    yield Case(f"{prefix}/mutate", lambda: value.__setitem__(middle, item))
+
+
+def _string_array_cases(size: int) -> Iterator[Case]:
+    items = [arc4.String(f"item {i}") for i in range(size)]
+    encoded = bytes(StringArray(*items)._value)
+    value = StringArray.from_bytes(encoded)
+    middle = size // 2
+    item = arc4.String("replacement")
+    prefix = f"string[]:{size}"
+    yield Case(f"{prefix}/encode", lambda: StringArray(*items)._value)
+    yield Case(f"{prefix}/decode", lambda: list(StringArray.from_bytes(encoded)))
+    yield Case(f"{prefix}/index", lambda: value[middle])
+    yield Case(f"{prefix}/mutate", lambda: value.__setitem__(middle, item))
+
+
+def _calibrate() -> Case:
+    values = list(range(64))
+
+    def stmt() -> object:
+        return b"".join(v.to_bytes(8, "big") for v in values)
+
+    return Case("calibration", stmt)
+
+
+def measure(case: Case, *, repeat: int, min_time: float) -> float:
+    """Return the best observed time of a single call to `case.stmt`, in nanoseconds."""
+    timer = timeit.Timer(case.stmt)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    best = min([elapsed, *timer.repeat(repeat=repeat - 1, number=number)])
+    return best * 1e9 / number
+
+
+def run(*, pattern: str | None, repeat: int, min_time: float) -> dict[str, typing.Any]:
+    calibration = measure(_calibrate(), repeat=repeat, min_time=min_time)
+    results = {}
+    for case in _cases():
+        if pattern and not re.search(pattern, case.name):
+            continue
+        results[case.name] = round(measure(case, repeat=repeat, min_time=min_time), 1)
+        print(f"{case.name:<32} {results[case.name]:>14,.1f} ns")
+    # calibrate either side of the run to smooth out changes in machine load
+    calibration = min(calibration, measure(_calibrate(), repeat=repeat, min_time=min_time))
+    return {
+        "python": platform.python_version(),
+        "calibration_ns": round(calibration, 1),
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, typing.Any], current: dict[str, typing.Any], *, tolerance: float
+) -> list[Comparison]:
+    """Compare calibrated timings, a ratio above 1 means slower than the tolerance
+    allows."""
+    scale = baseline["calibration_ns"] / current["calibration_ns"]
+    comparisons = []
+    for name, result_ns in current["results"].items():
+        try:
+            baseline_ns = baseline["results"][name]
+        except KeyError:
+            continue
+        ratio = result_ns * scale / (baseline_ns * (1 + tolerance))
+        comparisons.append(Comparison(name, baseline_ns, result_ns, ratio))
+    return comparisons
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", help="only run cases whose name matches this regex")
+    parser.add_argument("--output", type=Path, help="write the results as JSON to this path")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="write the results to the baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed slowdown relative to the baseline, as a fraction",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=DEFAULT_MIN_TIME,
+        help="minimum duration of each timing run, in seconds",
+    )
+    args = parser.parse_args(argv)
+
+    current = run(pattern=args.filter, repeat=args.repeat, min_time=args.min_time)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2) + "\n")
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"no baseline found at {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = [c for c in compare(baseline, current, tolerance=args.tolerance) if c.regressed]
+    for c in regressions:
+        print(f"REGRESSION {c.name}: {c.baseline_ns:,.1f} ns -> {c.result_ns:,.1f} ns")
+    if regressions:
+        return 1
+    print("no regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import array
 import dataclasses
 import decimal
 import functools
+import operator
+import sys
 import types
 import typing
+from collections.abc import Buffer
 
 from algokit_utils.common import ZERO_ADDRESS, public_key_from_address
 from Cryptodome.Hash import SHA512
@@ -79,6 +83,8 @@ __all__ = [
 ]
 
 _ABI_LENGTH_SIZE = 2
+# decoded ints up to this value share a single instance per type
+_MAX_INTERNED_INT = 255
 _TBitSize = typing.TypeVar("_TBitSize", bound=int)
 
 _P = typing.ParamSpec("_P")
@@ -136,13 +142,29 @@ def _check_is_arc4(items: Sequence[typing.Any]) -> Sequence[_ABIEncoded]:
 
 class _ABIEncoded(BytesBacked):
     _type_info: _TypeInfo
+    # containers decoded from a larger value hold a read-only memoryview of it
     _value: bytes
 
     @classmethod
-    def from_bytes(cls, value: algopy.Bytes | bytes, /) -> typing.Self:
-        """Construct an instance from the underlying bytes (no validation)"""
+    def from_bytes(cls, value: algopy.Bytes | bytes | bytearray | memoryview, /) -> typing.Self:
+        """Construct an instance from the underlying bytes (no validation)
+
+        Read-only memoryviews are not copied by container types, so nested values can
+        be decoded from a window of their parent's encoding
+        """
+        raw = _as_readonly(value)
+        if not issubclass(cls, MutableBytes):
+            return cls._from_trusted(bytes(raw))
         instance = cls()
-        instance._value = value.value if isinstance(value, Bytes) else value
+        instance._value = raw
+        return instance
+
+    @classmethod
+    def _from_trusted(cls, value: bytes, /) -> typing.Self:
+        """Construct an immutable instance from an encoding already known to be valid,
+        without the validation done by `__init__`"""
+        instance = cls.__new__(cls)
+        instance._value = value
         return instance
 
     @classmethod
@@ -158,7 +180,7 @@ class _ABIEncoded(BytesBacked):
         """Get the underlying Bytes."""
         import algopy
 
-        return algopy.Bytes(self._value)
+        return algopy.Bytes(bytes(self._value))
 
     def validate(self) -> None:
         pass
@@ -187,10 +209,14 @@ def arc4_signature(signature: str | Callable[_P, _R], /) -> algopy.Bytes:
             raise ValueError("signature not found")
         method_signature = arc4_signature
 
-    hashed_signature = SHA512.new(truncate="256")
-    hashed_signature.update(method_signature.encode("utf-8"))
-    return_value = hashed_signature.digest()[:4]
-    return algopy.Bytes(return_value)
+    return algopy.Bytes(_method_selector(method_signature))
+
+
+@functools.cache
+def _method_selector(signature: str) -> bytes:
+    """Return the 4 byte ARC4 selector of a method or event signature, each signature is
+    only hashed once."""
+    return SHA512.new(signature.encode("utf-8"), truncate="256").digest()[:4]
 
 
 class _StringTypeInfo(_TypeInfo):
@@ -271,14 +297,25 @@ class _UIntTypeInfo(_TypeInfo):
         self.max_int = 2**self.bit_size - 1
         self.max_bytes_len = self.bit_size // BITS_IN_BYTE
 
-    @property
+    @functools.cached_property
     def typ(self) -> type:
         return parameterize_type(self._type, get_type_generic_from_int_literal(self.bit_size))
 
-    @property
+    @functools.cached_property
     def arc4_name(self) -> str:
         return f"uint{self.bit_size}"
 
+    @functools.cached_property
+    def interned(self) -> dict[bytes, _ABIEncoded]:
+        """Shared instances of the smallest values, used when decoding."""
+        typ = self.typ
+        assert issubclass(typ, _ABIEncoded), "expected ARC4 type"
+        values = range(min(self.max_int, _MAX_INTERNED_INT) + 1)
+        return {
+            encoded: typ._from_trusted(encoded)
+            for encoded in (i.to_bytes(self.max_bytes_len) for i in values)
+        }
+
 
 # https://stackoverflow.com/a/75395800
 class _UIntNMeta(type(_ABIEncoded), typing.Generic[_TBitSize]):  # type: ignore[misc]
@@ -425,7 +462,7 @@ class _UFixedTypeInfo(_UIntTypeInfo):
         super().__init__(size)
         self.precision = precision
 
-    @property
+    @functools.cached_property
     def typ(self) -> type:
         return parameterize_type(
             _UFixedNxM,
@@ -433,7 +470,7 @@ class _UFixedTypeInfo(_UIntTypeInfo):
             get_type_generic_from_int_literal(self.precision),
         )
 
-    @property
+    @functools.cached_property
     def arc4_name(self) -> str:
         return f"ufixed{self.bit_size}x{self.precision}"
 
@@ -553,6 +590,14 @@ class _BoolTypeInfo(_TypeInfo):
     def arc4_name(self) -> str:
         return "bool"
 
+    @functools.cached_property
+    def interned(self) -> dict[bytes, _ABIEncoded]:
+        """Shared instances of both values, used when decoding."""
+        return {
+            encoded: Bool._from_trusted(encoded)
+            for encoded in (Bool._true_byte_value, Bool._false_byte_value)
+        }
+
 
 class Bool(_ABIEncoded):
     """An ARC4 encoded bool."""
@@ -600,20 +645,24 @@ class _StaticArrayTypeInfo(_TypeInfo):
         self.item_type = item_type
         self.size = size
 
-    @property
+    @functools.cached_property
     def typ(self) -> type:
         return parameterize_type(
             StaticArray, self.item_type.typ, get_type_generic_from_int_literal(self.size)
         )
 
-    @property
+    @functools.cached_property
     def arc4_name(self) -> str:
         return f"{self.item_type.arc4_name}[{self.size}]"
 
-    @property
+    @functools.cached_property
     def is_dynamic(self) -> bool:
         return self.item_type.is_dynamic
 
+    @functools.cached_property
+    def codec(self) -> _ArrayCodec:
+        return _ArrayCodec(self.item_type)
+
 
 class _StaticArrayMeta(type(_ABIEncoded), typing.Generic[_TArrayItem, _TArrayLength]):  # type: ignore  # noqa: PGH003
     __concrete__: typing.ClassVar[dict[tuple[type, type], type]] = {}
@@ -673,16 +722,52 @@ class StaticArray(
                     f"item must be of type {self._type_info.item_type!r}, not {item._type_info!r}"
                 )
 
-        item_list = list(items)
-        self._value = _encode(item_list)
+        self._value = self._type_info.codec.encode(items)
+
+    @classmethod
+    def from_ints(cls, values: Iterable[int], /) -> typing.Self:
+        """Construct an array of ARC4 integers directly from ints, without creating each
+        item.
+
+        `values` can also be a buffer of unsigned integers e.g. an `array.array` or a NumPy
+        array
+        """
+        length, encoded = cls._type_info.codec.encode_ints(values)
+        if length != cls._type_info.size:
+            raise TypeError(f"expected {cls._type_info.size} items, not {length}")
+        return cls.from_bytes(encoded)
+
+    def to_ints(self) -> list[int]:
+        """Return the items of an array of ARC4 integers as ints."""
+        return self._type_info.codec.decode_ints(self._value, self._type_info.size)
+
+    @classmethod
+    def from_bits(cls, bits: int | bytes | Iterable[bool], /) -> typing.Self:
+        """Construct an array of ARC4 Bools directly from bits, without creating each
+        item.
+
+        `bits` can be an int where item `i` is bit `i`, packed bytes where the first item is
+        the most significant bit of the first byte, or an iterable of bools
+        """
+        length, encoded = cls._type_info.codec.encode_bits(bits, cls._type_info.size)
+        if length != cls._type_info.size:
+            raise TypeError(f"expected {cls._type_info.size} items, not {length}")
+        return cls.from_bytes(encoded)
+
+    def to_bits(self) -> int:
+        """Return the items of an array of ARC4 Bools as an int where item `i` is bit
+        `i`."""
+        return self._type_info.codec.decode_bits(self._value, self._type_info.size)
 
     def __iter__(self) -> Iterator[_TArrayItem]:
         # """Returns an iterator for the items in the array"""
-        return iter(self._list())
+        size = self._type_info.size
+        return self._type_info.codec.iter_items(self._value, size, range(size))
 
     def __reversed__(self) -> Iterator[_TArrayItem]:
         # """Returns an iterator for the items in the array, in reverse order"""
-        return reversed(self._list())
+        size = self._type_info.size
+        return self._type_info.codec.iter_items(self._value, size, reversed(range(size)))
 
     @property
     def length(self) -> algopy.UInt64:
@@ -692,7 +777,9 @@ class StaticArray(
         return algopy.UInt64(self._type_info.size)
 
     def __getitem__(self, index: algopy.UInt64 | int) -> _TArrayItem:
-        value = self._list()[index]
+        size = self._type_info.size
+        index = _item_index(index, size)
+        value: _TArrayItem = self._type_info.codec.decode_item(self._value, size, index)
         return set_item_on_mutate(self, index, value)
 
     def __setitem__(self, index: algopy.UInt64 | int, item: _TArrayItem) -> _TArrayItem:
@@ -700,13 +787,15 @@ class StaticArray(
             raise TypeError(
                 f"item must be of type {self._type_info.item_type!r}, not {item._type_info!r}"
             )
-        x = self._list()
-        x[index] = item
-        self._value = _encode(x)
+        size = self._type_info.size
+        index = _item_index(index, size)
+        buffer = bytearray(self._value)
+        self._type_info.codec.replace(buffer, size, index, item)
+        self._value = bytes(buffer)
         return item
 
     def _list(self) -> list[_TArrayItem]:
-        return _decode_tuple_items(self._value, [self._type_info.item_type] * self._type_info.size)
+        return self._type_info.codec.decode(self._value, self._type_info.size)
 
     def __str__(self) -> str:
         items = map(str, self._list())
@@ -750,12 +839,17 @@ class _AddressTypeInfo(_StaticArrayTypeInfo):
         return "address"
 
 
+_ZERO_ADDRESS_BYTES: bytes = public_key_from_address(ZERO_ADDRESS)
+
+
 class Address(StaticArray[Byte, typing.Literal[32]]):
     _type_info = _AddressTypeInfo()
 
     def __init__(self, value: Account | str | algopy.Bytes = ZERO_ADDRESS):
         super().__init__()
-        if isinstance(value, str):
+        if value == ZERO_ADDRESS:
+            bytes_value = _ZERO_ADDRESS_BYTES
+        elif isinstance(value, str):
             try:
                 bytes_value = public_key_from_address(value)
             except Exception as e:
@@ -775,8 +869,7 @@ class Address(StaticArray[Byte, typing.Literal[32]]):
 
     def __bool__(self) -> bool:
         # """Returns `True` if not equal to the zero address"""
-        zero_bytes: bytes = public_key_from_address(ZERO_ADDRESS)
-        return self.bytes != zero_bytes
+        return self._value != _ZERO_ADDRESS_BYTES
 
     def __eq__(self, other: Address | Account | str) -> bool:  # type: ignore[override]
         """Address equality is determined by the address of another `arc4.Address`,
@@ -802,11 +895,11 @@ class _DynamicArrayTypeInfo(_TypeInfo):
     def __init__(self, item_type: _TypeInfo) -> None:
         self.item_type = item_type
 
-    @property
+    @functools.cached_property
     def typ(self) -> type:
         return parameterize_type(DynamicArray, self.item_type.typ)
 
-    @property
+    @functools.cached_property
     def arc4_name(self) -> str:
         return f"{self.item_type.arc4_name}[]"
 
@@ -814,6 +907,10 @@ class _DynamicArrayTypeInfo(_TypeInfo):
     def is_dynamic(self) -> bool:
         return True
 
+    @functools.cached_property
+    def codec(self) -> _ArrayCodec:
+        return _ArrayCodec(self.item_type)
+
 
 class _DynamicArrayMeta(type(_ABIEncoded), typing.Generic[_TArrayItem]):  # type: ignore[misc]
     __concrete__: typing.ClassVar[dict[type, type]] = {}
@@ -838,6 +935,10 @@ class DynamicArray(  # TODO: inherit from StaticArray?
     """A dynamically sized ARC4 Array of the specified type."""
 
     _type_info: _DynamicArrayTypeInfo
+    # the encoding is kept in a growable buffer, so items can be added and removed in place,
+    # the buffer is only created when the array is first modified
+    _buffer: bytearray | None
+    _encoded: bytes | None
 
     def __new__(cls, *items: _TArrayItem) -> typing.Self:
         try:
@@ -862,23 +963,98 @@ class DynamicArray(  # TODO: inherit from StaticArray?
         item_list = list(items)
         self._value = self._encode_with_length(item_list)
 
+    @classmethod
+    def from_ints(cls, values: Iterable[int], /) -> typing.Self:
+        """Construct an array of ARC4 integers directly from ints, without creating each
+        item.
+
+        `values` can also be a buffer of unsigned integers e.g. an `array.array` or a NumPy
+        array
+        """
+        length, encoded = cls._type_info.codec.encode_ints(values)
+        return cls.from_bytes(_encode_length(length) + encoded)
+
+    def to_ints(self) -> list[int]:
+        """Return the items of an array of ARC4 integers as ints."""
+        length, data = _read_length(self._value)
+        return self._type_info.codec.decode_ints(data, length)
+
+    @classmethod
+    def from_bits(
+        cls, bits: int | bytes | Iterable[bool], /, length: int | None = None
+    ) -> typing.Self:
+        """Construct an array of ARC4 Bools directly from bits, without creating each
+        item.
+
+        `bits` can be an int where item `i` is bit `i`, packed bytes where the first item is
+        the most significant bit of the first byte, or an iterable of bools. `length`
+        defaults to the bit length of an int, or all the bits of packed bytes
+        """
+        length, encoded = cls._type_info.codec.encode_bits(bits, length)
+        return cls.from_bytes(_encode_length(length) + encoded)
+
+    def to_bits(self) -> int:
+        """Return the items of an array of ARC4 Bools as an int where item `i` is bit
+        `i`."""
+        length, data = _read_length(self._value)
+        return self._type_info.codec.decode_bits(data, length)
+
+    @property
+    def _value(self) -> bytes:
+        if self._encoded is None:
+            assert self._buffer is not None
+            self._encoded = bytes(self._buffer)
+        return self._encoded
+
+    @_value.setter
+    def _value(self, value: bytes) -> None:
+        self._encoded = value
+        self._buffer = None
+        self._notify_mutated()
+
+    def _data(self) -> bytes | bytearray:
+        if self._encoded is not None:
+            return self._encoded
+        assert self._buffer is not None
+        return self._buffer
+
+    def _mutable_buffer(self) -> bytearray:
+        if self._buffer is None:
+            self._buffer = bytearray(self._value)
+        return self._buffer
+
+    def _buffer_mutated(self, length: int) -> None:
+        self._mutable_buffer()[:_ABI_LENGTH_SIZE] = _encode_length(length)
+        self._encoded = None
+        self._notify_mutated()
+
     def __iter__(self) -> typing.Iterator[_TArrayItem]:
         """Returns an iterator for the items in the array."""
-        return iter(self._list())
+        length = self._length()
+        return self._type_info.codec.iter_items(
+            self._value, length, range(length), offset=_ABI_LENGTH_SIZE
+        )
 
     def __reversed__(self) -> typing.Iterator[_TArrayItem]:
         """Returns an iterator for the items in the array, in reverse order."""
-        return reversed(self._list())
+        length = self._length()
+        return self._type_info.codec.iter_items(
+            self._value, length, reversed(range(length)), offset=_ABI_LENGTH_SIZE
+        )
 
     @property
     def length(self) -> algopy.UInt64:
         """Returns the current length of the array."""
         import algopy
 
-        return algopy.UInt64(len(self._list()))
+        return algopy.UInt64(self._length())
 
     def __getitem__(self, index: algopy.UInt64 | int) -> _TArrayItem:
-        value = self._list()[index]
+        length = self._length()
+        index = _item_index(index, length)
+        value: _TArrayItem = self._type_info.codec.decode_item(
+            self._data(), length, index, offset=_ABI_LENGTH_SIZE
+        )
         return set_item_on_mutate(self, index, value)
 
     def __setitem__(self, index: algopy.UInt64 | int, item: _TArrayItem) -> _TArrayItem:
@@ -886,9 +1062,12 @@ class DynamicArray(  # TODO: inherit from StaticArray?
             raise TypeError(
                 f"item must be of type {self._type_info.item_type!r}, not {item._type_info!r}"
             )
-        x = self._list()
-        x[index] = item
-        self._value = self._encode_with_length(x)
+        length = self._length()
+        index = _item_index(index, length)
+        self._type_info.codec.replace(
+            self._mutable_buffer(), length, index, item, offset=_ABI_LENGTH_SIZE
+        )
+        self._buffer_mutated(length)
         return item
 
     def append(self, item: _TArrayItem, /) -> None:
@@ -897,23 +1076,28 @@ class DynamicArray(  # TODO: inherit from StaticArray?
             raise TypeError(
                 f"item must be of type {self._type_info.item_type!r}, not {item._type_info!r}"
             )
-        x = self._list()
-        x.append(item)
-        self._value = self._encode_with_length(x)
+        length = self._length()
+        self._type_info.codec.extend(
+            self._mutable_buffer(), length, [item], offset=_ABI_LENGTH_SIZE
+        )
+        self._buffer_mutated(length + 1)
 
     def extend(self, other: Iterable[_TArrayItem], /) -> None:
         """Extend this array with the contents of another array."""
+        items = list(other)
         incorrect_types = [
-            o._type_info for o in other if o._type_info != self._type_info.item_type
+            o._type_info for o in items if o._type_info != self._type_info.item_type
         ]
         if incorrect_types:
             other_types_str = ", ".join(sorted(set(map(str, incorrect_types))))
             raise TypeError(
                 f"items must be of type {self._type_info.item_type!r}: {other_types_str}"
             )
-        x = self._list()
-        x.extend(other)
-        self._value = self._encode_with_length(x)
+        length = self._length()
+        self._type_info.codec.extend(
+            self._mutable_buffer(), length, items, offset=_ABI_LENGTH_SIZE
+        )
+        self._buffer_mutated(length + len(items))
 
     def __add__(self, other: Iterable[_TArrayItem]) -> typing.Self:
         self.extend(other)
@@ -921,21 +1105,28 @@ class DynamicArray(  # TODO: inherit from StaticArray?
 
     def pop(self) -> _TArrayItem:
         """Remove and return the last item in the array."""
-        x = self._list()
-        item = x.pop()
-        self._value = self._encode_with_length(x)
+        length = self._length()
+        if not length:
+            raise IndexError("pop from empty array")
+        item: _TArrayItem = self._type_info.codec.pop(
+            self._mutable_buffer(), length, offset=_ABI_LENGTH_SIZE
+        )
+        self._buffer_mutated(length - 1)
         return item
 
     def __bool__(self) -> bool:
         """Returns `True` if not an empty array."""
-        return bool(self._list())
+        return self._length() > 0
+
+    def _length(self) -> int:
+        return _read_offset(self._data(), 0)
 
     def _list(self) -> list[_TArrayItem]:
         length, data = _read_length(self._value)
-        return _decode_tuple_items(data, [self._type_info.item_type] * length)
+        return self._type_info.codec.decode(data, length)
 
     def _encode_with_length(self, items: Sequence[_ABIEncoded]) -> bytes:
-        return _encode_length(len(items)) + _encode(items)
+        return _encode_length(len(items)) + self._type_info.codec.encode(items)
 
     def __str__(self) -> str:
         items = map(str, self._list())
@@ -987,24 +1178,28 @@ class DynamicBytes(DynamicArray[Byte]):
     def __init__(self, value: algopy.Bytes | bytes, /): ...
 
     def __init__(self, *value: algopy.Bytes | bytes | Byte | UInt8 | int):
-        items = []
+        super().__init__()
+        # bytes are encoded directly, rather than creating a Byte for each one
+        encoded = bytearray()
         for x in value:
             match x:
                 case Bytes() | bytes():
                     if len(value) > 1:
                         raise ValueError("expected single Bytes value")
-                    items.extend([Byte(b) for b in as_bytes(x)])
+                    encoded += as_bytes(x)
                 case UIntN(_type_info=_UIntTypeInfo(bit_size=8)) as uint:
-                    items.append(Byte(as_int(uint.as_uint64(), max=2**8)))
+                    encoded += uint._value
                 case int(int_value):
-                    items.append(Byte(int_value))
+                    encoded.append(as_int(int_value, max=Byte._type_info.max_int))
                 case _:
                     raise TypeError("expected algopy.Bytes | bytes | Byte | UInt8 | int")
-        super().__init__(*items)
+        self._value = _encode_length(len(encoded)) + encoded
 
     @property
     def native(self) -> algopy.Bytes:
-        return self.bytes[_ABI_LENGTH_SIZE:]
+        import algopy
+
+        return algopy.Bytes(bytes(self._value[_ABI_LENGTH_SIZE:]))
 
     def __str__(self) -> str:
         return str(self.native)
@@ -1020,24 +1215,31 @@ class _TupleTypeInfo(_TypeInfo):
     def __init__(self, child_types: list[_TypeInfo]) -> None:
         self.child_types = child_types
 
-    @property
+    @functools.cached_property
     def typ(self) -> type:
         return parameterize_type(Tuple, *(t.typ for t in self.child_types))
 
-    @property
+    @functools.cached_property
     def arc4_name(self) -> str:
         inner_name = ",".join([t.arc4_name for t in self.child_types])
         return f"({inner_name})"
 
-    @property
+    @functools.cached_property
     def is_dynamic(self) -> bool:
         return any(t.is_dynamic for t in self.child_types)
 
+    @functools.cached_property
+    def codec(self) -> _TupleCodec:
+        return _TupleCodec(self.child_types)
+
 
 class _TupleMeta(type(_ABIEncoded), typing.Generic[typing.Unpack[_TTuple]]):  # type: ignore  # noqa: PGH003
     __concrete__: typing.ClassVar[dict[tuple, type]] = {}  # type: ignore[type-arg]
 
     def __getitem__(cls, key_t: tuple[type[_ABIEncoded], ...]) -> type:
+        # a single type parameter, e.g. from parameterize_type, is a tuple of one type
+        if not isinstance(key_t, tuple):
+            key_t = (key_t,)
         cache = cls.__concrete__
         if c := cache.get(key_t, None):
             return c
@@ -1083,27 +1285,38 @@ class Tuple(
                     raise TypeError(
                         f"item must be of type {self._type_info!r}, not {item_type_info!r}"
                     )
-        self._value = _encode(items)
+        self._value = self._type_info.codec.encode(items) if items else b""
 
     def __bool__(self) -> bool:
+        # a tuple is only falsy if it has no (valid) value
+        if not self._value:
+            return False
         try:
-            return bool(self.native)
+            self._type_info.codec.check_size(self._value)
         except ValueError:
             return False
+        return True
 
     def __len__(self) -> int:
-        return len(self.native)
+        return len(self._type_info.child_types)
 
     def __getitem__(self, index: int) -> object:  # type: ignore[override]
-        value = self.native[index]
-
-        # can't mutate tuple, but can re-encode underlying _value
-        def _set_value(updated_value: object) -> None:
-            items = self.native
-            new_items = items[:index] + (updated_value, items[index + 1 :])
-            self._value = _encode(new_items)
-
-        return add_mutable_callback(_set_value, value)
+        if isinstance(index, slice):
+            return self.native[index]
+        length = len(self)
+        index = operator.index(index)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("tuple index out of range")
+        value = self._type_info.codec.decode_item(self._value, index)
+        # can't mutate tuple, but can re-encode the item within the underlying _value
+        return add_mutable_callback(lambda updated: self._item_mutated(index, updated), value)
+
+    def _item_mutated(self, index: int, value: _ABIEncoded) -> None:
+        buffer = bytearray(self._value)
+        self._type_info.codec.replace(buffer, index, value)
+        self._value = bytes(buffer)
 
     def __iter__(self) -> typing.Iterator[_ABIEncoded]:
         return iter(self.native)  # type: ignore[arg-type]
@@ -1112,7 +1325,7 @@ class Tuple(
     def native(self) -> tuple[typing.Unpack[_TTuple]]:
         return typing.cast(
             "tuple[typing.Unpack[_TTuple]]",
-            tuple(_decode_tuple_items(self._value, self._type_info.child_types)),
+            tuple(self._type_info.codec.decode(self._value)),
         )
 
     def __str__(self) -> str:
@@ -1127,25 +1340,30 @@ class _StructTypeInfo(_TypeInfo):
         self.struct_type = struct_type
         self.fields = dataclasses.fields(struct_type)
         self.field_names = [field.name for field in self.fields]
+        self.field_indexes = {name: index for index, name in enumerate(self.field_names)}
         self.frozen = frozen
 
     @property
     def typ(self) -> type:
         return self.struct_type
 
-    @property
+    @functools.cached_property
     def child_types(self) -> list[_TypeInfo]:
         return _tuple_type_from_struct(self.struct_type)._type_info.child_types
 
-    @property
+    @functools.cached_property
     def arc4_name(self) -> str:
         inner_name = ",".join([t.arc4_name for t in self.child_types])
         return f"({inner_name})"
 
-    @property
+    @functools.cached_property
     def is_dynamic(self) -> bool:
         return any(t.is_dynamic for t in self.child_types)
 
+    @functools.cached_property
+    def codec(self) -> _TupleCodec:
+        return _TupleCodec(self.child_types)
+
 
 @typing.dataclass_transform(
     eq_default=False, order_default=False, kw_only_default=False, field_specifiers=()
@@ -1210,39 +1428,81 @@ class Struct(MutableBytes, _ABIEncoded, metaclass=_StructMeta):
 
     def __getattribute__(self, name: str) -> typing.Any:
         value = super().__getattribute__(name)
-        return add_mutable_callback(lambda _: self._update_backing_value(), value)
+        return add_mutable_callback(lambda updated: self._field_mutated(name, updated), value)
 
     def __setattr__(self, key: str, value: typing.Any) -> None:
-        super().__setattr__(key, value)
         # don't update backing value until base class has been init'd
-        if hasattr(self, "_on_mutate") and key in self._type_info.field_names:
+        if hasattr(self, "_on_mutate") and key in self._type_info.field_indexes:
             if self._type_info.frozen:
                 raise dataclasses.FrozenInstanceError(
                     f"{type(self)} is frozen and cannot be modified"
                 )
-            self._update_backing_value()
+            # the value is checked before it is stored, so a failed assignment leaves the
+            # struct unchanged
+            index, arc4_value = self._encode_field(key, value)
+            super().__setattr__(key, value)
+            self._replace_field(index, arc4_value)
+        else:
+            super().__setattr__(key, value)
+
+    def _field_mutated(self, name: str, value: typing.Any) -> None:
+        # ignore mutations of a value that has since been replaced in this struct
+        if name in self._type_info.field_indexes and super().__getattribute__(name) is value:
+            self._update_field(name, value)
+            # re-register the callback, so later mutations of a held reference are also
+            # spliced into the encoding of this struct
+            add_mutable_callback(lambda updated: self._field_mutated(name, updated), value)
 
     def _update_backing_value(self) -> None:
         self._value = self._as_tuple._value
 
+    def _update_field(self, name: str, value: typing.Any) -> None:
+        self._replace_field(*self._encode_field(name, value))
+
+    def _encode_field(self, name: str, value: typing.Any) -> tuple[int, _ABIEncoded]:
+        index = self._type_info.field_indexes[name]
+        arc4_value = _encode_to_arc4(value)
+        expected_type = self._type_info.codec.child_types[index]
+        if arc4_value._type_info != expected_type:
+            raise TypeError(
+                f"item must be of type {expected_type!r}, not {arc4_value._type_info!r}"
+            )
+        return index, arc4_value
+
+    def _replace_field(self, index: int, arc4_value: _ABIEncoded) -> None:
+        # only the encoding of the updated field is replaced, the other fields are unchanged
+        buffer = bytearray(self._value)
+        self._type_info.codec.replace(buffer, index, arc4_value)
+        self._value = bytes(buffer)
+
     @classmethod
-    def from_bytes(cls, value: algopy.Bytes | bytes, /) -> typing.Self:
-        tuple_type = _tuple_type_from_struct(cls)
-        tuple_value = tuple_type.from_bytes(value)
-        if not tuple_value:
-            return typing.cast("typing.Self", tuple_value)
-        # convert each decoded ARC-4 item to the declared field type (ARC-4
-        # annotations pass through, native annotations go through arc4_to_native)
-        items = [
-            _to_native_type(field.type, arc4_item)
-            for arc4_item, field in zip(tuple_value.native, cls._type_info.fields, strict=True)
-        ]
-        return cls(*items)
+    def from_bytes(cls, value: algopy.Bytes | bytes | bytearray | memoryview, /) -> typing.Self:
+        raw = _as_readonly(value)
+        try:
+            arc4_items = cls._type_info.codec.decode(raw)
+        except ValueError:
+            arc4_items = []
+        if not arc4_items:
+            # undecodable values are returned as a (falsy) tuple
+            tuple_type = _tuple_type_from_struct(cls)
+            return typing.cast("typing.Self", tuple_type.from_bytes(raw))
+        # the fields are set directly rather than via __init__, as the encoding is already
+        # known and doesn't need to be recomputed
+        instance = cls.__new__(cls)
+        for arc4_item, field in zip(arc4_items, cls._type_info.fields, strict=True):
+            # convert each decoded ARC-4 item to the declared field type (ARC-4
+            # annotations pass through, native annotations go through arc4_to_native)
+            object.__setattr__(instance, field.name, _to_native_type(field.type, arc4_item))
+        MutableBytes.__init__(instance)
+        instance._value = raw  # type: ignore[assignment]
+        return instance
 
     @property
     def bytes(self) -> algopy.Bytes:
         """Get the underlying bytes[]"""
-        return self._as_tuple.bytes
+        import algopy
+
+        return algopy.Bytes(bytes(self._value))
 
     @property
     def _as_tuple(self) -> Tuple:  # type: ignore[type-arg]
@@ -1307,8 +1567,7 @@ def emit(event: str | Struct, /, *args: object) -> None:
     else:
         raise TypeError("expected str or Struct for event")
 
-    event_hash = SHA512.new(event_str.encode(), truncate="256").digest()
-    log(event_hash[:4] + event_data.value)
+    log(_method_selector(event_str) + event_data.value)
 
 
 def encode(value: object, /) -> algopy.Bytes:
@@ -1320,12 +1579,12 @@ _TDecode = typing.TypeVar("_TDecode")
 
 def decode(
     typ: type[_TDecode],
-    value: algopy.Bytes | bytes,
+    value: algopy.Bytes | bytes | bytearray | memoryview,
     /,
     *,
     validate: typing.Literal[True, False] = True,
 ) -> _TDecode:
-    raw = value.value if isinstance(value, Bytes) else value
+    raw = _as_readonly(value)
 
     if isinstance(typ, type) and issubclass(typ, _ABIEncoded):
         arc4_value = typ.from_bytes(raw)
@@ -1340,6 +1599,82 @@ def decode(
     return serializer.arc4_to_native(arc4_value)  # type: ignore[no-any-return]
 
 
+def iter_decode(
+    typ: type[_TDecode],
+    buffer: algopy.Bytes | bytes | bytearray | memoryview,
+    /,
+    *,
+    prefix: algopy.Bytes | bytes = b"",
+    validate: typing.Literal[True, False] = True,
+) -> Iterator[_TDecode]:
+    """Decode consecutive ARC4 encoded values of `typ` from `buffer`, one at a time.
+
+    Each value can be preceded by `prefix` e.g. the selector of a logged event, which is
+    checked and skipped
+    """
+    if isinstance(typ, type) and issubclass(typ, _ABIEncoded):
+        arc4_type: type[_ABIEncoded] = typ
+        arc4_to_native = None
+    else:
+        serializer = get_native_to_arc4_serializer(typ)
+        arc4_type = serializer.arc4_type
+        arc4_to_native = serializer.arc4_to_native
+
+    view = memoryview(_as_readonly(buffer))
+    prefix_bytes = as_bytes(prefix)
+    position = 0
+    while position < len(view):
+        if prefix_bytes:
+            if view[position : position + len(prefix_bytes)] != prefix_bytes:
+                raise ValueError(f"expected prefix {prefix_bytes!r} at position {position}")
+            position += len(prefix_bytes)
+        end = position + _encoded_len(arc4_type._type_info, view, position)
+        if end > len(view):
+            raise ValueError(
+                f"input string is not long enough to be decoded: {bytes(view[position:])!r}"
+            )
+        if end == position and not prefix_bytes:
+            raise ValueError(f"cannot decode a sequence of empty {arc4_type._type_info!r} values")
+        arc4_value = arc4_type.from_bytes(view[position:end])
+        if validate:
+            arc4_value.validate()
+        yield typing.cast(
+            "_TDecode", arc4_value if arc4_to_native is None else arc4_to_native(arc4_value)
+        )
+        position = end
+
+
+def _encoded_len(type_info: _TypeInfo, value: memoryview, start: int) -> int:
+    """Return the length of the encoded `type_info` value that starts at `start`."""
+    if isinstance(type_info, _BoolTypeInfo):
+        return 1
+    static_size = get_max_bytes_static_len(type_info)
+    if static_size is not None:
+        return static_size
+    elif isinstance(type_info, _StringTypeInfo):
+        return _ABI_LENGTH_SIZE + _read_offset(value, start)
+    elif isinstance(type_info, _StaticArrayTypeInfo | _DynamicArrayTypeInfo):
+        codec = type_info.codec
+        if isinstance(type_info, _StaticArrayTypeInfo):
+            length = type_info.size
+            head = start
+        else:
+            length = _read_offset(value, start)
+            head = start + _ABI_LENGTH_SIZE
+        if not (codec.is_dynamic and length):
+            return head - start + codec.head_size(length)
+        # the encoding ends with the tail of the last item
+        last = head + _read_offset(value, head + (length - 1) * _ABI_LENGTH_SIZE)
+        return last - start + _encoded_len(codec.item_type, value, last)
+    elif isinstance(type_info, _TupleTypeInfo | _StructTypeInfo):
+        tuple_codec = type_info.codec
+        # the encoding ends with the tail of the last dynamic child
+        last_head = tuple_codec.dynamic_heads[-1]
+        last = start + _read_offset(value, start + last_head.offset)
+        return last - start + _encoded_len(tuple_codec.child_types[last_head.index], value, last)
+    raise TypeError(f"cannot determine the encoded length of {type_info!r}")
+
+
 def _cast_arg_as_arc4(arg: object) -> _ABIEncoded:
     if isinstance(arg, int) and not isinstance(arg, bool):
         return UInt64(arg) if arg <= MAX_UINT64 else UInt512(arg)
@@ -1350,42 +1685,6 @@ def _cast_arg_as_arc4(arg: object) -> _ABIEncoded:
     return native_to_arc4(arg)
 
 
-def _find_bool(
-    values: (
-        StaticArray[typing.Any, typing.Any]
-        | DynamicArray[typing.Any]
-        | Tuple[typing.Any]
-        | tuple[typing.Any, ...]
-        | list[typing.Any]
-    ),
-    index: int,
-    delta: int,
-) -> int:
-    """Helper function to find consecutive booleans from current index in a tuple."""
-    until = 0
-    is_looking_forward = delta > 0
-    is_looking_backward = delta < 0
-    values_length = len(values) if isinstance(values, tuple | list) else values.length.value
-    if isinstance(values, (StaticArray | DynamicArray | list)):
-        return 0 if is_looking_backward else values_length - index - 1
-
-    while True:
-        curr = index + delta * until
-        is_curr_at_end = curr == values_length - 1
-        is_curr_at_start = curr == 0
-        if isinstance(values[curr], Bool):
-            if (is_looking_forward and not is_curr_at_end) or (
-                is_looking_backward and not is_curr_at_start
-            ):
-                until += 1
-            else:
-                break
-        else:
-            until -= 1
-            break
-    return until
-
-
 def _find_bool_types(
     values: typing.Sequence[_TypeInfo], index: int, delta: int, *, is_homogeneous: bool = False
 ) -> int:
@@ -1413,19 +1712,6 @@ def _find_bool_types(
     return until
 
 
-def _compress_multiple_bool(value_list: list[Bool]) -> int:
-    """Compress consecutive boolean values into a byte for a Tuple/Array."""
-    result = 0
-    if len(value_list) > 8:
-        raise ValueError("length of list should not be greater than 8")
-    for i, value in enumerate(value_list):
-        assert isinstance(value, Bool)
-        bool_val = value.native
-        if bool_val:
-            result |= 1 << (7 - i)
-    return result
-
-
 def get_max_bytes_static_len(type_info: _TypeInfo) -> int | None:
     return _get_max_bytes_len_impl(type_info, static_size_only=True)
 
@@ -1434,6 +1720,7 @@ def _get_max_bytes_len(type_info: _TypeInfo) -> int:
     return _get_max_bytes_len_impl(type_info) or 0
 
 
+@functools.cache
 def _get_max_bytes_len_impl(type_info: _TypeInfo, *, static_size_only: bool = False) -> int | None:
     size = 0
     if isinstance(type_info, _DynamicArrayTypeInfo):
@@ -1471,168 +1758,580 @@ def _get_max_bytes_len_impl(type_info: _TypeInfo, *, static_size_only: bool = Fa
     return size
 
 
-def _encode(  # noqa: PLR0912
-    values: (
-        StaticArray[typing.Any, typing.Any]
-        | DynamicArray[typing.Any]
-        | Tuple[typing.Any]
-        | Struct
-        | Sequence[typing.Any]
-    ),
-) -> bytes:
-    heads = []
-    tails = []
-    is_dynamic_index = []
-    i = 0
-    if isinstance(values, Struct):
-        values = values._as_tuple
-    match values:
-        case (StaticArray() | DynamicArray()) as has_length:
-            values_length = has_length.length.value
-        case tuple() | list() as can_len:
-            values_length = len(can_len)
-        case _:
-            raise TypeError("expected sized type")
-    values_length_bytes = (
-        _encode_length(values_length) if isinstance(values, DynamicArray) else b""
-    )
-    while i < values_length:
-        value = values[i]
-        assert isinstance(value, _ABIEncoded), "expected ARC4 value"
-        is_dynamic_index.append(value._type_info.is_dynamic)
-        if is_dynamic_index[-1]:
-            heads.append(b"\x00\x00")
-            assert isinstance(
-                value, StaticArray | DynamicArray | Tuple | String | Struct
-            ), f"expected dynamic type: {value}"
-            tail_encoding = value.bytes.value if isinstance(value, String) else _encode(value)
-            tails.append(tail_encoding)
-        else:
-            if isinstance(value, Bool):
-                before = _find_bool(values, i, -1)
-                after = _find_bool(values, i, 1)
-
-                # Pack bytes to heads and tails
-                if before % 8 != 0:
-                    raise ValueError(
-                        "expected before index should have number of bool mod 8 equal 0"
-                    )
+@dataclasses.dataclass(frozen=True)
+class _StaticHead:
+    """A static child, encoded in place within the head."""
+
+    index: int
+    offset: int
+    size: int
+
+
+@dataclasses.dataclass(frozen=True)
+class _BoolHead:
+    """Up to 8 consecutive bool children, packed into a single head byte."""
+
+    index: int
+    count: int
+    offset: int
 
-                after = min(7, after)
-                consecutive_bool_list = [values[i] for i in range(i, i + after + 1)]
-                compressed_int = _compress_multiple_bool(consecutive_bool_list)
-                heads.append(bytes([compressed_int]))
-                i += after
-            else:
-                heads.append(value.bytes.value)
-            tails.append(b"")
-        i += 1
-
-    # Adjust heads for dynamic types
-    head_length = 0
-    for head_element in heads:
-        # If the element is not a placeholder, append the length of the element
-        head_length += len(head_element)
-
-    # Correctly encode dynamic types and replace placeholder
-    tail_curr_length = 0
-    for i in range(len(heads)):
-        if is_dynamic_index[i]:
-            head_value = as_int16(head_length + tail_curr_length)
-            heads[i] = int_to_bytes(head_value, _ABI_LENGTH_SIZE)
-
-        tail_curr_length += len(tails[i])
-
-    # Concatenate bytes
-    return values_length_bytes + b"".join(heads) + b"".join(tails)
-
-
-def _decode_tuple_items(  # noqa: PLR0912, PLR0915
-    value: bytes, child_types: list[_TypeInfo]
-) -> list[typing.Any]:
-    dynamic_segments: list[list[int]] = []  # Store the start and end of a dynamic element
-    value_partitions: list[bytes] = []
-    i = 0
-    array_index = 0
 
-    is_homogeneous_child_types = len(set(child_types)) == 1
+@dataclasses.dataclass(frozen=True)
+class _DynamicHead:
+    """A dynamic child, the head contains the offset of its tail."""
 
+    index: int
+    offset: int
+
+
+_Head: typing.TypeAlias = _StaticHead | _BoolHead | _DynamicHead
+
+
+def _plan_heads(child_types: Sequence[_TypeInfo]) -> list[_Head]:
+    heads: list[_Head] = []
+    offset = 0
+    i = 0
     while i < len(child_types):
         child_type = child_types[i]
         if child_type.is_dynamic:
-            # Decode the size of the dynamic element
-            dynamic_index = int.from_bytes(value[array_index : array_index + _ABI_LENGTH_SIZE])
-            if dynamic_segments:
-                dynamic_segments[-1][1] = dynamic_index
-
-            # Since we do not know where the current dynamic element ends,
-            # put a placeholder and update later
-            dynamic_segments.append([dynamic_index, -1])
-            value_partitions.append(b"")
-            array_index += _ABI_LENGTH_SIZE
+            heads.append(_DynamicHead(index=i, offset=offset))
+            offset += _ABI_LENGTH_SIZE
+            i += 1
         elif isinstance(child_type, _BoolTypeInfo):
-            before = _find_bool_types(
-                child_types, index=i, delta=-1, is_homogeneous=is_homogeneous_child_types
-            )
-            after = _find_bool_types(
-                child_types, index=i, delta=1, is_homogeneous=is_homogeneous_child_types
+            count = 1
+            while (
+                count < BITS_IN_BYTE
+                and i + count < len(child_types)
+                and isinstance(child_types[i + count], _BoolTypeInfo)
+            ):
+                count += 1
+            heads.append(_BoolHead(index=i, count=count, offset=offset))
+            offset += 1
+            i += count
+        else:
+            size = _get_max_bytes_len(child_type)
+            heads.append(_StaticHead(index=i, offset=offset, size=size))
+            offset += size
+            i += 1
+    return heads
+
+
+def _head_end(head: _Head) -> int:
+    if isinstance(head, _StaticHead):
+        return head.offset + head.size
+    elif isinstance(head, _BoolHead):
+        return head.offset + 1
+    else:
+        return head.offset + _ABI_LENGTH_SIZE
+
+
+class _TupleCodec:
+    """Encode/decode plan for a fixed sequence of ARC4 types (tuples and structs).
+
+    The head layout, bool packing and child decoders are computed once per type.
+    """
+
+    def __init__(self, child_types: Sequence[_TypeInfo]) -> None:
+        self.child_types = tuple(child_types)
+        self.heads = _plan_heads(self.child_types)
+        self.head_size = _head_end(self.heads[-1]) if self.heads else 0
+        self.dynamic_heads = [h for h in self.heads if isinstance(h, _DynamicHead)]
+        # the dynamic head that follows each dynamic head, its offset is the end of the tail
+        self._next_dynamic_heads = dict[int, _DynamicHead | None]()
+        for position, dynamic_head in enumerate(self.dynamic_heads, start=1):
+            following = self.dynamic_heads[position : position + 1]
+            self._next_dynamic_heads[dynamic_head.index] = following[0] if following else None
+        # decoding fails if the value ends before the head of the final child is reached
+        self._min_size = _head_end(self.heads[-2]) if len(self.heads) > 1 else None
+        self._decoders = [_decoder_for(t) for t in self.child_types]
+        # the head containing each child, bools share a head with their neighbours
+        self._child_heads: list[_Head] = []
+        for head in self.heads:
+            count = head.count if isinstance(head, _BoolHead) else 1
+            self._child_heads.extend([head] * count)
+
+    def encode(self, values: Sequence[typing.Any]) -> bytes:
+        return self.encode_children([_encoded(value) for value in values])
+
+    def encode_children(self, children: Sequence[bytes | memoryview]) -> bytes:
+        """Encode from the encoding of each child, where each bool is encoded as a single
+        byte."""
+        heads = []
+        tail_positions = []
+        for head in self.heads:
+            if isinstance(head, _StaticHead):
+                heads.append(children[head.index])
+            elif isinstance(head, _BoolHead):
+                heads.append(_pack_bools(children[head.index : head.index + head.count]))
+            else:
+                tail_positions.append(len(heads))
+                heads.append(b"")
+        if not tail_positions:
+            return b"".join(heads)
+
+        tails = []
+        offset = sum(map(len, heads)) + _ABI_LENGTH_SIZE * len(tail_positions)
+        for position, head in zip(tail_positions, self.dynamic_heads, strict=True):
+            tail = children[head.index]
+            heads[position] = _encode_offset(offset)
+            tails.append(tail)
+            offset += len(tail)
+        return b"".join(heads) + b"".join(tails)
+
+    def check_size(self, value: bytes | bytearray | memoryview) -> None:
+        if self._min_size is not None and len(value) <= self._min_size:
+            raise ValueError(f"input string is not long enough to be decoded: {bytes(value)!r}")
+        if not self.dynamic_heads and self.head_size < len(value):
+            raise ValueError(f"input string was not fully consumed: {bytes(value)!r}")
+
+    def decode(self, value: bytes | memoryview) -> list[typing.Any]:
+        children = self.decode_children(value)
+        return [decoder(child) for decoder, child in zip(self._decoders, children, strict=True)]
+
+    def decode_children(self, value: bytes | memoryview) -> list[bytes | memoryview]:
+        """Split a value into the encoding of each child, where each bool is decoded as a
+        single byte."""
+        self.check_size(value)
+        value = memoryview(value)
+        children: list[bytes | memoryview] = [b""] * len(self.child_types)
+        for head in self.heads:
+            if isinstance(head, _StaticHead):
+                children[head.index] = value[head.offset : head.offset + head.size]
+            elif isinstance(head, _BoolHead):
+                bits = value[head.offset]
+                for bool_i in range(head.count):
+                    children[head.index + bool_i] = _unpack_bool(bits, bool_i)
+
+        if self.dynamic_heads:
+            starts = [_read_offset(value, head.offset) for head in self.dynamic_heads]
+            ends = [*starts[1:], len(value)]
+            for head, start, end in zip(self.dynamic_heads, starts, ends, strict=True):
+                children[head.index] = value[start:end]
+        return children
+
+    def decode_item(self, value: bytes | bytearray | memoryview, index: int) -> typing.Any:
+        """Decode only the child at `index`."""
+        self.check_size(value)
+        value = memoryview(value)
+        decoder = self._decoders[index]
+        head = self._child_heads[index]
+        if isinstance(head, _StaticHead):
+            return decoder(value[head.offset : head.offset + head.size])
+        elif isinstance(head, _BoolHead):
+            return decoder(_unpack_bool(value[head.offset], index - head.index))
+        start, end = self._tail_bounds(value, head)
+        return decoder(value[start:end])
+
+    def _tail_bounds(
+        self, value: bytes | bytearray | memoryview, head: _DynamicHead
+    ) -> tuple[int, int]:
+        following = self._next_dynamic_heads[head.index]
+        start = _read_offset(value, head.offset)
+        end = _read_offset(value, following.offset) if following else len(value)
+        return start, end
+
+    def replace(self, buffer: bytearray, index: int, item: typing.Any) -> None:
+        """Replace the encoding of the child at `index` in place."""
+        head = self._child_heads[index]
+        if isinstance(head, _StaticHead):
+            buffer[head.offset : head.offset + head.size] = _encoded(item)
+        elif isinstance(head, _BoolHead):
+            mask = 0x80 >> (index - head.index)
+            if _encoded(item) == Bool._true_byte_value:
+                buffer[head.offset] |= mask
+            else:
+                buffer[head.offset] &= ~mask & 0xFF
+        else:
+            position = self.dynamic_heads.index(head)
+            following = self.dynamic_heads[position + 1 :]
+            start, end = self._tail_bounds(buffer, head)
+            tail = _encoded(item)
+            buffer[start:end] = tail
+            delta = len(tail) - (end - start)
+            if delta:
+                for later in following:
+                    shifted = _encode_offset(_read_offset(buffer, later.offset) + delta)
+                    buffer[later.offset : later.offset + _ABI_LENGTH_SIZE] = shifted
+
+
+class _ArrayCodec:
+    """Encode/decode plan for a homogeneous sequence of ARC4 items (static and dynamic
+    arrays).
+
+    The item size, bool packing and item decoder are computed once per item type.
+    """
+
+    def __init__(self, item_type: _TypeInfo) -> None:
+        self.item_type = item_type
+        self.is_bool = isinstance(item_type, _BoolTypeInfo)
+        self.is_dynamic = item_type.is_dynamic
+        if self.is_bool:
+            self.head_item_size = 1
+        elif self.is_dynamic:
+            self.head_item_size = _ABI_LENGTH_SIZE
+        else:
+            self.head_item_size = _get_max_bytes_len(item_type)
+        self._decoder = _decoder_for(item_type)
+
+    def head_size(self, length: int) -> int:
+        return self._head_items(length) * self.head_item_size
+
+    def _head_items(self, length: int) -> int:
+        if self.is_bool:
+            return (length + BITS_IN_BYTE - 1) // BITS_IN_BYTE
+        return length
+
+    def encode(self, items: Sequence[typing.Any]) -> bytes:
+        return self.encode_children([_encoded(item) for item in items])
+
+    def encode_children(self, encoded: Sequence[bytes | memoryview]) -> bytes:
+        """Encode from the encoding of each item, where each bool is encoded as a single
+        byte."""
+        if self.is_bool:
+            return b"".join(
+                _pack_bools(encoded[i : i + BITS_IN_BYTE])
+                for i in range(0, len(encoded), BITS_IN_BYTE)
             )
+        if not self.is_dynamic:
+            return b"".join(encoded)
+
+        heads = []
+        offset = _ABI_LENGTH_SIZE * len(encoded)
+        for tail in encoded:
+            heads.append(_encode_offset(offset))
+            offset += len(tail)
+        return b"".join(heads) + b"".join(encoded)
+
+    def decode(self, value: bytes | memoryview, length: int) -> list[typing.Any]:
+        decoder = self._decoder
+        return [decoder(child) for child in self.decode_children(value, length)]
+
+    def decode_children(
+        self, value: bytes | memoryview, length: int
+    ) -> Sequence[bytes | memoryview]:
+        """Split a value into the encoding of each item, where each bool is decoded as a
+        single byte."""
+        head_items = self._head_items(length)
+        if head_items > 1 and (head_items - 1) * self.head_item_size >= len(value):
+            raise ValueError(f"input string is not long enough to be decoded: {bytes(value)!r}")
+        if not (self.is_dynamic and length) and self.head_size(length) < len(value):
+            raise ValueError(f"input string was not fully consumed: {bytes(value)!r}")
+
+        value = memoryview(value)
+        if not length:
+            return []
+        elif self.is_bool:
+            return [
+                _unpack_bool(value[i // BITS_IN_BYTE], i % BITS_IN_BYTE) for i in range(length)
+            ]
+        elif self.is_dynamic:
+            starts = [_read_offset(value, i * _ABI_LENGTH_SIZE) for i in range(length)]
+            ends = [*starts[1:], len(value)]
+            return [value[start:end] for start, end in zip(starts, ends, strict=True)]
+        else:
+            size = self.head_item_size
+            return [value[i * size : (i + 1) * size] for i in range(length)]
+
+    def encode_ints(self, values: Iterable[int]) -> tuple[int, bytes]:
+        """Encode ints as an array of UIntN/BigUIntN items, returns the number of items
+        and their encoding."""
+        item_type = self._int_item_type()
+        if isinstance(values, Buffer):
+            values = memoryview(values).tolist()
+        ints = list(map(operator.index, values))
+        if ints:
+            as_int(min(ints), max=item_type.max_int)
+            as_int(max(ints), max=item_type.max_int)
+        size = item_type.max_bytes_len
+        typecode = _UNSIGNED_TYPECODES.get(size)
+        if typecode is None:
+            return len(ints), b"".join([i.to_bytes(size) for i in ints])
+        packed = array.array(typecode, ints)
+        if sys.byteorder == "little":
+            packed.byteswap()
+        return len(ints), packed.tobytes()
+
+    def decode_ints(self, value: bytes | memoryview, length: int) -> list[int]:
+        """Decode an array of UIntN/BigUIntN items as ints."""
+        size = self._int_item_type().max_bytes_len
+        if len(value) < length * size:
+            raise ValueError(f"input string is not long enough to be decoded: {bytes(value)!r}")
+        if len(value) > length * size:
+            raise ValueError(f"input string was not fully consumed: {bytes(value)!r}")
+        typecode = _UNSIGNED_TYPECODES.get(size)
+        if typecode is None:
+            view = memoryview(value)
+            return [int.from_bytes(view[i : i + size]) for i in range(0, len(view), size)]
+        packed = array.array(typecode)
+        packed.frombytes(value)
+        if sys.byteorder == "little":
+            packed.byteswap()
+        return packed.tolist()
+
+    def encode_bits(
+        self, bits: int | bytes | Iterable[bool], length: int | None
+    ) -> tuple[int, bytes]:
+        """Encode bits as an array of Bool items, returns the number of items and their
+        encoding."""
+        if not self.is_bool:
+            raise TypeError(f"expected an array of ARC4 Bools, not {self.item_type!r}[]")
+        if isinstance(bits, bytes | bytearray | memoryview):
+            packed = bytes(bits)
+            if length is None:
+                length = len(packed) * BITS_IN_BYTE
+            if len(packed) != self.head_size(length):
+                raise ValueError(f"expected {self.head_size(length)} bytes, got: {len(packed)}")
+            padding = len(packed) * BITS_IN_BYTE - length
+            if int.from_bytes(packed) & ((1 << padding) - 1):
+                raise ValueError(f"expected at most {length} bits")
+            return length, packed
+        elif isinstance(bits, int):
+            if bits < 0:
+                raise ValueError(f"expected positive value, got {bits}")
+            if length is None:
+                length = bits.bit_length()
+            elif bits.bit_length() > length:
+                raise ValueError(f"expected at most {length} bits, got: {bits.bit_length()}")
+            # item i is bit i, so the bits are reversed to put the first item first
+            bit_string = f"{bits:0{length}b}"[::-1] if length else ""
+        else:
+            bit_string = "".join(["1" if bit else "0" for bit in bits])
+            if length is not None and len(bit_string) != length:
+                raise TypeError(f"expected {length} items, not {len(bit_string)}")
+            length = len(bit_string)
+        size = self.head_size(length)
+        padding = size * BITS_IN_BYTE - length
+        return length, (int(bit_string or "0", 2) << padding).to_bytes(size)
+
+    def decode_bits(self, value: bytes | memoryview, length: int) -> int:
+        """Decode an array of Bool items as an int where item `i` is bit `i`."""
+        if not self.is_bool:
+            raise TypeError(f"expected an array of ARC4 Bools, not {self.item_type!r}[]")
+        size = self.head_size(length)
+        if len(value) < size:
+            raise ValueError(f"input string is not long enough to be decoded: {bytes(value)!r}")
+        if len(value) > size:
+            raise ValueError(f"input string was not fully consumed: {bytes(value)!r}")
+        if not length:
+            return 0
+        packed = int.from_bytes(value) >> (size * BITS_IN_BYTE - length)
+        return int(f"{packed:0{length}b}"[::-1], 2)
+
+    def _int_item_type(self) -> _UIntTypeInfo:
+        item_type = self.item_type
+        if not isinstance(item_type, _UIntTypeInfo) or isinstance(item_type, _UFixedTypeInfo):
+            raise TypeError(f"expected an array of ARC4 integers, not {item_type!r}[]")
+        return item_type
+
+    def decode_item(
+        self, value: bytes | bytearray | memoryview, length: int, index: int, *, offset: int = 0
+    ) -> typing.Any:
+        """Decode a single item without decoding the rest of the array, `offset` is the
+        position of the array head within `value`."""
+        if self.is_bool:
+            position = offset + index // BITS_IN_BYTE
+            bits = int.from_bytes(value[position : position + 1])
+            return self._decoder(_unpack_bool(bits, index % BITS_IN_BYTE))
+        elif self.is_dynamic:
+            head = offset + index * _ABI_LENGTH_SIZE
+            start = offset + _read_offset(value, head)
+            if index + 1 < length:
+                end = offset + _read_offset(value, head + _ABI_LENGTH_SIZE)
+            else:
+                end = len(value)
+            return self._decoder(_window(value)[start:end])
+        else:
+            start = offset + index * self.head_item_size
+            return self._decoder(_window(value)[start : start + self.head_item_size])
+
+    def iter_items(
+        self, value: bytes | memoryview, length: int, indexes: Iterable[int], *, offset: int = 0
+    ) -> Iterator[typing.Any]:
+        """Decode the items at `indexes` one at a time, `offset` is the position of the
+        array head within `value`."""
+        for index in indexes:
+            yield self.decode_item(value, length, index, offset=offset)
 
-            if before % 8 != 0:
-                raise ValueError("expected before index should have number of bool mod 8 equal 0")
-            after = min(7, after)
-            bits = int.from_bytes(value[array_index : array_index + 1])
-            # Parse bool values into multiple byte strings
-            for bool_i in range(after + 1):
-                mask = 128 >> bool_i
-                if mask & bits:
-                    value_partitions.append(b"\x80")
-                else:
-                    value_partitions.append(b"\x00")
-            i += after
-            array_index += 1
+    # the following methods update an encoded array in place, `buffer` must end with the array
+
+    def extend(
+        self, buffer: bytearray, length: int, items: Sequence[typing.Any], *, offset: int = 0
+    ) -> None:
+        """Append the encoding of `items` to an array of `length` items."""
+        if self.is_bool:
+            for index, item in enumerate(items, start=length):
+                bit = index % BITS_IN_BYTE
+                if not bit:
+                    buffer.append(0)
+                if _encoded(item) == Bool._true_byte_value:
+                    buffer[-1] |= 0x80 >> bit
+        elif self.is_dynamic:
+            tails = [_encoded(item) for item in items]
+            added_head_size = _ABI_LENGTH_SIZE * len(tails)
+            self._shift_offsets(buffer, offset, range(length), added_head_size)
+            heads = []
+            tail_offset = len(buffer) - offset + added_head_size
+            for tail in tails:
+                heads.append(_encode_offset(tail_offset))
+                tail_offset += len(tail)
+            head_end = offset + _ABI_LENGTH_SIZE * length
+            buffer[head_end:head_end] = b"".join(heads)
+            buffer += b"".join(tails)
+        else:
+            buffer += b"".join(_encoded(item) for item in items)
+
+    def pop(self, buffer: bytearray, length: int, *, offset: int = 0) -> typing.Any:
+        """Remove and return the last item of an array of `length` items."""
+        index = length - 1
+        if self.is_bool:
+            bit = index % BITS_IN_BYTE
+            item = self._decoder(_unpack_bool(buffer[-1], bit))
+            if bit:
+                buffer[-1] &= ~(0x80 >> bit) & 0xFF
+            else:
+                del buffer[-1]
+        elif self.is_dynamic:
+            head = offset + index * _ABI_LENGTH_SIZE
+            start = offset + _read_offset(buffer, head)
+            item = self._decoder(bytes(buffer[start:]))
+            del buffer[start:]
+            del buffer[head : head + _ABI_LENGTH_SIZE]
+            self._shift_offsets(buffer, offset, range(index), -_ABI_LENGTH_SIZE)
         else:
-            curr_len = _get_max_bytes_len(child_type)
-            value_partitions.append(value[array_index : array_index + curr_len])
-            array_index += curr_len
+            start = offset + index * self.head_item_size
+            item = self._decoder(bytes(buffer[start:]))
+            del buffer[start:]
+        return item
 
-        if array_index >= len(value) and i != len(child_types) - 1:
-            raise ValueError(f"input string is not long enough to be decoded: {value!r}")
+    def replace(
+        self, buffer: bytearray, length: int, index: int, item: typing.Any, *, offset: int = 0
+    ) -> None:
+        """Replace the item at `index` of an array of `length` items."""
+        if self.is_bool:
+            position = offset + index // BITS_IN_BYTE
+            mask = 0x80 >> (index % BITS_IN_BYTE)
+            if _encoded(item) == Bool._true_byte_value:
+                buffer[position] |= mask
+            else:
+                buffer[position] &= ~mask & 0xFF
+        elif self.is_dynamic:
+            head = offset + index * _ABI_LENGTH_SIZE
+            start = offset + _read_offset(buffer, head)
+            if index + 1 < length:
+                end = offset + _read_offset(buffer, head + _ABI_LENGTH_SIZE)
+            else:
+                end = len(buffer)
+            tail = _encoded(item)
+            buffer[start:end] = tail
+            self._shift_offsets(
+                buffer, offset, range(index + 1, length), len(tail) - (end - start)
+            )
+        else:
+            start = offset + index * self.head_item_size
+            buffer[start : start + self.head_item_size] = _encoded(item)
+
+    @staticmethod
+    def _shift_offsets(buffer: bytearray, offset: int, indexes: range, delta: int) -> None:
+        if not delta or not indexes:
+            return
+        start = offset + indexes.start * _ABI_LENGTH_SIZE
+        end = offset + indexes.stop * _ABI_LENGTH_SIZE
+        # offsets are increasing, so only the last one can overflow
+        _encode_offset(_read_offset(buffer, end - _ABI_LENGTH_SIZE) + delta)
+        # add delta to every offset at once, this can't carry or borrow between offsets as
+        # each shifted offset stays within 0..MAX_UINT16
+        offsets = int.from_bytes(buffer[start:end])
+        ones = int.from_bytes(b"\x00\x01" * len(indexes))
+        buffer[start:end] = (offsets + delta * ones).to_bytes(end - start)
+
+
+# array typecodes for each unsigned integer size, used to pack and unpack ints in bulk
+_UNSIGNED_TYPECODES = {array.array(typecode).itemsize: typecode for typecode in "BHILQ"}
+
+
+def _decoder_for(type_info: _TypeInfo) -> Callable[[bytes | bytearray | memoryview], typing.Any]:
+    cls = type_info.typ
+    assert issubclass(cls, _ABIEncoded), "expected ARC4 type"
+    if isinstance(type_info, _UIntTypeInfo | _BoolTypeInfo):
+        # ints and bools are immutable, so instances of common values can be shared
+        return functools.partial(_decode_interned, type_info.interned, cls)
+    return cls.from_bytes
+
+
+def _decode_interned(
+    interned: dict[bytes, _ABIEncoded],
+    cls: type[_ABIEncoded],
+    value: bytes | bytearray | memoryview,
+) -> _ABIEncoded:
+    encoded = bytes(value)
+    try:
+        return interned[encoded]
+    except KeyError:
+        return cls._from_trusted(encoded)
+
+
+def _item_index(index: algopy.UInt64 | int, length: int) -> int:
+    index = operator.index(index)
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError("array index out of range")
+    return index
+
+
+def _encoded(value: _ABIEncoded) -> bytes | memoryview:
+    if not isinstance(value, _ABIEncoded):
+        raise TypeError("expected ARC4 type")
+    return value._value
+
+
+def _pack_bools(encoded: Sequence[bytes | memoryview]) -> bytes:
+    """Compress consecutive encoded boolean values into a byte for a Tuple/Array."""
+    result = 0
+    for i, value in enumerate(encoded):
+        if value == Bool._true_byte_value:
+            result |= 0x80 >> i
+    return bytes((result,))
 
-        i += 1
 
-    if len(dynamic_segments) > 0:
-        dynamic_segments[len(dynamic_segments) - 1][1] = len(value)
-        array_index = len(value)
-    if array_index < len(value):
-        raise ValueError(f"input string was not fully consumed: {value!r}")
+def _unpack_bool(bits: int, index: int) -> bytes:
+    return Bool._true_byte_value if bits & (0x80 >> index) else Bool._false_byte_value
 
-    # Check dynamic element partitions
-    segment_index = 0
-    for i, child_type in enumerate(child_types):
-        if child_type.is_dynamic:
-            segment_start, segment_end = dynamic_segments[segment_index]
-            value_partitions[i] = value[segment_start:segment_end]
-            segment_index += 1
 
-    # Decode individual tuple elements
-    values = []
-    for child_type, child_value in zip(child_types, value_partitions, strict=False):
-        cls = child_type.typ
-        assert issubclass(cls, _ABIEncoded | Struct), "expected ARC4 type"
-        assert child_value is not None, "expected ARC4 value"
-        val = cls.from_bytes(child_value)
-        values.append(val)
-    return values
+def _encode_offset(offset: int) -> bytes:
+    return int_to_bytes(as_int16(offset), _ABI_LENGTH_SIZE)
+
+
+def _read_offset(value: bytes | bytearray | memoryview, position: int) -> int:
+    return int.from_bytes(value[position : position + _ABI_LENGTH_SIZE])
+
+
+def _as_readonly(value: algopy.Bytes | bytes | bytearray | memoryview) -> bytes | memoryview:
+    """Return `value` as an immutable sequence of bytes, only copying it if it is
+    mutable."""
+    if isinstance(value, Bytes):
+        return value.value
+    elif isinstance(value, memoryview) and value.readonly and value.c_contiguous:
+        return value.cast("B")
+    return bytes(value)
+
+
+def _window(value: bytes | bytearray | memoryview) -> memoryview | bytearray:
+    """Return `value` in a form that can be sliced without copying.
+
+    A bytearray can't be resized while a view of it exists, so these are sliced (and
+    copied) directly
+    """
+    return value if isinstance(value, bytearray) else memoryview(value)
 
 
 def _encode_length(length: int) -> bytes:
     return length.to_bytes(_ABI_LENGTH_SIZE)
 
 
-def _read_length(value: bytes) -> tuple[int, bytes]:
+def _read_length(value: bytes | memoryview) -> tuple[int, memoryview]:
     length = int.from_bytes(value[:_ABI_LENGTH_SIZE])
-    data = value[_ABI_LENGTH_SIZE:]
+    data = memoryview(value)[_ABI_LENGTH_SIZE:]
     return length, data
 
 
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import dataclasses
 import inspect
 import typing
 
 from _algopy_testing.context_helpers import LedgerContext, TransactionContext
+from _algopy_testing.context_helpers.context_storage import activate_context
 from _algopy_testing.state.utils import cast_to_bytes
 from _algopy_testing.utils import generate_random_account
 from _algopy_testing.value_generators import AlgopyValueGenerator
 
 if typing.TYPE_CHECKING:
+    import os
+
     import algopy
 
+    from _algopy_testing.context_helpers.ledger_context import LedgerSnapshot
+    from _algopy_testing.context_helpers.txn_context import TransactionGroup
+
 
 class AlgopyTestContext:
     """Manages the testing context for Algorand Python SDK (algopy) applications.
@@ -22,6 +29,11 @@ class AlgopyTestContext:
 
     :param default_sender: The default sender account address, defaults to None
     :param template_vars: Dictionary of template variables, defaults to None
+    :param box_memory_limit: If provided, box contents are moved to a memory-mapped file
+        once the total size of box contents held in memory exceeds this many bytes,
+        defaults to None
+    :param box_spill_directory: Directory for the memory-mapped box file, defaults to the
+        system temporary directory
     """
 
     def __init__(
@@ -29,6 +41,8 @@ class AlgopyTestContext:
         *,
         default_sender: str | None = None,
         template_vars: dict[str, typing.Any] | None = None,
+        box_memory_limit: int | None = None,
+        box_spill_directory: str | os.PathLike[str] | None = None,
     ) -> None:
         import algopy
 
@@ -36,7 +50,9 @@ class AlgopyTestContext:
         self._template_vars: dict[str, typing.Any] = template_vars or {}
 
         self._active_lsig_args = list[bytes]()
-        self._ledger_context = LedgerContext()
+        self._box_memory_limit = box_memory_limit
+        self._box_spill_directory = box_spill_directory
+        self._ledger_context = self._create_ledger_context()
         self._txn_context = TransactionContext()
         self._value_generator = AlgopyValueGenerator()
 
@@ -111,4 +127,86 @@ class AlgopyTestContext:
         ID counters."""
         self._template_vars.clear()
         self._txn_context = TransactionContext()
-        self._ledger_context = LedgerContext()
+        self._ledger_context = self._create_ledger_context()
+
+    def snapshot(self) -> ContextSnapshot:
+        """Capture the current state of the test context, which can be returned to with
+        `restore`.
+
+        Data is shared between the snapshot and the context until it is modified, so
+        snapshots are cheap to take and to restore. Snapshots are not supported when a
+        box memory limit is set.
+
+        :raises RuntimeError: If a transaction group is active
+        :return: The snapshot
+        :rtype: ContextSnapshot
+        """
+        self._check_no_active_group()
+        return ContextSnapshot(
+            _ledger=self._ledger_context._snapshot(),
+            _txn_groups=tuple(self._txn_context._groups),
+            _template_vars=self._template_vars.copy(),
+        )
+
+    def restore(self, snapshot: ContextSnapshot) -> None:
+        """Return the test context to the state captured by a snapshot, including the
+        ledger, transaction groups, template variables and ID counters. A snapshot can be
+        restored any number of times.
+
+        :param snapshot: The snapshot to restore
+        :raises RuntimeError: If a transaction group is active
+        """
+        self._check_no_active_group()
+        self._ledger_context._restore(snapshot._ledger)
+        self._txn_context = TransactionContext()
+        self._txn_context._groups = list(snapshot._txn_groups)
+        self._template_vars = snapshot._template_vars.copy()
+
+    def fork(self) -> AlgopyTestContext:
+        """Create an independent copy of the test context, e.g. to explore different
+        scenarios from the same starting state.
+
+        Data is shared between the contexts until it is modified by either of them. Use
+        `activate` to make the fork the current context.
+
+        :raises RuntimeError: If a transaction group is active
+        :return: The forked context
+        :rtype: AlgopyTestContext
+        """
+        snapshot = self.snapshot()
+        context = AlgopyTestContext(
+            default_sender=self._default_sender.public_key,
+            box_memory_limit=self._box_memory_limit,
+            box_spill_directory=self._box_spill_directory,
+        )
+        context.restore(snapshot)
+        return context
+
+    def activate(self) -> typing.ContextManager[AlgopyTestContext]:
+        """Make this the current test context until exiting the returned context
+        manager, after which the previous context is current again. Can be used within
+        `algopy_testing_context`, e.g. to activate a context created with `fork`.
+
+        :return: A context manager
+        :rtype: typing.ContextManager[AlgopyTestContext]
+        """
+        return activate_context(self)
+
+    def _check_no_active_group(self) -> None:
+        if self._txn_context._active_group is not None:
+            raise RuntimeError("Snapshots cannot be used while a transaction group is active.")
+
+    def _create_ledger_context(self) -> LedgerContext:
+        return LedgerContext(
+            box_memory_limit=self._box_memory_limit,
+            box_spill_directory=self._box_spill_directory,
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class ContextSnapshot:
+    """The state of an AlgopyTestContext, created by `AlgopyTestContext.snapshot`."""
+
+    _ledger: LedgerSnapshot
+    _txn_groups: tuple[TransactionGroup, ...]
+    _template_vars: dict[str, typing.Any]
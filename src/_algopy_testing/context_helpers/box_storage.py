@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import mmap
+import tempfile
+import typing
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+if typing.TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+
+_BoxId = tuple[int, bytes]
+
+# the spill file grows by at least this many bytes at a time
+_MIN_FILE_GROWTH = 1024 * 1024
+
+
+class SpillingBoxStorage:
+    """Box contents for all applications of a ledger, where the least recently used
+    contents are moved to a memory-mapped file once the total size of the contents held in
+    memory exceeds `memory_limit`.
+
+    Contents are moved back into memory when accessed, so callers always receive a
+    `bytearray` that can be modified in place, as with the in-memory storage.
+    """
+
+    def __init__(
+        self, *, memory_limit: int, directory: str | os.PathLike[str] | None = None
+    ) -> None:
+        if memory_limit < 0:
+            raise ValueError(f"expected memory_limit >= 0, got: {memory_limit}")
+        self.memory_limit = memory_limit
+        self._directory = directory
+        # contents in memory, ordered from least to most recently used
+        self._hot = OrderedDict[_BoxId, bytearray]()
+        # size of each content in memory, as last accounted for in _hot_size
+        self._hot_sizes = dict[_BoxId, int]()
+        self._hot_size = 0
+        # the most recently returned content, which may have been resized in place since
+        self._last: _BoxId | None = None
+        # (offset, length) of each content in the spill file
+        self._cold = dict[_BoxId, tuple[int, int]]()
+        # offsets of unused regions in the spill file, by length
+        self._free = dict[int, list[int]]()
+        self._file: typing.IO[bytes] | None = None
+        self._mmap: mmap.mmap | None = None
+        self._file_end = 0
+        # keys of each application, in insertion order
+        self._app_keys = dict[int, dict[bytes, None]]()
+
+    def for_app(self, app_id: int) -> MutableMapping[bytes, bytearray]:
+        """Returns the boxes of an application, any existing boxes are removed."""
+        for key in list(self._app_keys.get(app_id, ())):
+            self.delete((app_id, key))
+        self._app_keys[app_id] = {}
+        return _ApplicationBoxes(self, app_id)
+
+    @property
+    def spilled_count(self) -> int:
+        """The number of boxes currently stored in the spill file."""
+        return len(self._cold)
+
+    def get(self, box_id: _BoxId) -> bytearray | None:
+        self._sync_last()
+        try:
+            content = self._hot[box_id]
+        except KeyError:
+            try:
+                offset, length = self._cold.pop(box_id)
+            except KeyError:
+                return None
+            content = bytearray(self._read(offset, length))
+            self._release(offset, length)
+            self._add_hot(box_id, content)
+        else:
+            self._hot.move_to_end(box_id)
+        self._last = box_id
+        return content
+
+    def set(self, box_id: _BoxId, content: bytearray) -> None:
+        self._sync_last()
+        app_id, key = box_id
+        self._app_keys.setdefault(app_id, {})[key] = None
+        self._remove(box_id)
+        self._add_hot(box_id, content)
+        self._last = box_id
+
+    def delete(self, box_id: _BoxId) -> bool:
+        self._sync_last()
+        app_id, key = box_id
+        keys = self._app_keys.get(app_id, {})
+        if key not in keys:
+            return False
+        del keys[key]
+        self._remove(box_id)
+        return True
+
+    def contains(self, box_id: _BoxId) -> bool:
+        app_id, key = box_id
+        return key in self._app_keys.get(app_id, ())
+
+    def keys(self, app_id: int) -> dict[bytes, None]:
+        return self._app_keys.get(app_id, {})
+
+    def _add_hot(self, box_id: _BoxId, content: bytearray) -> None:
+        self._hot[box_id] = content
+        self._hot_sizes[box_id] = len(content)
+        self._hot_size += len(content)
+        self._evict()
+
+    def _remove(self, box_id: _BoxId) -> None:
+        if self._last == box_id:
+            self._last = None
+        if self._hot.pop(box_id, None) is not None:
+            self._hot_size -= self._hot_sizes.pop(box_id)
+        elif (location := self._cold.pop(box_id, None)) is not None:
+            self._release(*location)
+
+    def _sync_last(self) -> None:
+        # contents are only modified in place directly after being returned, so only the
+        # most recently returned content needs its size accounted for again
+        if self._last is not None and (content := self._hot.get(self._last)) is not None:
+            self._hot_size += len(content) - self._hot_sizes[self._last]
+            self._hot_sizes[self._last] = len(content)
+            self._evict()
+
+    def _evict(self) -> None:
+        # the most recently used content is always kept in memory, as it may be about to be
+        # modified in place
+        while self._hot_size > self.memory_limit and len(self._hot) > 1:
+            box_id, content = self._hot.popitem(last=False)
+            self._hot_size -= self._hot_sizes.pop(box_id)
+            self._cold[box_id] = (self._write(content), len(content))
+
+    def _read(self, offset: int, length: int) -> bytes:
+        if not length:
+            return b""
+        assert self._mmap is not None
+        return self._mmap[offset : offset + length]
+
+    def _write(self, content: bytearray) -> int:
+        length = len(content)
+        if not length:
+            return 0
+        try:
+            offset = self._free[length].pop()
+        except (KeyError, IndexError):
+            offset = self._file_end
+            self._file_end += length
+            self._reserve(self._file_end)
+        assert self._mmap is not None
+        self._mmap[offset : offset + length] = content
+        return offset
+
+    def _release(self, offset: int, length: int) -> None:
+        if length:
+            self._free.setdefault(length, []).append(offset)
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._mmap) if self._mmap is not None else 0
+        if size <= capacity:
+            return
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self._directory)
+        new_capacity = max(size, capacity * 2, _MIN_FILE_GROWTH)
+        self._file.truncate(new_capacity)
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = mmap.mmap(self._file.fileno(), new_capacity)
+
+
+class _ApplicationBoxes(MutableMapping[bytes, bytearray]):
+    """The boxes of a single application within a SpillingBoxStorage."""
+
+    def __init__(self, storage: SpillingBoxStorage, app_id: int) -> None:
+        self._storage = storage
+        self._app_id = app_id
+
+    def __getitem__(self, key: bytes) -> bytearray:
+        content = self._storage.get((self._app_id, key))
+        if content is None:
+            raise KeyError(key)
+        return content
+
+    def get(self, key: bytes, default: typing.Any = None) -> typing.Any:
+        content = self._storage.get((self._app_id, key))
+        return default if content is None else content
+
+    def __setitem__(self, key: bytes, value: bytearray) -> None:
+        self._storage.set((self._app_id, key), value)
+
+    def __delitem__(self, key: bytes) -> None:
+        if not self._storage.delete((self._app_id, key)):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, bytes) and self._storage.contains((self._app_id, key))
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._storage.keys(self._app_id))
+
+    def __len__(self) -> int:
+        return len(self._storage.keys(self._app_id))
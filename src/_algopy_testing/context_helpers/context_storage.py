@@ -5,6 +5,7 @@ from contextlib import contextmanager
 from contextvars import ContextVar
 
 if typing.TYPE_CHECKING:
+    import os
     from collections.abc import Generator
 
     import algopy
@@ -78,13 +79,13 @@ class _InternalContext:
 
     def get_asset_data(self, asset_id: int | algopy.UInt64) -> AssetFields:
         try:
-            return self.ledger._asset_data[int(asset_id)]
+            return self.ledger._get_asset_data(int(asset_id))
         except KeyError:
             raise ValueError("Unknown asset, check correct testing context is active") from None
 
     def get_account_data(self, account_public_key: str) -> AccountContextData:
         try:
-            return self.ledger._account_data[account_public_key]
+            return self.ledger._get_account_data(account_public_key)
         except KeyError:
             raise ValueError("Unknown account, check correct testing context is active") from None
 
@@ -96,23 +97,42 @@ lazy_context = _InternalContext()
 def algopy_testing_context(
     *,
     default_sender: str | None = None,
+    box_memory_limit: int | None = None,
+    box_spill_directory: str | os.PathLike[str] | None = None,
 ) -> Generator[AlgopyTestContext, None, None]:
     """Context manager for the AlgopyTestContext.
 
     Args:
         default_sender: The default sender for the context.
+        box_memory_limit: If provided, box contents are moved to a memory-mapped file
+            once the total size of box contents held in memory exceeds this many bytes.
+        box_spill_directory: The directory for the memory-mapped box file, defaults to
+            the system temporary directory.
     """
     from _algopy_testing.context import AlgopyTestContext
 
     if _var.get(None) is not None:
         raise RuntimeError("Nested `algopy_testing_context`s are not allowed.")
 
-    token = _var.set(
-        AlgopyTestContext(
-            default_sender=default_sender,
-        )
+    context = AlgopyTestContext(
+        default_sender=default_sender,
+        box_memory_limit=box_memory_limit,
+        box_spill_directory=box_spill_directory,
     )
+    with activate_context(context):
+        yield context
+
+
+@contextmanager
+def activate_context(context: AlgopyTestContext) -> Generator[AlgopyTestContext, None, None]:
+    """Context manager that makes a test context the active context, the previously
+    active context is active again on exit.
+
+    Args:
+        context: The context to activate.
+    """
+    token = _var.set(context)
     try:
-        yield _var.get()
+        yield context
     finally:
         _var.reset(token)
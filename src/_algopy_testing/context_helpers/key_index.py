@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import bisect
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# pending changes are applied individually while there are at most _MAX_INDIVIDUAL_CHANGES
+# of them, otherwise the sorted keys are rebuilt in a single pass. Applying a change
+# individually shifts O(n) keys, so this is only faster than a rebuild for a handful of
+# changes, e.g. up to ~40 changes for 1k keys and a few hundred for 200k keys
+_MAX_INDIVIDUAL_CHANGES = 32
+
+
+class SortedKeyIndex:
+    """Sorted index of a set of keys, supporting prefix and range queries in
+    O(log n + k).
+
+    Keys added or removed are held as pending changes and merged into the sorted keys on
+    the next query, so that a large number of consecutive changes is merged in a single
+    pass
+    """
+
+    def __init__(self, keys: Iterable[bytes] = ()) -> None:
+        self._sorted = sorted(keys)
+        self._added = set[bytes]()
+        self._removed = set[bytes]()
+
+    def copy(self) -> SortedKeyIndex:
+        """Returns a copy of the index."""
+        index = SortedKeyIndex()
+        index._sorted = self._sorted.copy()
+        index._added = self._added.copy()
+        index._removed = self._removed.copy()
+        return index
+
+    def add(self, key: bytes) -> None:
+        """Add a key that is not currently in the index."""
+        if key in self._removed:
+            self._removed.discard(key)
+        else:
+            self._added.add(key)
+
+    def remove(self, key: bytes) -> None:
+        """Remove a key that is currently in the index."""
+        if key in self._added:
+            self._added.discard(key)
+        else:
+            self._removed.add(key)
+
+    def count(
+        self, *, prefix: bytes = b"", start: bytes | None = None, stop: bytes | None = None
+    ) -> int:
+        """Count the keys starting with `prefix`, in the range [`start`, `stop`)."""
+        low, high = self._bounds(prefix, start, stop)
+        return max(high - low, 0)
+
+    def keys(
+        self, *, prefix: bytes = b"", start: bytes | None = None, stop: bytes | None = None
+    ) -> list[bytes]:
+        """Return the sorted keys starting with `prefix`, in the range [`start`, `stop`)."""
+        low, high = self._bounds(prefix, start, stop)
+        return self._sorted[low:high]
+
+    def _bounds(self, prefix: bytes, start: bytes | None, stop: bytes | None) -> tuple[int, int]:
+        self._merge()
+        keys = self._sorted
+        lower = prefix if start is None else max(prefix, start)
+        upper = _prefix_end(prefix)
+        if stop is not None:
+            upper = stop if upper is None else min(upper, stop)
+        low = bisect.bisect_left(keys, lower)
+        high = len(keys) if upper is None else bisect.bisect_left(keys, upper, lo=low)
+        return low, high
+
+    def _merge(self) -> None:
+        keys = self._sorted
+        if self._removed:
+            if len(self._removed) <= _MAX_INDIVIDUAL_CHANGES:
+                for key in self._removed:
+                    del keys[bisect.bisect_left(keys, key)]
+            else:
+                removed = self._removed
+                keys[:] = [key for key in keys if key not in removed]
+            self._removed = set()
+        if self._added:
+            if len(self._added) <= _MAX_INDIVIDUAL_CHANGES:
+                for key in self._added:
+                    bisect.insort(keys, key)
+            else:
+                keys.extend(self._added)
+                keys.sort()
+            self._added = set()
+
+
+def _prefix_end(prefix: bytes) -> bytes | None:
+    """Returns the smallest key greater than every key starting with `prefix`, or None if
+    there is no such key."""
+    stripped = prefix.rstrip(b"\xff")
+    if not stripped:
+        return None
+    return stripped[:-1] + bytes([stripped[-1] + 1])
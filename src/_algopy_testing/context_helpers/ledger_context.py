@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import copy
+import dataclasses
+import itertools
 import typing
 from collections import defaultdict
 
 from algokit_utils.common import ZERO_ADDRESS
 
 from _algopy_testing.constants import MAX_BOX_SIZE
-from _algopy_testing.models.account import Account
 from _algopy_testing.primitives.uint64 import UInt64
 from _algopy_testing.utils import (
     as_bytes,
@@ -16,18 +18,38 @@ from _algopy_testing.utils import (
 )
 
 if typing.TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator, Mapping, MutableMapping
+
     import algopy
 
-    from _algopy_testing.models.account import AccountFields
+    from _algopy_testing.models.account import AccountContextData, AccountFields
     from _algopy_testing.models.application import ApplicationContextData, ApplicationFields
     from _algopy_testing.models.asset import AssetFields
     from _algopy_testing.op.global_values import GlobalFields
 
 
+# versions are unique across all ledgers, so a version always identifies the same write
+_next_version = itertools.count(1).__next__
+
+
 class LedgerContext:
-    """Context for managing the ledger state."""
+    """Context for managing the ledger state.
+
+    Args:
+        box_memory_limit: If provided, box contents are moved to a memory-mapped file
+            once the total size of box contents held in memory exceeds this many bytes.
+        box_spill_directory: The directory for the memory-mapped file, defaults to the
+            system temporary directory.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        box_memory_limit: int | None = None,
+        box_spill_directory: str | os.PathLike[str] | None = None,
+    ) -> None:
+        from _algopy_testing.context_helpers.box_storage import SpillingBoxStorage
         from _algopy_testing.models.account import AccountContextData, get_empty_account
 
         self._account_data = defaultdict[str, AccountContextData](get_empty_account)
@@ -35,9 +57,26 @@ class LedgerContext:
         self._asset_data: dict[int, AssetFields] = {}
         self._blocks: dict[int, dict[str, int | bytes | str]] = {}
         self._global_fields: GlobalFields = get_default_global_fields()
+        # keys of accounts, apps and assets whose data is shared with a snapshot, and so
+        # must be copied before being accessed
+        self._shared_accounts = set[str]()
+        self._shared_apps = set[int]()
+        self._shared_assets = set[int]()
+
+        self._asset_id: Iterator[int] = iter(range(1001, 2**64))
+        self._app_id: Iterator[int] = iter(range(1001, 2**64))
+
+        self._box_storage = (
+            None
+            if box_memory_limit is None
+            else SpillingBoxStorage(memory_limit=box_memory_limit, directory=box_spill_directory)
+        )
 
-        self._asset_id = iter(range(1001, 2**64))
-        self._app_id = iter(range(1001, 2**64))
+    def _create_app_boxes(self, app_id: int) -> MutableMapping[bytes, bytearray]:
+        """Create the box storage for a new application."""
+        if self._box_storage is None:
+            return {}
+        return self._box_storage.for_app(app_id)
 
     def _get_next_asset_id(self) -> int:
         while True:
@@ -91,7 +130,22 @@ class LedgerContext:
         """
         address = _get_address(account)
         assert_address_is_valid(address)
-        self._account_data[address].fields.update(account_fields)
+        self._get_account_data(address).fields.update(account_fields)
+
+    def update_accounts(
+        self,
+        accounts: Mapping[algopy.Account | str, AccountFields],
+    ) -> None:
+        """Update the fields of many accounts.
+
+        Args:
+            accounts: The fields to update, by account.
+        """
+        account_fields = [
+            (_get_valid_address(account), fields) for account, fields in accounts.items()
+        ]
+        for address, fields in account_fields:
+            self._get_account_data(address).fields.update(fields)
 
     def update_asset_holdings(
         self,
@@ -108,7 +162,7 @@ class LedgerContext:
         from _algopy_testing.models.account import AssetHolding
 
         address = _get_address(account)
-        account_data = self._account_data[address]
+        account_data = self._get_account_data(address)
         asset_id = _get_asset_id(asset)
         asset = self.get_asset(asset_id)
 
@@ -121,6 +175,40 @@ class LedgerContext:
         if frozen is not None:
             holdings.frozen = frozen
 
+    def update_asset_balances(
+        self,
+        asset: algopy.Asset | algopy.UInt64 | int,
+        balances: Mapping[algopy.Account | str, algopy.UInt64 | int | None],
+        *,
+        frozen: bool | None = None,
+    ) -> None:
+        """Update asset holdings of many accounts, accounts will also be opted-in to asset.
+
+        Args:
+            asset: The asset.
+            balances: The balance of each account, or None to leave the balance unchanged.
+            frozen: If provided, the frozen state of all holdings.
+        """
+        from _algopy_testing.models.account import AssetHolding
+
+        asset_id = _get_asset_id(asset)
+        default_frozen = self.get_asset(asset_id).default_frozen
+        account_balances = [
+            (_get_address(account), None if balance is None else UInt64(int(balance)))
+            for account, balance in balances.items()
+        ]
+        for address, balance in account_balances:
+            opted_assets = self._get_account_data(address).opted_assets
+            holdings = opted_assets.get(asset_id)
+            if holdings is None:
+                holdings = opted_assets[asset_id] = AssetHolding(
+                    balance=UInt64(), frozen=default_frozen
+                )
+            if balance is not None:
+                holdings.balance = balance
+            if frozen is not None:
+                holdings.frozen = frozen
+
     def get_asset(self, asset_id: algopy.UInt64 | int) -> algopy.Asset:
         """Get an asset by ID.
 
@@ -168,7 +256,7 @@ class LedgerContext:
         asset_id = _get_asset_id(asset)
         if asset_id not in self._asset_data:
             raise ValueError("Asset not found in testing context!")
-        self._asset_data[asset_id].update(asset_fields)
+        self._get_asset_data(asset_id).update(asset_fields)
 
     def get_app(
         self, app_id: algopy.Contract | algopy.Application | algopy.UInt64 | int
@@ -242,12 +330,37 @@ class LedgerContext:
             value: The state value.
         """
         key_bytes = as_bytes(key)
-        global_state = self._get_app_data(app).global_state
+        app_data = self._get_app_data(app)
+        global_state = app_data.global_state
         if value is None:
             if key_bytes in global_state:
                 del global_state[key_bytes]
         else:
             global_state[key_bytes] = convert_stack_to_native(value)
+        app_data.versions["global", key_bytes] = _next_version()
+
+    def set_global_states(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        states: Mapping[bytes | algopy.Bytes, algopy.Bytes | algopy.UInt64 | int | bytes | None],
+    ) -> None:
+        """Set many global state values for an application, all values are validated
+        before any are set.
+
+        Args:
+            app: The application identifier.
+            states: The state values by key, a value of None deletes the key.
+        """
+        app_data = self._get_app_data(app)
+        values = _as_state_values(states)
+        global_state = app_data.global_state
+        for key_bytes, value in values.items():
+            if value is None:
+                global_state.pop(key_bytes, None)
+            else:
+                global_state[key_bytes] = value
+        version = _next_version()
+        app_data.versions.update((("global", key_bytes), version) for key_bytes in values)
 
     def get_local_state(
         self,
@@ -265,11 +378,7 @@ class LedgerContext:
         Returns:
             int | bytes: The state value.
         """
-        composite_key = (
-            (account.public_key if isinstance(account, Account) else account),
-            as_bytes(key),
-        )
-        return self._get_app_data(app).local_state[composite_key]
+        return self._get_app_data(app).local_state[_get_address(account)][as_bytes(key)]
 
     def set_local_state(
         self,
@@ -286,15 +395,104 @@ class LedgerContext:
             key: The state key.
             value: The state value.
         """
-        account_public_key = account.public_key if isinstance(account, Account) else account
+        address = _get_address(account)
         key_bytes = as_bytes(key)
-        composite_key = (account_public_key, key_bytes)
-        local_state = self._get_app_data(app).local_state
+        app_data = self._get_app_data(app)
+        local_state = app_data.local_state
         if value is None:
-            if composite_key in local_state:
-                del local_state[composite_key]
+            if key_bytes in local_state.get(address, ()):
+                account_state = _get_writable_local_state(app_data, address)
+                del account_state[key_bytes]
+                if not account_state:
+                    del local_state[address]
         else:
-            local_state[composite_key] = convert_stack_to_native(value)
+            account_state = _get_writable_local_state(app_data, address)
+            account_state[key_bytes] = convert_stack_to_native(value)
+        app_data.versions["local", (address, key_bytes)] = _next_version()
+
+    def set_local_states(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        states: Mapping[
+            algopy.Account | str,
+            Mapping[bytes | algopy.Bytes, algopy.Bytes | algopy.UInt64 | int | bytes | None],
+        ],
+    ) -> None:
+        """Set many local state values for an application, all values are validated
+        before any are set.
+
+        Args:
+            app: The application identifier.
+            states: The state values by key, by account, a value of None deletes the key.
+        """
+        app_data = self._get_app_data(app)
+        account_values = [
+            (_get_address(account), _as_state_values(values)) for account, values in states.items()
+        ]
+        local_state = app_data.local_state
+        versions = app_data.versions
+        version = _next_version()
+        for address, values in account_values:
+            account_state = _get_writable_local_state(app_data, address)
+            for key_bytes, value in values.items():
+                if value is None:
+                    account_state.pop(key_bytes, None)
+                else:
+                    account_state[key_bytes] = value
+                versions["local", (address, key_bytes)] = version
+            if not account_state:
+                del local_state[address]
+
+    def get_account_local_state(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        account: algopy.Account | str,
+    ) -> dict[bytes, int | bytes]:
+        """Get a copy of all local state of an account for an application.
+
+        Args:
+            app: The application identifier.
+            account: The account identifier.
+
+        Returns:
+            dict[bytes, int | bytes]: The state values by key.
+        """
+        return dict(self._get_app_data(app).local_state.get(_get_address(account), {}))
+
+    def count_local_state(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        account: algopy.Account | str,
+    ) -> int:
+        """Count the local state keys of an account for an application.
+
+        Args:
+            app: The application identifier.
+            account: The account identifier.
+
+        Returns:
+            int: The number of keys.
+        """
+        return len(self._get_app_data(app).local_state.get(_get_address(account), ()))
+
+    def clear_local_state(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        account: algopy.Account | str,
+    ) -> None:
+        """Delete all local state of an account for an application, e.g. to simulate a
+        close out or clear state.
+
+        Args:
+            app: The application identifier.
+            account: The account identifier.
+        """
+        address = _get_address(account)
+        app_data = self._get_app_data(app)
+        account_state = app_data.local_state.pop(address, {})
+        app_data.shared_local_state.discard(address)
+        for key_bytes in account_state:
+            app_data.versions["local", (address, key_bytes)] = _next_version()
 
     def get_box(
         self,
@@ -310,8 +508,8 @@ class LedgerContext:
         Returns:
             bytes: The box content.
         """
-        boxes = self._get_app_data(app).boxes
-        return boxes.get(_as_box_key(key), b"")
+        content = self._get_box_content(app, key)
+        return b"" if content is None else bytes(content)
 
     def set_box(
         self,
@@ -326,8 +524,41 @@ class LedgerContext:
             key: The box key.
             value: The box content.
         """
-        boxes = self._get_app_data(app).boxes
-        boxes[_as_box_key(key)] = as_bytes(value, max_size=MAX_BOX_SIZE)
+        app_data = self._get_app_data(app)
+        key_bytes = _as_box_key(key)
+        content = bytearray(as_bytes(value, max_size=MAX_BOX_SIZE))
+        if key_bytes not in app_data.boxes:
+            app_data.box_index.add(key_bytes)
+        app_data.boxes[key_bytes] = content
+        app_data.shared_boxes.discard(key_bytes)
+        app_data.versions["box", key_bytes] = _next_version()
+
+    def set_boxes(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        boxes: Mapping[algopy.Bytes | bytes, algopy.Bytes | bytes],
+    ) -> None:
+        """Set the content of many boxes for an application, all boxes are validated
+        before any are set.
+
+        Args:
+            app: The application identifier.
+            boxes: The box contents by key.
+        """
+        app_data = self._get_app_data(app)
+        contents = {
+            _as_box_key(key): bytearray(as_bytes(value, max_size=MAX_BOX_SIZE))
+            for key, value in boxes.items()
+        }
+        app_boxes = app_data.boxes
+        box_index = app_data.box_index
+        for key_bytes in contents:
+            if key_bytes not in app_boxes:
+                box_index.add(key_bytes)
+        app_boxes.update(contents)
+        app_data.shared_boxes.difference_update(contents)
+        version = _next_version()
+        app_data.versions.update((("box", key_bytes), version) for key_bytes in contents)
 
     def delete_box(
         self,
@@ -343,11 +574,15 @@ class LedgerContext:
         Returns:
             bool: True if the box was deleted, False if it didn't exist.
         """
-        boxes = self._get_app_data(app).boxes
+        app_data = self._get_app_data(app)
+        key_bytes = _as_box_key(key)
         try:
-            del boxes[_as_box_key(key)]
+            del app_data.boxes[key_bytes]
         except KeyError:
             return False
+        app_data.box_index.remove(key_bytes)
+        app_data.shared_boxes.discard(key_bytes)
+        app_data.versions["box", key_bytes] = _next_version()
         return True
 
     def box_exists(
@@ -367,6 +602,150 @@ class LedgerContext:
         boxes = self._get_app_data(app).boxes
         return _as_box_key(key) in boxes
 
+    def iter_box_keys(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        *,
+        prefix: algopy.Bytes | bytes = b"",
+        start: algopy.Bytes | bytes | None = None,
+        stop: algopy.Bytes | bytes | None = None,
+    ) -> Iterator[bytes]:
+        """Iterate over the box keys of an application in ascending order.
+
+        Boxes can be created or deleted while iterating, the keys returned are those that
+        existed when iteration started.
+
+        Args:
+            app: The application identifier.
+            prefix: Only include keys starting with this prefix, e.g. the key prefix of a
+                BoxMap.
+            start: Only include keys greater than or equal to this key.
+            stop: Only include keys less than this key.
+
+        Returns:
+            Iterator[bytes]: The box keys.
+        """
+        box_index = self._get_app_data(app).box_index
+        return iter(box_index.keys(**_key_range(prefix, start, stop)))
+
+    def iter_boxes(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        *,
+        prefix: algopy.Bytes | bytes = b"",
+        start: algopy.Bytes | bytes | None = None,
+        stop: algopy.Bytes | bytes | None = None,
+    ) -> Iterator[tuple[bytes, bytes]]:
+        """Iterate over the boxes of an application in ascending key order.
+
+        Args:
+            app: The application identifier.
+            prefix: Only include keys starting with this prefix, e.g. the key prefix of a
+                BoxMap.
+            start: Only include keys greater than or equal to this key.
+            stop: Only include keys less than this key.
+
+        Returns:
+            Iterator[tuple[bytes, bytes]]: The key and content of each box.
+        """
+        app_data = self._get_app_data(app)
+        for key in app_data.box_index.keys(**_key_range(prefix, start, stop)):
+            content = app_data.boxes.get(key)
+            # skip boxes deleted while iterating
+            if content is not None:
+                yield key, bytes(content)
+
+    def count_boxes(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        *,
+        prefix: algopy.Bytes | bytes = b"",
+        start: algopy.Bytes | bytes | None = None,
+        stop: algopy.Bytes | bytes | None = None,
+    ) -> int:
+        """Count the boxes of an application.
+
+        Args:
+            app: The application identifier.
+            prefix: Only include keys starting with this prefix, e.g. the key prefix of a
+                BoxMap.
+            start: Only include keys greater than or equal to this key.
+            stop: Only include keys less than this key.
+
+        Returns:
+            int: The number of boxes.
+        """
+        box_index = self._get_app_data(app).box_index
+        return box_index.count(**_key_range(prefix, start, stop))
+
+    def _get_box_content(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        key: algopy.Bytes | bytes,
+    ) -> bytearray | None:
+        """Get the stored content of a box, which can be modified in place.
+
+        Args:
+            app: The application identifier.
+            key: The box key.
+
+        Returns:
+            bytearray | None: The box content, or None if the box does not exist.
+        """
+        boxes = self._get_app_data(app).boxes
+        return boxes.get(_as_box_key(key))
+
+    def _modify_box_content(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        key: algopy.Bytes | bytes,
+    ) -> bytearray | None:
+        """Get the stored content of a box, in order to modify it in place.
+
+        Args:
+            app: The application identifier.
+            key: The box key.
+
+        Returns:
+            bytearray | None: The box content, or None if the box does not exist.
+        """
+        app_data = self._get_app_data(app)
+        key_bytes = _as_box_key(key)
+        content = app_data.boxes.get(key_bytes)
+        if content is not None:
+            if key_bytes in app_data.shared_boxes:
+                content = app_data.boxes[key_bytes] = bytearray(content)
+                app_data.shared_boxes.discard(key_bytes)
+            app_data.versions["box", key_bytes] = _next_version()
+        return content
+
+    def _get_global_state_version(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        key: algopy.Bytes | bytes,
+    ) -> int | None:
+        """Get the version of the last write to a global state key, used to determine if
+        a previously decoded value is still current."""
+        return self._get_app_data(app).versions.get(("global", as_bytes(key)))
+
+    def _get_local_state_version(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        account: algopy.Account | str,
+        key: algopy.Bytes | bytes,
+    ) -> int | None:
+        """Get the version of the last write to a local state key of an account."""
+        composite_key = (_get_address(account), as_bytes(key))
+        return self._get_app_data(app).versions.get(("local", composite_key))
+
+    def _get_box_version(
+        self,
+        app: algopy.Contract | algopy.Application | algopy.UInt64 | int,
+        key: algopy.Bytes | bytes,
+    ) -> int | None:
+        """Get the version of the last write to a box."""
+        return self._get_app_data(app).versions.get(("box", _as_box_key(key)))
+
     def set_block(  # noqa: PLR0913
         self,
         index: int,
@@ -463,9 +842,88 @@ class LedgerContext:
         """
         app_id = _get_app_id(app)
         try:
-            return self._app_data[app_id]
+            app_data = self._app_data[app_id]
         except KeyError:
             raise ValueError("Unknown app id, is there an active transaction?") from None
+        if app_id in self._shared_apps:
+            app_data = self._app_data[app_id] = app_data.copy()
+            self._shared_apps.discard(app_id)
+        return app_data
+
+    def _get_account_data(self, address: str) -> AccountContextData:
+        """Get the data of an account, which is created if the account is not known."""
+        account_data = self._account_data[address]
+        if address in self._shared_accounts:
+            account_data = self._account_data[address] = account_data.copy()
+            self._shared_accounts.discard(address)
+        return account_data
+
+    def _get_asset_data(self, asset_id: int) -> AssetFields:
+        """Get the fields of an asset, raising KeyError if the asset is not known."""
+        asset_data = self._asset_data[asset_id]
+        if asset_id in self._shared_assets:
+            asset_data = self._asset_data[asset_id] = asset_data.copy()
+            self._shared_assets.discard(asset_id)
+        return asset_data
+
+    def _snapshot(self) -> LedgerSnapshot:
+        """Capture the state of the ledger.
+
+        The data of each account, app and asset is shared with the snapshot and is copied
+        by the ledger when next accessed, so taking a snapshot does not copy any state or
+        box content.
+        """
+        self._check_snapshots_supported()
+        snapshot = LedgerSnapshot(
+            account_data=dict(self._account_data),
+            app_data=self._app_data.copy(),
+            asset_data=self._asset_data.copy(),
+            blocks=self._blocks.copy(),
+            global_fields=self._global_fields.copy(),
+            asset_id=copy.copy(self._asset_id),
+            app_id=copy.copy(self._app_id),
+        )
+        self._share(snapshot)
+        return snapshot
+
+    def _restore(self, snapshot: LedgerSnapshot) -> None:
+        """Return the ledger to the state captured by a snapshot, the snapshot can be
+        restored again afterwards."""
+        from _algopy_testing.models.account import AccountContextData, get_empty_account
+
+        self._check_snapshots_supported()
+        self._account_data = defaultdict[str, AccountContextData](
+            get_empty_account, snapshot.account_data
+        )
+        self._app_data = snapshot.app_data.copy()
+        self._asset_data = snapshot.asset_data.copy()
+        self._blocks = snapshot.blocks.copy()
+        self._global_fields = snapshot.global_fields.copy()
+        self._asset_id = copy.copy(snapshot.asset_id)
+        self._app_id = copy.copy(snapshot.app_id)
+        self._share(snapshot)
+
+    def _share(self, snapshot: LedgerSnapshot) -> None:
+        self._shared_accounts = set(snapshot.account_data)
+        self._shared_apps = set(snapshot.app_data)
+        self._shared_assets = set(snapshot.asset_data)
+
+    def _check_snapshots_supported(self) -> None:
+        if self._box_storage is not None:
+            raise RuntimeError("snapshots are not supported when box_memory_limit is set")
+
+
+@dataclasses.dataclass(frozen=True)
+class LedgerSnapshot:
+    """The state of a LedgerContext, shared with the ledger until it is modified."""
+
+    account_data: dict[str, AccountContextData]
+    app_data: dict[int, ApplicationContextData]
+    asset_data: dict[int, AssetFields]
+    blocks: dict[int, dict[str, int | bytes | str]]
+    global_fields: GlobalFields
+    asset_id: Iterator[int]
+    app_id: Iterator[int]
 
 
 def _as_box_key(key_: algopy.Bytes | bytes) -> bytes:
@@ -486,6 +944,24 @@ def _as_box_key(key_: algopy.Bytes | bytes) -> bytes:
     return key
 
 
+class _KeyRange(typing.TypedDict):
+    prefix: bytes
+    start: bytes | None
+    stop: bytes | None
+
+
+def _key_range(
+    prefix: algopy.Bytes | bytes,
+    start: algopy.Bytes | bytes | None,
+    stop: algopy.Bytes | bytes | None,
+) -> _KeyRange:
+    return {
+        "prefix": as_bytes(prefix),
+        "start": None if start is None else as_bytes(start),
+        "stop": None if stop is None else as_bytes(stop),
+    }
+
+
 def _get_app_id(app: algopy.UInt64 | algopy.Application | algopy.Contract | int) -> int:
     """Get the application ID from various input types.
 
@@ -514,10 +990,41 @@ def _get_app_id(app: algopy.UInt64 | algopy.Application | algopy.Contract | int)
     return app_id
 
 
+def _as_state_values(
+    states: Mapping[bytes | algopy.Bytes, algopy.Bytes | algopy.UInt64 | int | bytes | None],
+) -> dict[bytes, int | bytes | None]:
+    return {
+        as_bytes(key): None if value is None else convert_stack_to_native(value)
+        for key, value in states.items()
+    }
+
+
 def _get_address(account: algopy.Account | str) -> str:
     return account if isinstance(account, str) else account.public_key
 
 
+def _get_valid_address(account: algopy.Account | str) -> str:
+    # the address of an Account is always valid, so only addresses given as str are checked
+    if isinstance(account, str):
+        assert_address_is_valid(account)
+        return account
+    return account.public_key
+
+
+def _get_writable_local_state(
+    app_data: ApplicationContextData, address: str
+) -> dict[bytes, int | bytes]:
+    """Get the local state of an account for modification, which is created if the account
+    has no local state."""
+    account_state = app_data.local_state.get(address)
+    if account_state is None:
+        account_state = app_data.local_state[address] = {}
+    elif address in app_data.shared_local_state:
+        account_state = app_data.local_state[address] = account_state.copy()
+        app_data.shared_local_state.discard(address)
+    return account_state
+
+
 def _get_asset_id(asset: algopy.Asset | algopy.UInt64 | int) -> int:
     from _algopy_testing.models import Asset
 
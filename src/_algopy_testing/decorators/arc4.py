@@ -60,6 +60,28 @@ class MethodMetadata:
         return self.create != "disallow"
 
 
+@dataclasses.dataclass(frozen=True)
+class ABIMethodSignature:
+    signature: str
+    method: Arc56Method
+    selector: algopy.Bytes
+    arg_types: tuple[str, ...]
+
+
+@functools.cache
+def get_abimethod_signature(arc4_signature: str) -> ABIMethodSignature:
+    """Parse an ARC4 method signature, each signature is only parsed once."""
+    from _algopy_testing.arc4 import _method_selector
+
+    method = Arc56Method.from_signature(arc4_signature)
+    return ABIMethodSignature(
+        signature=arc4_signature,
+        method=method,
+        selector=Bytes(_method_selector(arc4_signature)),
+        arg_types=tuple(str(arg.type) for arg in method.args),
+    )
+
+
 def set_arc4_metadata(fn: object, data: MethodMetadata) -> None:
     setattr(fn, ARC4_METADATA_ATTR, data)
 
@@ -217,11 +239,9 @@ def create_abimethod_txns(
     contract_app = lazy_context.ledger.get_app(app_id)
     txn_fields = get_active_txn_fields(contract_app, allow_actions)
 
-    method = Arc56Method.from_signature(arc4_signature)
-    method_selector = Bytes(method.get_selector())
     txn_arrays = _extract_arrays_from_args(
         args,
-        method_selector=method_selector,
+        method_selector=get_abimethod_signature(arc4_signature).selector,
         sender=txn_fields["sender"],
         app=contract_app,
         resource_encoding=resource_encoding,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import typing
 
 from algokit_utils.common import ZERO_ADDRESS, address_from_public_key, public_key_from_address
@@ -36,25 +37,29 @@ class AccountFields(typing.TypedDict, total=False):
 
 
 def get_empty_account() -> AccountContextData:
-    return AccountContextData(
-        fields={
-            "balance": UInt64(),
-            "min_balance": UInt64(DEFAULT_ACCOUNT_MIN_BALANCE),
-            "auth_address": Account(),
-            "total_num_uint": UInt64(),
-            "total_num_byte_slice": UInt64(),
-            "total_extra_app_pages": UInt64(),
-            "total_apps_created": UInt64(),
-            "total_apps_opted_in": UInt64(),
-            "total_assets_created": UInt64(),
-            "total_assets": UInt64(),
-            "total_boxes": UInt64(),
-            "total_box_bytes": UInt64(),
-            "incentive_eligible": False,
-            "last_heartbeat": UInt64(),
-            "last_proposed": UInt64(),
-        },
-    )
+    return AccountContextData(fields=_get_empty_account_fields().copy())
+
+
+@functools.cache
+def _get_empty_account_fields() -> AccountFields:
+    # the field values are immutable, so are shared by all accounts
+    return {
+        "balance": UInt64(),
+        "min_balance": UInt64(DEFAULT_ACCOUNT_MIN_BALANCE),
+        "auth_address": Account(),
+        "total_num_uint": UInt64(),
+        "total_num_byte_slice": UInt64(),
+        "total_extra_app_pages": UInt64(),
+        "total_apps_created": UInt64(),
+        "total_apps_opted_in": UInt64(),
+        "total_assets_created": UInt64(),
+        "total_assets": UInt64(),
+        "total_boxes": UInt64(),
+        "total_box_bytes": UInt64(),
+        "incentive_eligible": False,
+        "last_heartbeat": UInt64(),
+        "last_proposed": UInt64(),
+    }
 
 
 @dataclasses.dataclass
@@ -77,6 +82,17 @@ class AccountContextData:
     opted_apps: dict[int, algopy.Application] = dataclasses.field(default_factory=dict)
     fields: AccountFields = dataclasses.field(default_factory=AccountFields)
 
+    def copy(self) -> AccountContextData:
+        """Returns a copy of the account data."""
+        return AccountContextData(
+            opted_assets={
+                asset_id: dataclasses.replace(holding)
+                for asset_id, holding in self.opted_assets.items()
+            },
+            opted_apps=self.opted_apps.copy(),
+            fields=self.fields.copy(),
+        )
+
 
 class Account(BytesBacked):
     def __init__(self, value: str | Bytes = ZERO_ADDRESS, /):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import typing
 
 from algokit_utils.common import get_application_address
@@ -9,7 +10,7 @@ from _algopy_testing.protocols import UInt64Backed
 from _algopy_testing.utils import as_int64
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import MutableMapping, Sequence
 
     import algopy
 
@@ -39,17 +40,45 @@ class ApplicationContextData:
         app_id: int,
         fields: ApplicationFields,
         logs: bytes | Sequence[bytes] = (),
+        boxes: MutableMapping[bytes, bytearray] | None = None,
     ):
+        from _algopy_testing.context_helpers.key_index import SortedKeyIndex
+
         self.app_id = app_id
         self.fields = fields
         self.global_state = dict[Key, StateValueType]()
-        self.local_state = dict[tuple[AccountKey, Key], StateValueType]()
-        self.boxes = dict[bytes, bytes]()
+        # local state of each account, accounts without local state are not included
+        self.local_state = dict[AccountKey, dict[Key, StateValueType]]()
+        # box contents are mutable so that they can be updated in place
+        self.boxes = dict[bytes, bytearray]() if boxes is None else boxes
+        # sorted box keys, for ordered and prefix queries
+        self.box_index = SortedKeyIndex(self.boxes)
+        # version of the last write to each global state, local state and box slot
+        self.versions = dict[tuple[str, object], int]()
+        # box contents and account local states that are shared with another copy of this
+        # data, and so must be copied before being modified
+        self.shared_boxes = set[bytes]()
+        self.shared_local_state = set[AccountKey]()
         self.is_creating = False
         self.contract: Contract | None = None
         # TODO: add callables support (similar to side effects in pytest)
         self.app_logs: Sequence[bytes] = (logs,) if isinstance(logs, bytes) else logs
 
+    def copy(self) -> ApplicationContextData:
+        """Returns a copy of the application data, where box contents and the local state
+        of each account are shared until modified."""
+        app_data = copy.copy(self)
+        app_data.fields = self.fields.copy()
+        app_data.global_state = self.global_state.copy()
+        app_data.local_state = self.local_state.copy()
+        app_data.boxes = dict(self.boxes)
+        app_data.box_index = self.box_index.copy()
+        app_data.versions = self.versions.copy()
+        app_data.app_logs = list(self.app_logs)
+        app_data.shared_boxes = set(self.boxes)
+        app_data.shared_local_state = set(self.local_state)
+        return app_data
+
 
 class Application(UInt64Backed):
     def __init__(self, application_id: algopy.UInt64 | int = 0, /):
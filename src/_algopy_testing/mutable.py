@@ -26,9 +26,21 @@ class MutableBytes:
     @_value.setter
     def _value(self, value: bytes) -> None:
         self.__value = value
-        if self._on_mutate:
-            self._on_mutate(self)
+        self._notify_mutated()
+
+    def _notify_mutated(self) -> None:
+        # the callback is cleared before it is called, so that it may re-register itself
+        on_mutate = self._on_mutate
         self._on_mutate = None
+        if on_mutate:
+            on_mutate(self)
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # a memoryview of another value's bytes can't be copied or pickled, so copy the bytes
+        return {
+            name: value.tobytes() if isinstance(value, memoryview) else value
+            for name, value in vars(self).items()
+        }
 
     def copy(self) -> typing.Self:
         # when copying a value discard the _on_mutate callback
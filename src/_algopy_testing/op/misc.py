@@ -15,6 +15,7 @@ from _algopy_testing.utils import (
     raise_mocked_function_error,
     resolve_app_index,
     resolve_asset_index,
+    splice_in_place,
 )
 
 if typing.TYPE_CHECKING:
@@ -515,7 +516,7 @@ class Box:
         if not name_bytes or size > MAX_BOX_SIZE:
             raise ValueError("Invalid box name or size")
         app_id = lazy_context.active_app_id
-        if lazy_context.ledger.get_box(app_id, name_bytes):
+        if lazy_context.ledger._get_box_content(app_id, name_bytes):
             return False
         lazy_context.ledger.set_box(app_id, name_bytes, b"\x00" * size)
         return True
@@ -524,7 +525,7 @@ class Box:
     def delete(a: algopy.Bytes | bytes, /) -> bool:
         name_bytes = a.value if isinstance(a, Bytes) else a
         app_id = lazy_context.active_app_id
-        if lazy_context.ledger.get_box(app_id, name_bytes):
+        if lazy_context.ledger._get_box_content(app_id, name_bytes):
             lazy_context.ledger.delete_box(app_id, name_bytes)
             return True
         return False
@@ -536,10 +537,10 @@ class Box:
         start = int(b)
         length = int(c)
         app_id = lazy_context.active_app_id
-        box_content = lazy_context.ledger.get_box(app_id, key)
+        box_content = lazy_context.ledger._get_box_content(app_id, key)
         if not box_content:
             raise RuntimeError("Box does not exist")
-        result = box_content[start : start + length]
+        result = bytes(box_content[start : start + length])
         return Bytes(result)
 
     @staticmethod
@@ -552,14 +553,15 @@ class Box:
     @staticmethod
     def length(key: algopy.Bytes | bytes, /) -> tuple[algopy.UInt64, bool]:
         app_id = lazy_context.active_app_id
-        box_content = lazy_context.ledger.get_box(app_id, key)
-        box_exists = lazy_context.ledger.box_exists(app_id, key)
-        return UInt64(len(box_content)), box_exists
+        box_content = lazy_context.ledger._get_box_content(app_id, key)
+        if box_content is None:
+            return UInt64(0), False
+        return UInt64(len(box_content)), True
 
     @staticmethod
     def put(key: algopy.Bytes | bytes, value: algopy.Bytes | bytes, /) -> None:
         app_id = lazy_context.active_app_id
-        existing_content = lazy_context.ledger.get_box(app_id, key)
+        existing_content = lazy_context.ledger._get_box_content(app_id, key)
         if existing_content and len(existing_content) != len(
             value if isinstance(value, bytes) else value.value
         ):
@@ -573,28 +575,25 @@ class Box:
         start = int(b)
         new_content = c.value if isinstance(c, Bytes) else c
         app_id = lazy_context.active_app_id
-        box_content = lazy_context.ledger.get_box(app_id, key)
+        box_content = lazy_context.ledger._modify_box_content(app_id, key)
         if not box_content:
             raise RuntimeError("Box does not exist")
         if start + len(new_content) > len(box_content):
             raise ValueError("Replacement content exceeds box size")
-        updated_content = (
-            box_content[:start] + new_content + box_content[start + len(new_content) :]
-        )
-        lazy_context.ledger.set_box(app_id, key, updated_content)
+        # the box is updated in place, rather than copying the whole content
+        box_content[start : start + len(new_content)] = new_content
 
     @staticmethod
     def resize(key: algopy.Bytes | bytes, b: algopy.UInt64 | int, /) -> None:
         new_size = int(b)
         app_id = lazy_context.active_app_id
-        box_content = lazy_context.ledger.get_box(app_id, key)
+        box_content = lazy_context.ledger._modify_box_content(app_id, key)
         if not box_content:
             raise RuntimeError("Box does not exist")
         if new_size > len(box_content):
-            updated_content = box_content + b"\x00" * (new_size - len(box_content))
+            box_content.extend(bytes(new_size - len(box_content)))
         else:
-            updated_content = box_content[:new_size]
-        lazy_context.ledger.set_box(app_id, key, updated_content)
+            del box_content[new_size:]
 
     @staticmethod
     def splice(
@@ -608,7 +607,7 @@ class Box:
         delete_count = int(c)
         insert_content = d.value if isinstance(d, Bytes) else d
         app_id = lazy_context.active_app_id
-        box_content = lazy_context.ledger.get_box(app_id, key)
+        box_content = lazy_context.ledger._modify_box_content(app_id, key)
 
         if not box_content:
             raise RuntimeError("Box does not exist")
@@ -616,22 +615,7 @@ class Box:
         if start > len(box_content):
             raise ValueError("Start index exceeds box size")
 
-        # Calculate the end index for deletion
-        end = min(start + delete_count, len(box_content))
-
-        # Construct the new content
-        new_content = box_content[:start] + insert_content + box_content[end:]
-
-        # Adjust the size if necessary
-        if len(new_content) > len(box_content):
-            # Truncate if the new content is too long
-            new_content = new_content[: len(box_content)]
-        elif len(new_content) < len(box_content):
-            # Pad with zeros if the new content is too short
-            new_content += b"\x00" * (len(box_content) - len(new_content))
-
-        # Update the box with the new content
-        lazy_context.ledger.set_box(app_id, key, new_content)
+        splice_in_place(box_content, start, delete_count, insert_content)
 
 
 def online_stake() -> UInt64:
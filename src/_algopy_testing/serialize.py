@@ -9,7 +9,7 @@ from _algopy_testing.primitives.uint64 import UInt64
 from _algopy_testing.utils import get_type_generic_from_int_literal
 
 if typing.TYPE_CHECKING:
-    from _algopy_testing.arc4 import _ABIEncoded
+    from _algopy_testing.arc4 import _ABIEncoded, _ArrayCodec, _TupleCodec
 
 
 _T = typing.TypeVar("_T")
@@ -27,7 +27,84 @@ def identity(i: _T) -> _T:
     return i
 
 
-def get_native_to_arc4_serializer(  # noqa: PLR0911
+@dataclasses.dataclass(frozen=True)
+class _RegisteredCodec(typing.Generic[_T]):
+    encode: Callable[[_T], bytes]
+    decode: Callable[[bytes], _T]
+    size: int | None
+
+
+_registered_codecs: dict[type, _RegisteredCodec[typing.Any]] = {}
+
+
+def register_codec(
+    typ: type[_T],
+    *,
+    encode: Callable[[_T], bytes],
+    decode: Callable[[bytes], _T],
+    size: int | None = None,
+) -> None:
+    """Register a custom encoding for values of `typ`, so they can be stored in state and
+    boxes, and used within native tuples, structs and arrays.
+
+    Registered codecs take priority over the built-in serialization of a type. If `size`
+    is provided the encoding must always be `size` bytes long, so `size_of(typ)` and
+    `Box(typ).create()` can be used. When nested within another type the value is
+    encoded as an ARC4 `byte[size]`, or a `byte[]` if no size is provided.
+    """
+    if not isinstance(typ, type):
+        raise TypeError(f"expected a type, not {typ!r}")
+    if size is not None and size < 0:
+        raise ValueError(f"expected size >= 0, got: {size}")
+    _registered_codecs[typ] = _RegisteredCodec(encode=encode, decode=decode, size=size)
+    _clear_caches()
+
+
+def unregister_codec(typ: type) -> None:
+    """Remove a codec previously registered with `register_codec`."""
+    try:
+        del _registered_codecs[typ]
+    except KeyError:
+        raise KeyError(f"no codec registered for {typ}") from None
+    _clear_caches()
+
+
+def get_registered_codec(typ: object) -> _RegisteredCodec[typing.Any] | None:
+    return _registered_codecs.get(typ) if isinstance(typ, type) else None
+
+
+def encode_registered(codec: _RegisteredCodec[_T], value: _T) -> bytes:
+    encoded = bytes(codec.encode(value))
+    if codec.size is not None and len(encoded) != codec.size:
+        raise ValueError(
+            f"expected {type(value).__name__} to be encoded as {codec.size} bytes, "
+            f"got: {len(encoded)}"
+        )
+    return encoded
+
+
+def _clear_caches() -> None:
+    from _algopy_testing.utils import clear_static_size_cache
+
+    # serializers and codecs of other types may include the registered type
+    _serializers.clear()
+    _codecs.clear()
+    clear_static_size_cache()
+
+
+# serializers are created once per fully parameterized type
+_serializers: dict[type, _Serializer[typing.Any, typing.Any]] = {}
+
+
+def get_native_to_arc4_serializer(typ: type) -> _Serializer[typing.Any, typing.Any]:
+    try:
+        return _serializers[typ]
+    except KeyError:
+        serializer = _serializers[typ] = _create_native_to_arc4_serializer(typ)
+        return serializer
+
+
+def _create_native_to_arc4_serializer(  # noqa: PLR0911, PLR0912
     typ: type,
 ) -> _Serializer[typing.Any, typing.Any]:
     from _algopy_testing import arc4
@@ -40,6 +117,8 @@ def get_native_to_arc4_serializer(  # noqa: PLR0911
     )
     from _algopy_testing.protocols import UInt64Backed
 
+    if registered := get_registered_codec(typ):
+        return _get_registered_serializer(registered)
     origin_type = typing.get_origin(typ)
     if origin_type is tuple:
         return _get_tuple_serializer(typing.get_args(typ))
@@ -68,8 +147,8 @@ def get_native_to_arc4_serializer(  # noqa: PLR0911
             arc4_static_bytes = arc4.StaticArray[arc4.Byte, length_type]  # type: ignore[valid-type]
             return _Serializer(
                 arc4_type=arc4_static_bytes,
-                native_to_arc4=lambda n: arc4_static_bytes(*[arc4.Byte.from_bytes(e) for e in n]),
-                arc4_to_native=lambda a: typ(a.bytes),
+                native_to_arc4=lambda n: arc4_static_bytes.from_bytes(n.value),
+                arc4_to_native=lambda a: typ(bytes(a._value)),
             )
 
         if typing.NamedTuple in getattr(typ, "__orig_bases__", []):
@@ -111,6 +190,30 @@ def get_native_to_arc4_serializer(  # noqa: PLR0911
     raise TypeError(f"unserializable type: {typ}")
 
 
+def _get_registered_serializer(
+    registered: _RegisteredCodec[typing.Any],
+) -> _Serializer[typing.Any, typing.Any]:
+    from _algopy_testing import arc4
+
+    arc4_type: type[arc4._ABIEncoded]
+    if registered.size is None:
+        arc4_type = arc4.DynamicBytes
+    else:
+        length_type = get_type_generic_from_int_literal(registered.size)
+        arc4_type = arc4.StaticArray[arc4.Byte, length_type]  # type: ignore[valid-type]
+    return _Serializer(
+        arc4_type=arc4_type,
+        native_to_arc4=lambda n: (
+            arc4.DynamicBytes(encode_registered(registered, n))
+            if registered.size is None
+            else arc4_type.from_bytes(encode_registered(registered, n))
+        ),
+        arc4_to_native=lambda a: registered.decode(
+            bytes(a._value[arc4._ABI_LENGTH_SIZE :] if registered.size is None else a._value)
+        ),
+    )
+
+
 @functools.cache
 def _simple_native_to_arc4_type_map() -> dict[type, type]:
     from _algopy_testing import arc4
@@ -158,19 +261,18 @@ def _get_struct_serializer(typ: type) -> _Serializer[typing.Any, typing.Any]:
     serializers = {k: get_native_to_arc4_serializer(v) for k, v in struct_fields.items()}
 
     def _items_to_arc4(items: object) -> dict[str, object]:
-        result = {}
-        for key in inspect.get_annotations(type(items)):
-            serializer = serializers[key]
-            result[key] = serializer.native_to_arc4(getattr(items, key))
-        return result
+        return {
+            key: serializer.native_to_arc4(getattr(items, key))
+            for key, serializer in serializers.items()
+        }
 
     def _items_to_native(items: object) -> dict[str, object]:
-        result = {}
-        for key in inspect.get_annotations(type(items)):
-            serializer = serializers[key]
-            result[key] = serializer.arc4_to_native(getattr(items, key))
-        return result
+        return {
+            key: serializer.arc4_to_native(getattr(items, key))
+            for key, serializer in serializers.items()
+        }
 
+    # the ARC4 equivalent of the native struct, only created once per native struct type
     class TempStruct(arc4.Struct):
         __annotations__ = {k: s.arc4_type for k, s in serializers.items()}
 
@@ -181,8 +283,200 @@ def _get_struct_serializer(typ: type) -> _Serializer[typing.Any, typing.Any]:
     )
 
 
-def serialize_to_bytes(value: object) -> bytes:
-    return native_to_arc4(value)._value
+@dataclasses.dataclass(frozen=True)
+class _Codec(typing.Generic[_T]):
+    """Encodes a native value directly to its ARC4 encoding and back, without creating the
+    equivalent ARC4 values."""
+
+    encode: Callable[[_T], bytes | memoryview]
+    decode: Callable[[bytes | memoryview], _T]
+
+
+# codecs are created once per fully parameterized type
+_codecs: dict[type, _Codec[typing.Any]] = {}
+
+
+def get_native_codec(typ: type) -> _Codec[typing.Any]:
+    try:
+        return _codecs[typ]
+    except KeyError:
+        codec = _codecs[typ] = _create_native_codec(typ)
+        return codec
+
+
+def _create_native_codec(typ: type) -> _Codec[typing.Any]:  # noqa: PLR0911
+    from _algopy_testing import arc4
+    from _algopy_testing.primitives import (
+        Array,
+        FixedArray,
+        ImmutableArray,
+        ImmutableFixedArray,
+        Struct,
+    )
+    from _algopy_testing.protocols import UInt64Backed
+
+    # mirrors get_native_to_arc4_serializer, which also provides the ARC4 layout of each type
+    serializer = get_native_to_arc4_serializer(typ)
+    arc4_type_info = serializer.arc4_type._type_info
+    if registered := get_registered_codec(typ):
+        if registered.size is not None:
+            return _Codec(
+                encode=functools.partial(encode_registered, registered),
+                decode=lambda b: registered.decode(bytes(b)),
+            )
+        return _Codec(
+            encode=lambda n: _encode_with_length(encode_registered(registered, n)),
+            decode=lambda b: registered.decode(bytes(_read_with_length(b))),
+        )
+    if typing.get_origin(typ) is tuple:
+        return _get_tuple_codec(typing.get_args(typ), arc4_type_info.codec)
+    assert isinstance(typ, type), "expected type"
+    if issubclass(typ, arc4._ABIEncoded):
+        return _Codec(encode=arc4._encoded, decode=typ.from_bytes)
+    for native_type, codec in _simple_native_codecs().items():
+        if issubclass(typ, native_type):
+            return codec
+    if issubclass(typ, UInt64Backed):
+        return _Codec(
+            encode=lambda n: _encode_uint64(n.int_),
+            decode=lambda b: typ.from_int(int.from_bytes(b)),
+        )
+    if issubclass(typ, FixedBytes):
+        return _Codec(encode=lambda n: n.value, decode=lambda b: typ(bytes(b)))
+    if typing.NamedTuple in getattr(typ, "__orig_bases__", []):
+        tuple_fields = tuple(inspect.get_annotations(typ).values())
+        return _get_tuple_codec(tuple_fields, arc4_type_info.codec)
+    if issubclass(typ, Struct):
+        return _get_struct_codec(typ, arc4_type_info.codec)
+    if issubclass(typ, Array | ImmutableArray):
+        return _get_array_codec(typ, arc4_type_info.codec, length=None)
+    if issubclass(typ, FixedArray | ImmutableFixedArray):
+        return _get_array_codec(typ, arc4_type_info.codec, length=typ._length)
+    # any other serializable type is converted via its ARC4 equivalent
+    return _Codec(
+        encode=lambda n: serializer.native_to_arc4(n)._value,
+        decode=lambda b: serializer.arc4_to_native(serializer.arc4_type.from_bytes(b)),
+    )
+
+
+@functools.cache
+def _simple_native_codecs() -> dict[type, _Codec[typing.Any]]:
+    from _algopy_testing import arc4
+    from _algopy_testing.constants import MAX_UINT512
+    from _algopy_testing.models import Account
+    from _algopy_testing.primitives import BigUInt, Bytes, String
+    from _algopy_testing.utils import as_bytes, as_int
+
+    true, false = arc4.Bool._true_byte_value, arc4.Bool._false_byte_value
+    big_uint_size = arc4.UInt512._type_info.max_bytes_len
+    # the same order as _simple_native_to_arc4_type_map
+    return {
+        bool: _Codec(encode=lambda n: true if n else false, decode=lambda b: b == true),
+        UInt64: _Codec(encode=_encode_uint64, decode=_decode_uint64),
+        BigUInt: _Codec(
+            encode=lambda n: as_int(n, max=MAX_UINT512).to_bytes(big_uint_size),
+            decode=lambda b: BigUInt.from_bytes(bytes(b)),
+        ),
+        Account: _Codec(
+            encode=lambda n: n.bytes.value,
+            decode=lambda b: Account(Bytes(bytes(b))),
+        ),
+        Bytes: _Codec(
+            encode=lambda n: _encode_with_length(as_bytes(n)),
+            decode=lambda b: Bytes(bytes(_read_with_length(b))),
+        ),
+        String: _Codec(
+            encode=lambda n: as_bytes(_encode_with_length(as_bytes(n.bytes))),
+            decode=lambda b: String.from_bytes(bytes(_read_with_length(b))),
+        ),
+    }
+
+
+def _encode_uint64(value: object) -> bytes:
+    from _algopy_testing.constants import MAX_UINT64
+    from _algopy_testing.utils import as_int
+
+    return as_int(value, max=MAX_UINT64).to_bytes(8)
+
+
+def _decode_uint64(value: bytes | memoryview) -> UInt64:
+    return UInt64(int.from_bytes(value))
+
+
+def _encode_with_length(value: bytes) -> bytes:
+    from _algopy_testing.arc4 import _encode_length
+
+    return _encode_length(len(value)) + value
+
+
+def _read_with_length(value: bytes | memoryview) -> memoryview:
+    from _algopy_testing.arc4 import _read_length
+
+    _, data = _read_length(value)
+    return data
+
+
+def _get_tuple_codec(
+    item_types: tuple[type, ...], arc4_codec: "_TupleCodec"
+) -> _Codec[tuple[object, ...]]:
+    codecs = [get_native_codec(i) for i in item_types]
+
+    def _encode(items: Sequence[object]) -> bytes:
+        return arc4_codec.encode_children(
+            [codec.encode(item) for item, codec in zip(items, codecs, strict=True)]
+        )
+
+    def _decode(value: bytes | memoryview) -> tuple[object, ...]:
+        children = arc4_codec.decode_children(value)
+        return tuple(codec.decode(child) for child, codec in zip(children, codecs, strict=True))
+
+    return _Codec(encode=_encode, decode=_decode)
+
+
+def _get_struct_codec(typ: type, arc4_codec: "_TupleCodec") -> _Codec[typing.Any]:
+    struct_fields = inspect.get_annotations(typ)
+    codecs = {k: get_native_codec(v) for k, v in struct_fields.items()}
+
+    def _encode(struct: object) -> bytes:
+        return arc4_codec.encode_children(
+            [codec.encode(getattr(struct, key)) for key, codec in codecs.items()]
+        )
+
+    def _decode(value: bytes | memoryview) -> object:
+        children = arc4_codec.decode_children(value)
+        return typ(
+            **{
+                key: codec.decode(child)
+                for (key, codec), child in zip(codecs.items(), children, strict=True)
+            }
+        )
+
+    return _Codec(encode=_encode, decode=_decode)
+
+
+def _get_array_codec(
+    typ: type, arc4_codec: "_ArrayCodec", *, length: int | None
+) -> _Codec[typing.Any]:
+    from _algopy_testing.arc4 import _encode_length, _read_length
+
+    element_codec = get_native_codec(typ._element_type)  # type: ignore[attr-defined]
+
+    def _encode(arr: Sequence[object]) -> bytes:
+        encoded = [element_codec.encode(e) for e in arr]
+        if length is None:
+            return _encode_length(len(encoded)) + arc4_codec.encode_children(encoded)
+        if len(encoded) != 0 and len(encoded) != length:
+            raise TypeError(f"expected {length} items, not {len(encoded)}")
+        return arc4_codec.encode_children(encoded)
+
+    def _decode(value: bytes | memoryview) -> object:
+        if length is None:
+            size, value = _read_length(value)
+        else:
+            size = length
+        return typ([element_codec.decode(e) for e in arc4_codec.decode_children(value, size)])
+
+    return _Codec(encode=_encode, decode=_decode)
 
 
 def type_of(value: object) -> type:
@@ -206,6 +500,11 @@ def native_to_arc4(value: object) -> "_ABIEncoded":
     return arc4_value
 
 
+def serialize_to_bytes(value: object) -> bytes:
+    codec = get_native_codec(type_of(value))
+    return bytes(codec.encode(value))
+
+
 def compare_type(value_type: type, typ: type) -> bool:
     if typing.NamedTuple in getattr(typ, "__orig_bases__", []):
         tuple_fields: Sequence[type] = list(inspect.get_annotations(typ).values())
@@ -214,8 +513,7 @@ def compare_type(value_type: type, typ: type) -> bool:
 
 
 def deserialize_from_bytes(typ: type[_T], bites: bytes) -> _T:
-    serializer = get_native_to_arc4_serializer(typ)
-    arc4_value = serializer.arc4_type.from_bytes(bites)
-    native_value = serializer.arc4_to_native(arc4_value)
+    codec = get_native_codec(typ)
+    native_value = codec.decode(bites)
     assert compare_type(type_of(native_value), typ) or isinstance(native_value, typ)
     return native_value  # type: ignore[no-any-return]
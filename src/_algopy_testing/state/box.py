@@ -9,8 +9,14 @@ import _algopy_testing
 from _algopy_testing.constants import MAX_BOX_SIZE
 from _algopy_testing.context_helpers import lazy_context
 from _algopy_testing.mutable import set_attr_on_mutate, set_item_on_mutate
-from _algopy_testing.state.utils import cast_from_bytes, cast_to_bytes
-from _algopy_testing.utils import as_bytes, as_int64, as_string, get_static_size_of
+from _algopy_testing.state.utils import cast_from_bytes, cast_to_bytes, is_shareable
+from _algopy_testing.utils import (
+    as_bytes,
+    as_int64,
+    as_string,
+    get_static_size_of,
+    splice_in_place,
+)
 
 _TKey = typing.TypeVar("_TKey")
 _TValue = typing.TypeVar("_TValue")
@@ -30,6 +36,8 @@ class Box(typing.Generic[_TValue]):
         self, type_: type[_TValue], /, *, key: bytes | str | algopy.Bytes | algopy.String = ""
     ) -> None:
         self._type = type_
+        # the last decoded value and the version of the ledger write it was decoded from
+        self._cache: tuple[int, _TValue] | None = None
 
         self._key = (
             _algopy_testing.String(as_string(key)).bytes
@@ -88,15 +96,27 @@ class Box(typing.Generic[_TValue]):
 
     @property
     def value(self) -> _TValue:
-        if not lazy_context.ledger.box_exists(self.app_id, self.key):
-            raise RuntimeError("Box has not been created")
-        value = cast_from_bytes(self._type, lazy_context.ledger.get_box(self.app_id, self.key))
+        version = lazy_context.ledger._get_box_version(self.app_id, self.key)
+        if self._cache is not None and self._cache[0] == version:
+            value = self._cache[1]
+        else:
+            box_content = lazy_context.ledger._get_box_content(self.app_id, self.key)
+            if box_content is None:
+                raise RuntimeError("Box has not been created")
+            value = cast_from_bytes(self._type, bytes(box_content))
+            if version is not None and is_shareable(value):
+                self._cache = (version, value)
         return set_attr_on_mutate(self, "value", value)
 
     @value.setter
     def value(self, value: _TValue) -> None:
         bytes_value = cast_to_bytes(value)
         lazy_context.ledger.set_box(self.app_id, self.key, bytes_value)
+        # values are only cached if they are the same as what reading them would return
+        if type(value) is self._type and not isinstance(value, tuple) and is_shareable(value):
+            version = lazy_context.ledger._get_box_version(self.app_id, self.key)
+            assert version is not None
+            self._cache = (version, value)
 
     @value.deleter
     def value(self) -> None:
@@ -169,9 +189,10 @@ class Box(typing.Generic[_TValue]):
 
     @property
     def length(self) -> algopy.UInt64:
-        if not lazy_context.ledger.box_exists(self.app_id, self.key):
+        box_content = lazy_context.ledger._get_box_content(self.app_id, self.key)
+        if box_content is None:
             raise RuntimeError("Box has not been created")
-        return _algopy_testing.UInt64(len(lazy_context.ledger.get_box(self.app_id, self.key)))
+        return _algopy_testing.UInt64(len(box_content))
 
 
 class _BoxRef:
@@ -218,14 +239,12 @@ class _BoxRef:
     def extract(
         self, start_index: algopy.UInt64 | int, length: algopy.UInt64 | int
     ) -> algopy.Bytes:
-        box_content, box_exists = self._maybe()
+        box_content = self._get_content()
         start_int = int(start_index)
         length_int = int(length)
-        if not box_exists:
-            raise RuntimeError("Box has not been created")
         if (start_int + length_int) > len(box_content):
             raise ValueError("Index out of bounds")
-        result = box_content[start_int : start_int + length_int]
+        result = bytes(box_content[start_int : start_int + length_int])
         return _algopy_testing.Bytes(result)
 
     def resize(self, new_size: algopy.UInt64 | int) -> None:
@@ -233,26 +252,20 @@ class _BoxRef:
 
         if new_size_int > MAX_BOX_SIZE:
             raise ValueError(f"Box size cannot exceed {MAX_BOX_SIZE}")
-        box_content, box_exists = self._maybe()
-        if not box_exists:
-            raise RuntimeError("Box has not been created")
+        box_content = self._modify_content()
         if new_size_int > len(box_content):
-            updated_content = box_content + b"\x00" * (new_size_int - len(box_content))
+            box_content.extend(bytes(new_size_int - len(box_content)))
         else:
-            updated_content = box_content[:new_size_int]
-        lazy_context.ledger.set_box(self.app_id, self.key, updated_content)
+            del box_content[new_size_int:]
 
     def replace(self, start_index: algopy.UInt64 | int, value: algopy.Bytes | bytes) -> None:
         replace_content = value.value if isinstance(value, _algopy_testing.Bytes) else value
-        box_content, box_exists = self._maybe()
-        if not box_exists:
-            raise RuntimeError("Box has not been created")
+        box_content = self._modify_content()
         start = int(start_index)
         length = len(replace_content)
         if (start + length) > len(box_content):
             raise ValueError("Replacement content exceeds box size")
-        updated_content = box_content[:start] + replace_content + box_content[start + length :]
-        lazy_context.ledger.set_box(self.app_id, self.key, updated_content)
+        box_content[start : start + length] = replace_content
 
     def splice(
         self,
@@ -260,27 +273,16 @@ class _BoxRef:
         length: algopy.UInt64 | int,
         value: algopy.Bytes | bytes,
     ) -> None:
-        box_content, box_exists = self._maybe()
+        box_content = self._modify_content()
 
         start = int(start_index)
         delete_count = int(length)
         insert_content = value.value if isinstance(value, _algopy_testing.Bytes) else value
 
-        if not box_exists:
-            raise RuntimeError("Box has not been created")
-
         if start > len(box_content):
             raise ValueError("Start index exceeds box size")
 
-        end = min(start + delete_count, len(box_content))
-        new_content = box_content[:start] + insert_content + box_content[end:]
-
-        if len(new_content) > len(box_content):
-            new_content = new_content[: len(box_content)]
-        elif len(new_content) < len(box_content):
-            new_content += b"\x00" * (len(box_content) - len(new_content))
-
-        lazy_context.ledger.set_box(self.app_id, self.key, new_content)
+        splice_in_place(box_content, start, delete_count, insert_content)
 
     def get(self, *, default: algopy.Bytes | bytes) -> algopy.Bytes:
         box_content, box_exists = self._maybe()
@@ -310,12 +312,23 @@ class _BoxRef:
         box_content = lazy_context.ledger.get_box(self.app_id, self.key)
         return box_content, box_exists
 
+    def _get_content(self) -> bytearray:
+        """Return the stored box content, without copying it."""
+        box_content = lazy_context.ledger._get_box_content(self.app_id, self.key)
+        if box_content is None:
+            raise RuntimeError("Box has not been created")
+        return box_content
+
+    def _modify_content(self) -> bytearray:
+        """Return the stored box content, in order to modify it in place."""
+        box_content = lazy_context.ledger._modify_box_content(self.app_id, self.key)
+        if box_content is None:
+            raise RuntimeError("Box has not been created")
+        return box_content
+
     @property
     def length(self) -> algopy.UInt64:
-        box_content, box_exists = self._maybe()
-        if not box_exists:
-            raise RuntimeError("Box has not been created")
-        return _algopy_testing.UInt64(len(box_content))
+        return _algopy_testing.UInt64(len(self._get_content()))
 
 
 @deprecated("Methods in BoxRef are now directly available on Box")
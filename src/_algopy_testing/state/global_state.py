@@ -7,7 +7,7 @@ from _algopy_testing.context_helpers import lazy_context
 from _algopy_testing.mutable import set_attr_on_mutate
 from _algopy_testing.primitives import Bytes, String
 from _algopy_testing.serialize import type_of
-from _algopy_testing.state.utils import deserialize, serialize
+from _algopy_testing.state.utils import deserialize, is_shareable, serialize
 
 if typing.TYPE_CHECKING:
     import algopy
@@ -49,6 +49,8 @@ class GlobalState(typing.Generic[_T]):
         self.app_id = lazy_context.active_group.active_app_id
         self._key: Bytes | None = None
         self._pending_value: _T | None = None
+        # the last decoded value and the version of the ledger write it was decoded from
+        self._cache: tuple[int, _T] | None = None
 
         if isinstance(type_or_value, type) or isinstance(typing.get_origin(type_or_value), type):
             self.type_: type[_T] = typing.cast(type[_T], type_or_value)
@@ -95,12 +97,7 @@ class GlobalState(typing.Generic[_T]):
             else:
                 raise KeyError("Key is not set")
         else:
-            try:
-                native = lazy_context.ledger.get_global_state(self.app_id, self._key)
-            except KeyError as e:
-                raise ValueError("Value is not set") from e
-            else:
-                value = deserialize(self.type_, native)
+            value = self._get_value(self._key)
         return set_attr_on_mutate(self, "value", value)
 
     @value.setter
@@ -109,6 +106,7 @@ class GlobalState(typing.Generic[_T]):
             self._pending_value = value
         else:
             lazy_context.ledger.set_global_state(self.app_id, self._key, serialize(value))
+            self._update_cache(self._key, value)
 
     @value.deleter
     def value(self) -> None:
@@ -117,6 +115,26 @@ class GlobalState(typing.Generic[_T]):
         else:
             lazy_context.ledger.set_global_state(self.app_id, self._key, None)
 
+    def _get_value(self, key: algopy.Bytes) -> _T:
+        version = lazy_context.ledger._get_global_state_version(self.app_id, key)
+        if self._cache is not None and self._cache[0] == version:
+            return self._cache[1]
+        try:
+            native = lazy_context.ledger.get_global_state(self.app_id, key)
+        except KeyError as e:
+            raise ValueError("Value is not set") from e
+        value = deserialize(self.type_, native)
+        if version is not None and is_shareable(value):
+            self._cache = (version, value)
+        return value
+
+    def _update_cache(self, key: algopy.Bytes, value: _T) -> None:
+        # values are only cached if they are the same as what reading them would return
+        if type(value) is self.type_ and not isinstance(value, tuple) and is_shareable(value):
+            version = lazy_context.ledger._get_global_state_version(self.app_id, key)
+            assert version is not None
+            self._cache = (version, value)
+
     def __bool__(self) -> bool:
         return self._key is not None or self._pending_value is not None
 
@@ -8,6 +8,7 @@ from _algopy_testing.primitives import Bytes, String
 from _algopy_testing.state.utils import (
     deserialize,
     get_account,
+    is_shareable,
     serialize,
 )
 
@@ -44,6 +45,9 @@ class LocalState(typing.Generic[_T]):
                 case _:
                     raise ValueError("Key must be bytes or str")
         self.description = description
+        # the account of the last decoded value, the version of the ledger write it was decoded
+        # from and the value, only one account is cached so the cache stays bounded
+        self._cache: tuple[str, int, _T] | None = None
 
     @property
     def key(self) -> algopy.Bytes:
@@ -53,14 +57,29 @@ class LocalState(typing.Generic[_T]):
     def __setitem__(self, key: algopy.Account | algopy.UInt64 | int, value: _T) -> None:
         account = get_account(key)
         lazy_context.ledger.set_local_state(self.app_id, account, self._key, serialize(value))
+        # values are only cached if they are the same as what reading them would return
+        if type(value) is self.type_ and not isinstance(value, tuple) and is_shareable(value):
+            version = lazy_context.ledger._get_local_state_version(self.app_id, account, self._key)
+            assert version is not None
+            self._cache = (account.public_key, version, value)
 
     def __getitem__(self, key: algopy.Account | algopy.UInt64 | int) -> _T:
         account = get_account(key)
-        native = lazy_context.ledger.get_local_state(self.app_id, account, self._key)
-        value = deserialize(self.type_, native)
+        value = self._get_value(account)
 
         return set_item_on_mutate(self, key, value)
 
+    def _get_value(self, account: algopy.Account) -> _T:
+        version = lazy_context.ledger._get_local_state_version(self.app_id, account, self._key)
+        cached = self._cache
+        if cached is not None and cached[0] == account.public_key and cached[1] == version:
+            return cached[2]
+        native = lazy_context.ledger.get_local_state(self.app_id, account, self._key)
+        value = deserialize(self.type_, native)
+        if version is not None and is_shareable(value):
+            self._cache = (account.public_key, version, value)
+        return value
+
     def __delitem__(self, key: algopy.Account | algopy.UInt64 | int) -> None:
         account = get_account(key)
         lazy_context.ledger.set_local_state(self.app_id, account, self._key, None)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
 import typing
 
 from _algopy_testing.context_helpers import lazy_context
 from _algopy_testing.models import Account
+from _algopy_testing.mutable import MutableBytes
 from _algopy_testing.primitives.bytes import Bytes
 from _algopy_testing.primitives.uint64 import UInt64
 from _algopy_testing.protocols import BytesBacked, Serializable, UInt64Backed
@@ -12,6 +14,8 @@ if typing.TYPE_CHECKING:
     import algopy
 from _algopy_testing.serialize import (
     deserialize_from_bytes,
+    encode_registered,
+    get_registered_codec,
     serialize_to_bytes,
 )
 
@@ -19,8 +23,10 @@ _TValue = typing.TypeVar("_TValue")
 SerializableValue = int | bytes
 
 
-def serialize(value: _TValue) -> SerializableValue:
-    if isinstance(value, bool):
+def serialize(value: _TValue) -> SerializableValue:  # noqa: PLR0911
+    if registered := get_registered_codec(type(value)):
+        return encode_registered(registered, value)
+    elif isinstance(value, bool):
         return int(value)
     elif isinstance(value, Bytes | UInt64):
         return value.value
@@ -37,7 +43,11 @@ def serialize(value: _TValue) -> SerializableValue:
 
 
 def deserialize(typ: type[_TValue], value: SerializableValue) -> _TValue:
-    if (typing.get_origin(typ) is tuple or issubclass(typ, tuple)) and isinstance(value, bytes):
+    if registered := get_registered_codec(typ):
+        if isinstance(value, int):
+            raise TypeError("expected bytes, received int")
+        return registered.decode(value)  # type: ignore[no-any-return]
+    elif (typing.get_origin(typ) is tuple or issubclass(typ, tuple)) and isinstance(value, bytes):
         return () if not value else deserialize_from_bytes(typ, value)  # type: ignore[return-value]
     elif issubclass(typ, bool):
         return value != 0  # type: ignore[return-value]
@@ -55,6 +65,40 @@ def deserialize(typ: type[_TValue], value: SerializableValue) -> _TValue:
         raise TypeError(f"Unsupported type: {typ}")
 
 
+def is_shareable(value: object) -> bool:
+    """Returns True if value can't be modified in place, so the same decoded value can be
+    returned from multiple reads of a state value."""
+    if isinstance(value, tuple):
+        return all(is_shareable(item) for item in value)
+    return isinstance(value, _shareable_types()) and not isinstance(value, MutableBytes)
+
+
+@functools.cache
+def _shareable_types() -> tuple[type, ...]:
+    from _algopy_testing.arc4 import _ABIEncoded
+    from _algopy_testing.primitives import (
+        BigUInt,
+        FixedBytes,
+        ImmutableArray,
+        ImmutableFixedArray,
+        String,
+    )
+
+    return (
+        bool,
+        UInt64,
+        BigUInt,
+        Bytes,
+        String,
+        FixedBytes,
+        Account,
+        UInt64Backed,
+        ImmutableArray,
+        ImmutableFixedArray,
+        _ABIEncoded,
+    )
+
+
 def cast_from_bytes(typ: type[_TValue], value: bytes) -> _TValue:
     """
     assuming _TValue to be one of the followings:
@@ -64,7 +108,11 @@ def cast_from_bytes(typ: type[_TValue], value: bytes) -> _TValue:
     """
     from _algopy_testing.utils import as_int64
 
-    if isinstance(typ, type) and issubclass(typ, bool | UInt64Backed | UInt64):
+    if (
+        isinstance(typ, type)
+        and issubclass(typ, bool | UInt64Backed | UInt64)
+        and not get_registered_codec(typ)
+    ):
         if len(value) > 8:
             raise ValueError("uint64 value too big")
         serialized: SerializableValue = int.from_bytes(value)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import secrets
 import types
 import typing
@@ -215,25 +216,46 @@ def raise_mocked_function_error(func_name: str) -> typing.Never:
     )
 
 
-def get_static_size_of(typ: type | object, /) -> int | None:
-    from _algopy_testing import UInt64
-    from _algopy_testing.arc4 import get_max_bytes_static_len
-    from _algopy_testing.serialize import get_native_to_arc4_serializer
+def splice_in_place(content: bytearray, start: int, delete_count: int, insert: bytes) -> None:
+    """Replace `delete_count` bytes of `content` at `start` with `insert`, keeping the
+    original size by truncating or padding with zero bytes."""
+    size = len(content)
+    end = min(start + delete_count, size)
+    content[start:end] = insert
+    if len(content) > size:
+        del content[size:]
+    elif len(content) < size:
+        content.extend(bytes(size - len(content)))
 
+
+def get_static_size_of(typ: type | object, /) -> int | None:
     if isinstance(typ, types.GenericAlias):
         pass
     elif not isinstance(typ, type):
         typ = type(typ)
 
+    return _get_static_size_of_type(typ)
+
+
+@functools.cache
+def _get_static_size_of_type(typ: type, /) -> int | None:
+    from _algopy_testing import UInt64
+    from _algopy_testing.arc4 import get_max_bytes_static_len
+    from _algopy_testing.serialize import get_native_to_arc4_serializer
+
     if typ is bool:  # treat bool on its own as a uint64
         typ = UInt64
-    serializer = get_native_to_arc4_serializer(typ)  # type: ignore[arg-type]
+    serializer = get_native_to_arc4_serializer(typ)
     type_info = serializer.arc4_type._type_info
     size = get_max_bytes_static_len(type_info)
 
     return size
 
 
+def clear_static_size_cache() -> None:
+    _get_static_size_of_type.cache_clear()
+
+
 def get_int_literal_from_type_generic(literal_type: type) -> int:
     type_args = typing.get_args(literal_type)
     try:
@@ -187,6 +187,7 @@ class AVMValueGenerator:
             fields=app_fields,
             app_id=new_app_id,
             logs=logs or [],
+            boxes=lazy_context.ledger._create_app_boxes(new_app_id),
         )
 
         return new_app
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from _algopy_testing.context import AlgopyTestContext
+from _algopy_testing.arc4 import iter_decode
+from _algopy_testing.context import AlgopyTestContext, ContextSnapshot
 from _algopy_testing.context_helpers.context_storage import algopy_testing_context
 from _algopy_testing.context_helpers.ledger_context import LedgerContext
 from _algopy_testing.context_helpers.txn_context import TransactionContext
 from _algopy_testing.itxn_loader import ITxnGroupLoader, ITxnLoader
+from _algopy_testing.serialize import register_codec, unregister_codec
 from _algopy_testing.utils import arc4_prefix
 from _algopy_testing.value_generators.arc4 import ARC4ValueGenerator
 from _algopy_testing.value_generators.avm import AVMValueGenerator
@@ -13,6 +15,7 @@ from _algopy_testing.value_generators.txn import TxnValueGenerator
 __all__ = [
     "ARC4ValueGenerator",
     "AlgopyTestContext",
+    "ContextSnapshot",
     "ITxnLoader",
     "TxnValueGenerator",
     "ITxnGroupLoader",
@@ -22,4 +25,7 @@ __all__ = [
     "TxnValueGenerator",
     "algopy_testing_context",
     "arc4_prefix",
+    "iter_decode",
+    "register_codec",
+    "unregister_codec",
 ]
@@ -6,6 +6,7 @@ import _algopy_testing
 import algokit_utils
 import algopy
 import pytest
+from _algopy_testing.decorators.arc4 import get_abimethod_signature
 from algokit_utils import AlgoAmount, AlgorandClient, AssetCreateParams, PaymentParams
 from algokit_utils.applications.abi import Arc56Method
 from algopy import arc4
@@ -465,3 +466,13 @@ def test_app_args_is_correct_with_value_resource_encoding(  # noqa: PLR0913
     assert app_args[0] == arc4.arc4_signature(SignaturesContract.echo_resource_by_value)
 
     assert result == (asset.id, app.id, acc)
+
+
+def test_abimethod_signature_is_parsed_once() -> None:
+    signature = "with_txn(string,pay,uint8[])void"
+    parsed = get_abimethod_signature(signature)
+
+    assert parsed is get_abimethod_signature(signature)
+    assert parsed.selector == Arc56Method.from_signature(signature).get_selector()
+    assert parsed.selector == arc4.arc4_signature(SignaturesContract.with_txn)
+    assert parsed.arg_types == ("string", "pay", "uint8[]")
@@ -1,3 +1,4 @@
+import array
 import copy
 import typing
 
@@ -415,6 +416,19 @@ def test_get_item(abi_values: list[typing.Any], arc4_value: arc4.DynamicArray) -
     assert len(abi_values) == arc4_value.length
 
 
+def test_get_item_with_negative_index() -> None:
+    arr = arc4.DynamicArray[arc4.String](arc4.String("a"), arc4.String("bc"), arc4.String("def"))
+    assert arr[-1] == "def"
+    assert arr[-3] == "a"
+
+
+@pytest.mark.parametrize("index", [3, -4])
+def test_get_item_out_of_range(index: int) -> None:
+    arr = arc4.DynamicArray[arc4.UInt64](arc4.UInt64(1), arc4.UInt64(2), arc4.UInt64(3))
+    with pytest.raises(IndexError):
+        arr[index]
+
+
 @pytest.mark.parametrize(
     ("abi_type", "abi_values", "arc4_empty_array", "arc4_values"),
     [
@@ -805,6 +819,21 @@ def test_from_bytes(
     assert len(abi_values) == arc4_value.length
 
 
+def test_from_bytes_memoryview() -> None:
+    encoded = _abi_string_array_of_array_type.encode(_abi_string_array_of_array_values)
+    arc4_type = arc4.DynamicArray[arc4.DynamicArray[arc4.String]]
+
+    arc4_value = arc4_type.from_bytes(memoryview(encoded))
+    nested = arc4_value[1]
+    copied = copy.deepcopy(nested)
+    nested[0] = arc4.String("updated")
+
+    assert arc4_value.bytes != encoded
+    assert arc4_value[1][0] == "updated"
+    assert copied.bytes == arc4_type.from_bytes(encoded)[1].bytes
+    assert arc4.String.from_bytes(bytearray(nested[0].bytes.value)) == "updated"
+
+
 @pytest.mark.parametrize(
     ("abi_type", "abi_values", "arc4_value"),
     [
@@ -955,6 +984,35 @@ def test_pop(
     assert abi_result == arc4_result
 
 
+@pytest.mark.parametrize(
+    ("arc4_type", "arc4_values"),
+    [
+        (arc4.DynamicArray[arc4.Bool], _arc4_bool_array_values),
+        (arc4.DynamicArray[arc4.UInt256], _arc4_uint256_array_values),
+        (arc4.DynamicArray[arc4.String], _arc4_string_array_values),
+        (arc4.DynamicArray[arc4.DynamicArray[arc4.Bool]], _arc4_bool_array_of_array_values),
+    ],
+)
+def test_append_and_pop_in_place(
+    arc4_type: type[arc4.DynamicArray],  # type: ignore[type-arg]
+    arc4_values: list[typing.Any],
+) -> None:
+    arr = arc4_type()
+    for i, item in enumerate(arc4_values, start=1):
+        arr.append(item)
+        assert arr.bytes == arc4_type(*arc4_values[:i]).bytes
+        assert arr[-1].bytes == item.bytes
+
+    arr[0] = arc4_values[-1]
+    expected = [arc4_values[-1], *arc4_values[1:]]
+    assert arr.bytes == arc4_type(*expected).bytes
+
+    while expected:
+        assert arr.pop().bytes == expected.pop().bytes
+        assert arr.length == len(expected)
+        assert arr.bytes == arc4_type(*expected).bytes
+
+
 @pytest.mark.parametrize(
     ("abi_type", "abi_values", "arc4_value"),
     [
@@ -1081,6 +1139,81 @@ def test_to_native() -> None:
     assert list(imm_native_arr5[1]) == [21, 22, 23, 24, 25, 26, 27, 28, 29, 30]
 
 
+@pytest.mark.parametrize(
+    ("abi_type", "abi_values", "arc4_type"),
+    [
+        (abi.ABIType.from_string("uint8[]"), [0, 1, 2**8 - 1], arc4.DynamicArray[arc4.UInt8]),
+        (
+            abi.ABIType.from_string("uint64[]"),
+            [0, 1, 2**32, 2**64 - 1],
+            arc4.DynamicArray[arc4.UInt64],
+        ),
+        (_abi_uint256_array_type, _abi_uint256_array_values, arc4.DynamicArray[arc4.UInt256]),
+        (abi.ABIType.from_string("uint64[]"), [], arc4.DynamicArray[arc4.UInt64]),
+    ],
+)
+def test_from_ints(
+    abi_type: abi.ABIType,
+    abi_values: list[int],
+    arc4_type: type[arc4.DynamicArray],  # type: ignore[type-arg]
+) -> None:
+    arc4_value = arc4_type.from_ints(abi_values)
+
+    assert arc4_value.bytes == abi_type.encode(abi_values)
+    assert arc4_value.to_ints() == abi_values
+    assert arc4_type.from_bytes(abi_type.encode(abi_values)).to_ints() == abi_values
+
+
+def test_from_ints_buffer() -> None:
+    values = array.array("H", [1, 2, 2**16 - 1])
+
+    arc4_value = arc4.DynamicArray[arc4.UInt64].from_ints(values)
+
+    assert arc4_value.to_ints() == [1, 2, 2**16 - 1]
+    assert arc4_value.bytes == arc4.DynamicArray[arc4.UInt64].from_ints(list(values)).bytes
+
+
+def test_from_ints_invalid() -> None:
+    with pytest.raises(ValueError, match="expected value <= 255, got: 256"):
+        arc4.DynamicArray[arc4.UInt8].from_ints([1, 256])
+    with pytest.raises(ValueError, match="expected positive value, got -1"):
+        arc4.DynamicArray[arc4.UInt8].from_ints([-1])
+    with pytest.raises(TypeError, match="expected an array of ARC4 integers"):
+        arc4.DynamicArray[arc4.String].from_ints([1])
+
+
+@pytest.mark.parametrize("length", [0, 1, 8, 10, 4096])
+def test_from_bits(length: int) -> None:
+    bools = [i % 3 == 0 for i in range(length)]
+    bits = sum(1 << i for i, bit in enumerate(bools) if bit)
+    expected = _abi_bool_array_type.encode(bools)
+
+    assert arc4.DynamicArray[arc4.Bool].from_bits(bools)._value == expected
+    assert arc4.DynamicArray[arc4.Bool].from_bits(bits, length=length)._value == expected
+    assert arc4.DynamicArray[arc4.Bool].from_bits(expected[2:], length=length)._value == expected
+    assert arc4.DynamicArray[arc4.Bool].from_bytes(expected).to_bits() == bits
+
+
+def test_from_bits_invalid() -> None:
+    with pytest.raises(ValueError, match="expected at most 2 bits, got: 3"):
+        arc4.DynamicArray[arc4.Bool].from_bits(0b100, length=2)
+    with pytest.raises(ValueError, match="expected at most 2 bits"):
+        arc4.DynamicArray[arc4.Bool].from_bits(b"\xe0", length=2)
+    with pytest.raises(TypeError, match="expected an array of ARC4 Bools"):
+        arc4.DynamicArray[arc4.UInt8].from_bits([True])
+
+
+def test_decoded_scalars_are_shared() -> None:
+    ints = arc4.DynamicArray[arc4.UInt64].from_ints([1, 1, 1000, 1000])
+    assert ints[0] is ints[1]
+    assert ints[2] is not ints[3]
+    assert ints[3] == 1000
+
+    bools = arc4.DynamicArray[arc4.Bool].from_bits([True, False, True])
+    assert bools[0] is bools[2]
+    assert bools[1] == arc4.Bool(False)
+
+
 def _compare_abi_and_arc4_values(
     arc4_value: typing.Any,
     abi_value: typing.Any,
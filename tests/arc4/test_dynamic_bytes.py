@@ -384,3 +384,20 @@ def test_add(
     assert arc4_array.length == arc4_value.length * 2
     assert len(abi) == arc4_array.length
     assert abi_result == arc4_result
+
+
+def test_native_max_size() -> None:
+    value = bytes(range(256)) * 16
+    arc4_value = arc4.DynamicBytes(value)
+
+    assert arc4_value._value == _abi_dynamic_bytes_type.encode(value)
+    assert arc4.DynamicBytes.from_bytes(arc4_value._value).native == value
+
+
+def test_init_invalid() -> None:
+    with pytest.raises(ValueError, match="expected value <= 255, got: 256"):
+        arc4.DynamicBytes(1, 256)
+    with pytest.raises(ValueError, match="expected single Bytes value"):
+        arc4.DynamicBytes(b"a", b"b")  # type: ignore[call-overload]
+    with pytest.raises(TypeError, match="expected algopy.Bytes | bytes | Byte | UInt8 | int"):
+        arc4.DynamicBytes(arc4.UInt16(1))  # type: ignore[arg-type]
@@ -295,6 +295,50 @@ def test_decode_accepts_raw_bytes_and_algopy_bytes() -> None:
     assert from_algopy_bytes == from_raw_bytes == UInt64(123)
 
 
+@pytest.mark.parametrize(
+    "values",
+    [
+        pytest.param([arc4.UInt64(1), arc4.UInt64(2)], id="static"),
+        pytest.param([arc4.String(""), arc4.String("hello")], id="string"),
+        pytest.param(
+            [arc4.DynamicArray(arc4.String("a")), arc4.DynamicArray(arc4.String("bc"))],
+            id="dynamic array",
+        ),
+        pytest.param(
+            [
+                Arc4Struct(x=arc4.UInt64(1), y=arc4.String("one")),
+                Arc4Struct(x=arc4.UInt64(2), y=arc4.String("two")),
+            ],
+            id="struct",
+        ),
+    ],
+)
+def test_iter_decode(values: list[arc4._ABIEncoded]) -> None:
+    encoded = b"".join(value.bytes.value for value in values)
+    decoded = list(arc4.iter_decode(type(values[0]), encoded))
+    assert [value.bytes for value in decoded] == [value.bytes for value in values]
+
+    prefix = arc4.arc4_signature("event(uint64)")
+    with_prefix = b"".join(prefix.value + value.bytes.value for value in values)
+    decoded = list(arc4.iter_decode(type(values[0]), with_prefix, prefix=prefix))
+    assert [value.bytes for value in decoded] == [value.bytes for value in values]
+
+
+def test_iter_decode_native() -> None:
+    encoded = arc4.encode(MyNamedTuple(UInt64(1), String("a"))) + arc4.encode(
+        MyNamedTuple(UInt64(2), String("b"))
+    )
+    decoded = list(arc4.iter_decode(MyNamedTuple, encoded))
+    assert decoded == [MyNamedTuple(UInt64(1), String("a")), MyNamedTuple(UInt64(2), String("b"))]
+
+
+def test_iter_decode_rejects_incomplete_values() -> None:
+    with pytest.raises(ValueError, match="not long enough to be decoded"):
+        list(arc4.iter_decode(arc4.UInt64, b"\x00" * 12))
+    with pytest.raises(ValueError, match="expected prefix"):
+        list(arc4.iter_decode(arc4.UInt64, b"\x00" * 12, prefix=b"\x01"))
+
+
 def test_encode_rejects_unsupported_type() -> None:
     with pytest.raises(TypeError, match="unserializable type"):
         arc4.encode(object())
@@ -396,6 +396,23 @@ def test_get_item(abi_values: list[typing.Any], arc4_value: arc4.StaticArray) ->
     assert len(abi_values) == arc4_value.length
 
 
+def test_get_item_with_negative_index() -> None:
+    arr = arc4.StaticArray[arc4.String, typing.Literal[3]](
+        arc4.String("a"), arc4.String("bc"), arc4.String("def")
+    )
+    assert arr[-1] == "def"
+    assert arr[-3] == "a"
+
+
+@pytest.mark.parametrize("index", [3, -4])
+def test_get_item_out_of_range(index: int) -> None:
+    arr = arc4.StaticArray[arc4.UInt64, typing.Literal[3]](
+        arc4.UInt64(1), arc4.UInt64(2), arc4.UInt64(3)
+    )
+    with pytest.raises(IndexError):
+        arr[index]
+
+
 @pytest.mark.parametrize(
     ("abi_type", "abi_values", "arc4_type"),
     [
@@ -626,3 +643,31 @@ def test_to_native() -> None:
     assert imm_native_arr5[1].length == 10
     assert list(imm_native_arr5[0]) == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     assert list(imm_native_arr5[1]) == [21, 22, 23, 24, 25, 26, 27, 28, 29, 30]
+
+
+def test_from_ints() -> None:
+    abi_type = abi.ABIType.from_string("uint256[10]")
+    abi_values = [0, 1, 2, 3, 2**8, 2**16, 2**32, 2**64, 2**128, 2**256 - 1]
+
+    arc4_value = arc4.StaticArray[arc4.UInt256, typing.Literal[10]].from_ints(abi_values)
+
+    assert arc4_value.bytes == abi_type.encode(abi_values)
+    assert arc4_value.to_ints() == abi_values
+    assert arc4.Address.from_ints(range(32)).bytes == bytes(range(32))
+
+    with pytest.raises(TypeError, match="expected 10 items, not 2"):
+        arc4.StaticArray[arc4.UInt256, typing.Literal[10]].from_ints([1, 2])
+
+
+def test_from_bits() -> None:
+    bits = sum(1 << i for i, bit in enumerate(_abi_bool_static_array_values) if bit)
+    expected = _abi_bool_static_array_type.encode(_abi_bool_static_array_values)
+    arc4_type = arc4.StaticArray[arc4.Bool, typing.Literal[10]]
+
+    assert arc4_type.from_bits(_abi_bool_static_array_values).bytes == expected
+    assert arc4_type.from_bits(bits).bytes == expected
+    assert arc4_type.from_bits(expected).bytes == expected
+    assert arc4_type.from_bytes(expected).to_bits() == bits
+
+    with pytest.raises(ValueError, match="expected at most 10 bits, got: 11"):
+        arc4_type.from_bits(1 << 10)
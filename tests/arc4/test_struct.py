@@ -73,6 +73,16 @@ class Swapped6(Swapped):
     ]
 
 
+class StructWithArray(arc4.Struct):
+    a: arc4.DynamicArray[arc4.String]
+    b: arc4.UInt64
+
+
+class StructWithStruct(arc4.Struct):
+    a: StructWithArray
+    b: arc4.Bool
+
+
 _test_data = [
     (
         abi.ABIType.from_string("(uint64,bool,string,(uint64,bool,bool))"),
@@ -359,6 +369,54 @@ def test_replace() -> None:
     assert x != y
 
 
+def test_set_field() -> None:
+    abi_type = abi.ABIType.from_string("(uint64,bool,string,(uint64,bool,bool))")
+    abi_value = [_abi_uint64, _abi_bool, _abi_string, [_abi_uint64, _abi_bool, _abi_bool]]
+    struct = Swapped1.from_bytes(abi_type.encode(abi_value))
+
+    struct.b = arc4.UInt64(1)
+    struct.c = arc4.Bool(False)
+    struct.d = arc4.String("a longer string")
+    struct.a = arc4.Tuple((arc4.UInt64(2), arc4.Bool(False), arc4.Bool(True)))
+    abi_value = [1, False, "a longer string", [2, False, True]]
+    assert struct.bytes == abi_type.encode(abi_value)
+
+    with pytest.raises(TypeError, match="item must be of type uint64, not uint8"):
+        struct.b = arc4.UInt8(1)  # type: ignore[assignment]
+
+    # a failed assignment leaves the struct unchanged
+    assert struct.b == 1
+    assert struct.bytes == abi_type.encode(abi_value)
+    with pytest.raises(TypeError, match="item must be of type string"):
+        struct.d = arc4.UInt64(1)  # type: ignore[assignment]
+    assert struct.d == "a longer string"
+    assert struct.bytes == abi_type.encode(abi_value)
+
+
+def test_mutate_held_field() -> None:
+    abi_type = abi.ABIType.from_string("((string[],uint64),bool)")
+    child_abi_type = abi.ABIType.from_string("(string[],uint64)")
+    parent = StructWithStruct(
+        StructWithArray(arc4.DynamicArray[arc4.String](), arc4.UInt64(1)), arc4.Bool(True)
+    )
+    struct = parent.a
+    array = struct.a
+
+    array.append(arc4.String("hello"))
+    array.append(arc4.String("world"))
+    struct.b = arc4.UInt64(2)
+    array.append(arc4.String("!"))
+
+    assert struct.bytes == child_abi_type.encode([["hello", "world", "!"], 2])
+    assert parent.bytes == abi_type.encode([[["hello", "world", "!"], 2], True])
+    assert struct == StructWithArray.from_bytes(struct.bytes)
+
+    # a replaced field no longer updates the struct
+    struct.a = arc4.DynamicArray(arc4.String("replaced"))
+    array.append(arc4.String("ignored"))
+    assert parent.bytes == abi_type.encode([[["replaced"], 2], True])
+
+
 def _compare_abi_and_arc4_values(
     arc4_value: typing.Any,
     abi_value: typing.Any,
@@ -275,6 +275,59 @@ def test_from_bytes(abi_type: abi.ABIType, abi_value: tuple, arc4_type: type[arc
     assert len(abi_value) == len(arc4_result)
 
 
+@pytest.mark.parametrize(
+    ("abi_type", "abi_value", "arc4_type"),
+    [(d[0], d[1], d[3]) for d in _test_data],
+)
+def test_get_item(abi_type: abi.ABIType, abi_value: tuple, arc4_type: type[arc4.Tuple]) -> None:  # type: ignore[type-arg]
+    arc4_value = arc4_type.from_bytes(abi_type.encode(abi_value))
+
+    assert len(arc4_value) == len(abi_value)
+    for i in range(len(abi_value)):
+        _compare_abi_and_arc4_values(arc4_value[i], abi_value[i])
+    _compare_abi_and_arc4_values(arc4_value[-1], abi_value[-1])
+
+    with pytest.raises(IndexError, match="tuple index out of range"):
+        arc4_value[len(abi_value)]
+
+
+def test_mutate_item() -> None:
+    abi_type = abi.ABIType.from_string("(string,uint8[],bool,string)")
+    arc4_value = arc4.Tuple[
+        arc4.String, arc4.DynamicArray[arc4.UInt8], arc4.Bool, arc4.String
+    ].from_bytes(abi_type.encode(["a", [1], True, "b"]))
+
+    arc4_value[1].append(arc4.UInt8(2))
+    arc4_value[1][0] = arc4.UInt8(3)
+
+    assert arc4_value.bytes == abi_type.encode(["a", [3, 2], True, "b"])
+
+
+class StructWithSingleTuple(arc4.Struct):
+    a: arc4.Tuple[arc4.UInt8,]
+    b: arc4.String
+
+
+def test_container_with_single_item_tuple() -> None:
+    single = arc4.Tuple[arc4.UInt8,]((arc4.UInt8(2),))
+    assert single.bytes == abi.ABIType.from_string("(uint8)").encode([2])
+
+    tuple_type = arc4.Tuple[arc4.UInt64, arc4.Tuple[arc4.UInt8,]]
+    tuple_value = tuple_type((arc4.UInt64(1), single))
+    tuple_abi_type = abi.ABIType.from_string("(uint64,(uint8))")
+    assert tuple_value.bytes == tuple_abi_type.encode([1, [2]])
+    assert tuple_type.from_bytes(tuple_value.bytes) == tuple_value
+
+    array_type = arc4.DynamicArray[arc4.Tuple[arc4.UInt8,]]
+    array_value = array_type(single, arc4.Tuple((arc4.UInt8(3),)))
+    assert array_value.bytes == abi.ABIType.from_string("(uint8)[]").encode([[2], [3]])
+    assert array_type.from_bytes(array_value.bytes)[1][0] == 3
+
+    struct_value = StructWithSingleTuple(single, arc4.String("a"))
+    assert struct_value.bytes == abi.ABIType.from_string("((uint8),string)").encode([[2], "a"])
+    assert StructWithSingleTuple.from_bytes(struct_value.bytes) == struct_value
+
+
 def _compare_abi_and_arc4_values(
     arc4_value: typing.Any,
     abi_value: typing.Any,
@@ -23,6 +23,7 @@ from _algopy_testing.primitives.bytes import Bytes
 from _algopy_testing.primitives.fixed_bytes import FixedBytes
 from _algopy_testing.primitives.string import String
 from _algopy_testing.primitives.uint64 import UInt64
+from _algopy_testing.serialize import register_codec, unregister_codec
 from _algopy_testing.state.box import Box
 from _algopy_testing.state.utils import cast_to_bytes
 from _algopy_testing.utils import as_bytes, as_string
@@ -568,6 +569,71 @@ def test_nested_struct_box() -> None:
             assert large_nested_struct.nested.woah[1].arr_arr[1][1] == 15
 
 
+class Point:
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Point) and (self.x, self.y) == (other.x, other.y)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+@pytest.fixture()
+def _point_codec() -> Generator[None, None, None]:
+    register_codec(
+        Point,
+        encode=lambda p: p.x.to_bytes(4) + p.y.to_bytes(4),
+        decode=lambda b: Point(int.from_bytes(b[:4]), int.from_bytes(b[4:])),
+        size=8,
+    )
+    yield
+    unregister_codec(Point)
+
+
+@pytest.mark.usefixtures("context", "_point_codec")
+def test_registered_codec() -> None:
+    assert algopy.size_of(Point) == 8
+    assert algopy.size_of(tuple[UInt64, Point]) == 16
+
+    box = Box(Point, key="point")
+    assert box.create()
+    assert box.length == 8
+    box.value = Point(1, 2)
+    assert box.value == Point(1, 2)
+    assert op.Box.get(b"point")[0] == b"\x00\x00\x00\x01\x00\x00\x00\x02"
+
+    # nested values are encoded as a byte[8]
+    nested = Box(tuple[UInt64, Point], key="nested")
+    nested.value = (UInt64(3), Point(4, 5))
+    assert nested.value == (UInt64(3), Point(4, 5))
+    assert op.Box.get(b"nested")[0] == itob(3) + b"\x00\x00\x00\x04\x00\x00\x00\x05"
+
+
+def test_box_contents_spilled_to_file(tmp_path: typing.Any) -> None:
+    with algopy_testing_context(box_memory_limit=1024, box_spill_directory=tmp_path) as ctx:
+        app = ctx.any.application()
+        storage = ctx.ledger._box_storage
+        assert storage is not None
+        with ctx.txn.create_group([ctx.any.txn.application_call(app_id=app)]):
+            boxes = [Box(Bytes, key=f"box_{i}") for i in range(20)]
+            for i, box in enumerate(boxes):
+                box.value = Bytes(bytes([i]) * 200)
+            assert storage.spilled_count > 0
+
+            boxes[0].replace(1, b"\xff")
+            boxes[1].resize(300)
+            del boxes[2].value
+            for i, box in enumerate(boxes[3:], start=3):
+                assert box.value == bytes([i]) * 200
+            assert boxes[0].value == b"\x00\xff" + b"\x00" * 198
+            assert boxes[1].value == b"\x01" * 200 + b"\x00" * 100
+            assert not boxes[2]
+            assert ctx.ledger.get_box(app, b"box_19") == b"\x13" * 200
+            assert storage.spilled_count > 0
+
+
 def test_too_many_bools() -> None:
     with algopy_testing_context():
         contract = BoxContract()
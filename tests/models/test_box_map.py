@@ -279,6 +279,58 @@ def test_box_map() -> None:
         assert not contract.box_map_exists(key=key), "Box does not exist after deletion"
 
 
+def test_iter_boxes_by_prefix_and_range(context: AlgopyTestContext) -> None:
+    box_map = BoxMap(UInt64, Bytes, key_prefix=b"m")
+    for i in (3, 1, 2):
+        box_map[UInt64(i)] = Bytes(b"value %d" % i)
+    box = algopy.Box(UInt64, key=b"n")
+    box.value = UInt64(4)
+    app = box.app_id
+    ledger = context.ledger
+    keys = [box_map._full_key(UInt64(i)).value for i in range(4)]
+
+    assert list(ledger.iter_box_keys(app)) == [keys[1], keys[2], keys[3], b"n"]
+    assert list(ledger.iter_boxes(app, prefix=box_map.key_prefix)) == [
+        (keys[i], b"value %d" % i) for i in (1, 2, 3)
+    ]
+    assert ledger.count_boxes(app) == 4
+    assert ledger.count_boxes(app, prefix=box_map.key_prefix) == 3
+    assert ledger.count_boxes(app, prefix=b"x") == 0
+    assert list(ledger.iter_box_keys(app, start=keys[2], stop=keys[3])) == [keys[2]]
+
+    del box_map[UInt64(2)]
+    box_map[UInt64(0)] = Bytes()
+
+    assert list(ledger.iter_box_keys(app, prefix=box_map.key_prefix)) == [
+        keys[0],
+        keys[1],
+        keys[3],
+    ]
+    assert ledger.count_boxes(app, start=b"m\xff") == 1
+
+
+def test_iter_boxes_after_many_changes(context: AlgopyTestContext) -> None:
+    box_map = BoxMap(UInt64, Bytes, key_prefix=b"m")
+    ledger = context.ledger
+    # changes are merged into the sorted keys individually or in a single pass depending
+    # on their number, so add and remove both a few and many keys
+    for count in (2, 100):
+        for i in reversed(range(count)):
+            box_map[UInt64(i)] = Bytes()
+        app = box_map.app_id
+        assert list(ledger.iter_box_keys(app)) == [
+            box_map._full_key(UInt64(i)).value for i in range(count)
+        ]
+        for i in range(0, count, 2):
+            del box_map[UInt64(i)]
+        assert list(ledger.iter_box_keys(app)) == [
+            box_map._full_key(UInt64(i)).value for i in range(1, count, 2)
+        ]
+        for i in range(1, count, 2):
+            del box_map[UInt64(i)]
+        assert ledger.count_boxes(app) == 0
+
+
 def _assert_box_content_equality(
     expected_value: typing.Any, box_content: typing.Any, op_box_content: Bytes
 ) -> None:
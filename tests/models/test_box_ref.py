@@ -188,6 +188,22 @@ def test_replace_extract(
     _assert_box_value(box, box_value)
 
 
+def test_replace_does_not_change_previous_reads(context: AlgopyTestContext) -> None:
+    box = Box(Bytes, key=TEST_BOX_KEY)
+    box.create(size=4)
+    app_id = context.ledger.get_app(box.app_id)
+
+    before = context.ledger.get_box(app_id, TEST_BOX_KEY)
+    box_bytes, _ = box.maybe()
+    box.replace(1, b"\x01\x02")
+    box.splice(0, 1, b"\x03\x04")
+
+    assert before == b"\x00\x00\x00\x00"
+    assert box_bytes == b"\x00\x00\x00\x00"
+    assert context.ledger.get_box(app_id, TEST_BOX_KEY) == b"\x03\x04\x01\x02"
+    assert isinstance(context.ledger.get_box(app_id, TEST_BOX_KEY), bytes)
+
+
 def test_replace_when_box_does_not_exists(
     context: AlgopyTestContext,  # noqa: ARG001
 ) -> None:
@@ -257,6 +257,28 @@ class TestGlobalState:
             assert gs.value == 100
             assert gs._pending_value is None
 
+    def test_decoded_value_is_reused(self, context: AlgopyTestContext) -> None:
+        with context.txn.create_group(gtxns=[context.any.txn.application_call()]):
+            gs = GlobalState(tuple[UInt64, Bytes], key="test_key")
+            gs.value = (UInt64(1), Bytes(b"a"))
+            value = gs.value
+            assert gs.value is value
+
+            # any write to the key is seen by the next read
+            app = context.ledger.get_app(gs.app_id)
+            context.ledger.set_global_state(app, b"test_key", cast_to_bytes(value))
+            assert gs.value is not value
+            assert gs.value == value
+
+            # mutable values are not shared between reads
+            struct_gs = GlobalState(Swapped, key="struct_key")
+            struct_gs.value = Swapped(
+                arc4.UInt64(1), arc4.Bool(True), arc4.Address(Bytes(b"\x00" * 32))
+            )
+            assert struct_gs.value is not struct_gs.value
+            struct_gs.value.b = arc4.UInt64(2)
+            assert struct_gs.value.b == 2
+
     def test_description(self, context: AlgopyTestContext) -> None:
         with context.txn.create_group(gtxns=[context.any.txn.application_call()]):
             gs = GlobalState(arc4.UInt64, key="test_key", description="Test description")
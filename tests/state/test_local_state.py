@@ -136,6 +136,54 @@ class TestLocalState:
             assert maybe_value == value
             assert exists is True
 
+    def test_account_local_state(self, context: AlgopyTestContext) -> None:
+        with context.txn.create_group(gtxns=[context.any.txn.application_call()]):
+            counter = LocalState(UInt64, key="counter")
+            name = LocalState(Bytes, key="name")
+            other = context.any.account()
+            counter[context.default_sender] = UInt64(1)
+            name[context.default_sender] = Bytes(b"name")
+            counter[other] = UInt64(2)
+            app = counter.app_id
+
+            assert context.ledger.count_local_state(app, context.default_sender) == 2
+            assert context.ledger.get_account_local_state(app, context.default_sender) == {
+                b"counter": 1,
+                b"name": b"name",
+            }
+
+            context.ledger.clear_local_state(app, context.default_sender)
+
+            assert context.ledger.count_local_state(app, context.default_sender) == 0
+            assert context.ledger.get_account_local_state(app, context.default_sender) == {}
+            with pytest.raises(KeyError):
+                _ = counter[context.default_sender]
+            assert counter[other] == 2
+            assert context.ledger.count_local_state(app, other) == 1
+
+    def test_decoded_value_is_reused(self, context: AlgopyTestContext) -> None:
+        with context.txn.create_group(gtxns=[context.any.txn.application_call()]):
+            ls = LocalState(tuple[UInt64, Bytes], key="test_key")
+            other = context.any.account()
+            ls[context.default_sender] = (UInt64(1), Bytes(b"a"))
+            ls[other] = (UInt64(2), Bytes(b"b"))
+            value = ls[context.default_sender]
+            assert ls[context.default_sender] is value
+
+            # only the last account read is cached
+            assert ls[other] == (UInt64(2), Bytes(b"b"))
+            assert ls[context.default_sender] is not value
+            assert ls[context.default_sender] == value
+
+            # any write to the key is seen by the next read
+            value = ls[context.default_sender]
+            app = context.ledger.get_app(ls.app_id)
+            context.ledger.set_local_state(
+                app, context.default_sender, b"test_key", cast_to_bytes(value)
+            )
+            assert ls[context.default_sender] is not value
+            assert ls[context.default_sender] == value
+
 
 @pytest.mark.parametrize(
     ("method_name", "expected_type"),
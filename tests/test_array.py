@@ -2,8 +2,16 @@ import typing
 
 import pytest
 from _algopy_testing.constants import MAX_UINT512
+from _algopy_testing.serialize import (
+    deserialize_from_bytes,
+    get_native_codec,
+    get_native_to_arc4_serializer,
+    native_to_arc4,
+    serialize_to_bytes,
+    type_of,
+)
 from algokit_utils.applications import abi
-from algopy import ImmutableArray, String, UInt64, arc4
+from algopy import Account, BigUInt, Bytes, ImmutableArray, String, UInt64, arc4
 from algopy_testing import AlgopyTestContext, algopy_testing_context
 
 from tests.artifacts.Arrays.immutable import (
@@ -12,6 +20,7 @@ from tests.artifacts.Arrays.immutable import (
     MyDynamicSizedTuple,
     MyStruct,
     MyTuple,
+    NativeStruct,
 )
 from tests.artifacts.Arrays.static_size import More, StaticSizeContract
 from tests.artifacts.Arrays.uint64 import Contract as UInt64Contract
@@ -274,5 +283,42 @@ def test_nested_immutable(context: AlgopyTestContext) -> None:  # noqa: ARG001
     )
 
 
+def test_native_struct_serializer_is_reused() -> None:
+    serializer = get_native_to_arc4_serializer(NativeStruct)
+    assert get_native_to_arc4_serializer(NativeStruct) is serializer
+
+    value = NativeStruct(foo=UInt64(1), bar=UInt64(2))
+    encoded = serialize_to_bytes(value)
+    assert encoded == _get_arc4_bytes("(uint64,uint64)", (1, 2))
+    assert type(serializer.native_to_arc4(value)) is serializer.arc4_type
+    assert deserialize_from_bytes(NativeStruct, encoded) == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        (UInt64(1), True, False, String("hello"), BigUInt(MAX_UINT512)),
+        MyTuple(foo=UInt64(1), bar=True, baz=False),
+        ImmutableArray[tuple[UInt64, String]](
+            [(UInt64(1), String("a")), (UInt64(2), String("bc"))]
+        ),
+        ImmutableArray([i % 3 == 0 for i in range(10)]),
+        ImmutableArray([NativeStruct(foo=UInt64(1), bar=UInt64(2))]),
+        (MyStruct(foo=arc4.UInt64(1), bar=arc4.UInt64(2)), Bytes(b"abc"), Account()),
+    ],
+)
+def test_native_codec_matches_arc4_serializer(value: object) -> None:
+    typ = type_of(value)
+    codec = get_native_codec(typ)
+    assert get_native_codec(typ) is codec
+
+    encoded = bytes(codec.encode(value))
+    assert encoded == native_to_arc4(value).bytes.value
+
+    serializer = get_native_to_arc4_serializer(typ)
+    expected = serializer.arc4_to_native(serializer.arc4_type.from_bytes(encoded))
+    assert codec.decode(encoded) == expected
+
+
 def _get_arc4_bytes(arc4_type: str, value: object) -> bytes:
     return abi.ABIType.from_string(arc4_type).encode(value)
@@ -72,6 +72,36 @@ def test_application_management() -> None:
         assert application.clear_state_program == b"TestClear"
 
 
+def test_bulk_ledger_updates() -> None:
+    with algopy_testing_context() as context:
+        app = context.any.application()
+        asset = context.any.asset(default_frozen=True)
+        accounts = [context.any.account() for _ in range(3)]
+
+        context.ledger.update_accounts({account: {"balance": UInt64(5)} for account in accounts})
+        context.ledger.update_asset_balances(asset, {accounts[0]: 10, accounts[1]: None})
+        context.ledger.set_global_states(app, {b"a": 1, b"b": Bytes(b"b")})
+        context.ledger.set_local_states(app, {accounts[0]: {b"c": 2}, accounts[1]: {}})
+        context.ledger.set_boxes(app, {b"box_b": b"b", b"box_a": Bytes(b"a")})
+
+        assert [account.balance for account in accounts] == [5, 5, 5]
+        assert accounts[0].is_opted_in(asset)
+        assert accounts[1].is_opted_in(asset)
+        assert not accounts[2].is_opted_in(asset)
+        assert context.ledger.get_account(accounts[0].public_key).data.opted_assets[
+            int(asset.id)
+        ].balance == UInt64(10)
+        assert context.ledger.get_global_state(app, b"b") == b"b"
+        assert context.ledger.get_account_local_state(app, accounts[0]) == {b"c": 2}
+        assert list(context.ledger.iter_boxes(app)) == [(b"box_a", b"a"), (b"box_b", b"b")]
+
+        with pytest.raises(AssertionError, match="Invalid Algorand address"):
+            context.ledger.update_accounts({"invalid_address": {"balance": UInt64(1)}})
+        with pytest.raises(ValueError, match="invalid box key"):
+            context.ledger.set_boxes(app, {b"box_c": b"c", b"": b""})
+        assert not context.ledger.box_exists(app, b"box_c")
+
+
 def test_transaction_group_management() -> None:
     with algopy_testing_context() as context:
         txn1 = context.any.txn.payment(
@@ -131,6 +161,103 @@ def test_context_reset() -> None:
         assert context.ledger._get_next_app_id() == 1001
 
 
+def test_context_snapshot_and_restore(context: AlgopyTestContext) -> None:
+    asset = context.any.asset()
+    account = context.any.account(balance=UInt64(1000))
+    app_call = context.any.txn.application_call()
+    app = app_call.app_id
+    with context.txn.create_group([app_call]):
+        global_state = algopy.GlobalState(UInt64, key="global")
+        local_state = algopy.LocalState(UInt64, key="local")
+        box = algopy.Box(Bytes, key=b"box")
+        global_state.value = UInt64(1)
+        local_state[account] = UInt64(2)
+        box.create(size=2)
+    context.ledger.update_asset_holdings(asset, account, balance=3)
+    context.set_template_var("VAR", 4)
+
+    snapshot = context.snapshot()
+
+    new_app_ids = []
+    for _ in range(2):
+        new_app_ids.append(context.any.application().id)
+        with context.txn.create_group([context.any.txn.application_call(app_id=app)]):
+            global_state.value = UInt64(10)
+            local_state[account] = UInt64(20)
+            box.replace(0, b"\x01")
+            algopy.Box(Bytes, key=b"other").value = Bytes(b"other")
+        context.ledger.update_account(account, balance=UInt64(2000))
+        context.ledger.update_asset_holdings(asset, account, balance=30)
+        context.set_template_var("VAR", 40)
+        assert context.ledger.get_box(app, b"box") == b"\x01\x00"
+
+        context.restore(snapshot)
+
+        assert context.ledger.get_global_state(app, b"global") == 1
+        assert context.ledger.get_local_state(app, account, b"local") == 2
+        assert context.ledger.get_box(app, b"box") == b"\x00\x00"
+        assert not context.ledger.box_exists(app, b"other")
+        assert list(context.ledger.iter_box_keys(app)) == [b"box"]
+        assert account.balance == 1000
+        assert asset.balance(account) == 3
+        assert context._template_vars["VAR"] == 4
+        assert len(context.txn._groups) == 1
+        assert not context.ledger.app_exists(new_app_ids[-1])
+
+    assert new_app_ids[0] == new_app_ids[1]
+
+
+def test_context_snapshot_with_active_group(context: AlgopyTestContext) -> None:
+    with (
+        context.txn.create_group([context.any.txn.application_call()]),
+        pytest.raises(RuntimeError, match="transaction group is active"),
+    ):
+        context.snapshot()
+
+
+def test_context_fork(context: AlgopyTestContext) -> None:
+    app_call = context.any.txn.application_call()
+    app = app_call.app_id
+    with context.txn.create_group([app_call]):
+        counter = algopy.GlobalState(UInt64, key="counter")
+        counter.value = UInt64(1)
+
+    forks = [context.fork() for _ in range(2)]
+    for i, fork in enumerate(forks, start=2):
+        with fork.activate():
+            assert lazy_context.value is fork
+            with fork.txn.create_group([fork.any.txn.application_call(app_id=app)]):
+                counter.value = UInt64(i)
+        assert lazy_context.value is context
+
+    with context.txn.create_group([context.any.txn.application_call(app_id=app)]):
+        counter.value = UInt64(10)
+
+    assert [fork.ledger.get_global_state(app, b"counter") for fork in forks] == [2, 3]
+    assert context.ledger.get_global_state(app, b"counter") == 10
+    assert forks[0].default_sender == context.default_sender
+    assert len(forks[0].txn._groups) == 2
+
+
+def test_context_snapshot_asset_fields(context: AlgopyTestContext) -> None:
+    asset = context.any.asset(total=UInt64(100), unit_name=Bytes(b"OLD"))
+
+    snapshot = context.snapshot()
+    fork = context.fork()
+    asset.fields["unit_name"] = Bytes(b"NEW")
+    context.ledger.update_asset(asset, total=UInt64(200))
+    assert asset.total == 200
+    assert asset.unit_name == b"NEW"
+
+    with fork.activate():
+        assert asset.total == 100
+        assert asset.unit_name == b"OLD"
+
+    context.restore(snapshot)
+    assert asset.total == 100
+    assert asset.unit_name == b"OLD"
+
+
 def test_algopy_testing_context() -> None:
     with algopy_testing_context() as context:
         assert isinstance(context, AlgopyTestContext)